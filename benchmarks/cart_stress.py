@@ -0,0 +1,277 @@
+"""장바구니 동시성 스트레스 테스트
+
+재고가 제한된 상품 하나에 여러 사용자가 동시에 담기, 수량 변경, 삭제를 반복한 뒤
+예약 관련 불변식을 검사하고 초당 처리량을 기록합니다.
+
+    python -m benchmarks.cart_stress --users 200 --operations 5000 --stock 50
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List
+
+from benchmarks.harness import BenchmarkEnvironment
+from benchmarks.report import (
+    environment_info,
+    finish_report,
+    parse_report_args,
+    summarize_latencies,
+)
+
+DEFAULT_BASELINE = os.path.join(
+    os.path.dirname(__file__), "baselines", "cart_stress.json"
+)
+PRODUCT_ID = 1
+# 사용자 ID는 판매자 계정(1~5) 다음부터 시작
+FIRST_BUYER_USER_ID = 6
+
+
+def build_cart_service(session):
+    from src.models.repository import CartRepository, StockRepository
+    from src.redis_client import get_redis_client
+    from src.service.cart import CartService
+
+    # 요청 하나와 같은 구성: 사용자마다 새 DB 세션, 공유 Redis 클라이언트
+    return CartService(
+        cart_repo=CartRepository(redis=get_redis_client()),
+        es_repo=None,
+        product_repo=None,
+        stock_repo=StockRepository(session=session, read_session=session),
+    )
+
+
+class StressRecorder:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.outcomes: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.first_error: Dict[str, str] = {}
+
+    def record(self, operation: str, outcome: str, elapsed: float) -> None:
+        self.latencies[operation].append(elapsed)
+        self.outcomes[f"{operation}_{outcome}"] += 1
+
+    def record_error(self, operation: str, error: Exception) -> None:
+        self.errors[operation] += 1
+        self.outcomes[f"{operation}_exception"] += 1
+        self.first_error.setdefault(operation, repr(error))
+
+
+async def run_operation(
+    user_id: int, rng: random.Random, max_quantity: int, recorder: StressRecorder
+) -> None:
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    from src.database import get_engine
+
+    operation = rng.choices(["add", "update", "delete"], weights=[6, 3, 1])[0]
+    quantity = rng.randint(1, max_quantity)
+
+    start = time.perf_counter()
+    try:
+        async with AsyncSession(get_engine()) as session:
+            cart_service = build_cart_service(session)
+            if operation == "add":
+                result = await cart_service.add_to_cart(
+                    user_id=user_id, product_id=PRODUCT_ID, quantity=quantity
+                )
+            elif operation == "update":
+                result = await cart_service.update_cart_quantity(
+                    user_id=user_id,
+                    product_id=PRODUCT_ID,
+                    quantity=rng.randint(0, max_quantity),
+                )
+            else:
+                await cart_service.delete_from_cart(
+                    user_id=user_id, product_id=PRODUCT_ID
+                )
+                result = {"is_success": True}
+    except Exception as e:
+        recorder.record_error(operation, e)
+        return
+
+    if result["is_success"]:
+        outcome = "ok"
+    elif result.get("status_code") == 500:
+        # 서비스 내부에서 예외를 잡아 500 응답으로 변환한 경우
+        outcome = "failed"
+        recorder.first_error.setdefault(operation, result["message"])
+    else:
+        outcome = "rejected"
+    recorder.record(operation, outcome, time.perf_counter() - start)
+
+
+async def check_invariants(product_id: int) -> dict:
+    """동작이 모두 끝난 정지 상태에서 장바구니와 예약 키를 검사합니다."""
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    from src.database import get_engine
+    from src.models.repository import StockRepository
+    from src.redis_client import get_redis_client
+
+    redis = get_redis_client()
+    async with AsyncSession(get_engine()) as session:
+        available = await StockRepository(
+            session=session, read_session=session
+        ).count_stocks_by_product_id(product_id=product_id)
+
+    held_by_user = {}
+    for key in await redis.keys(f"cart:*:{product_id}"):
+        held_by_user[int(key.split(":")[1])] = int(
+            await redis.hget(key, "quantity") or 0
+        )
+
+    reserved_by_user = {}
+    for key in await redis.keys(f"reserve:{product_id}:*"):
+        reserved_by_user[int(key.split(":")[2])] = int(
+            await redis.hget(key, "quantity") or 0
+        )
+
+    held = sum(held_by_user.values())
+    negative_reservations = sorted(
+        user_id for user_id, quantity in reserved_by_user.items() if quantity < 0
+    )
+    # 장바구니에 상품이 없는데 남아 있는 예약 키
+    leaked_reserve_keys = sorted(
+        user_id
+        for user_id, quantity in reserved_by_user.items()
+        if held_by_user.get(user_id, 0) <= 0
+    )
+    over_reserved = sorted(
+        user_id
+        for user_id, quantity in reserved_by_user.items()
+        if 0 < held_by_user.get(user_id, 0) < quantity
+    )
+
+    violations = []
+    if held > available:
+        violations.append(f"held quantity {held} exceeds available stock {available}")
+    if negative_reservations:
+        violations.append(f"{len(negative_reservations)} negative reservations")
+    if leaked_reserve_keys:
+        violations.append(f"{len(leaked_reserve_keys)} leaked reserve keys")
+
+    return {
+        "available": available,
+        "held": held,
+        "holders": len(held_by_user),
+        "reserved": sum(reserved_by_user.values()),
+        "reserve_keys": len(reserved_by_user),
+        "negative_reservations": negative_reservations,
+        "leaked_reserve_keys": leaked_reserve_keys,
+        "over_reserved": over_reserved,
+        "violations": violations,
+    }
+
+
+async def run(options: argparse.Namespace) -> dict:
+    async with BenchmarkEnvironment(
+        products=1,
+        stocks_per_product=options.stock,
+        buyers=options.users,
+        bcrypt_rounds=4,
+        start_app=False,
+    ):
+        recorder = StressRecorder()
+        remaining = options.operations
+
+        async def user_session(index: int) -> None:
+            nonlocal remaining
+            rng = random.Random(options.seed + index)
+            while remaining > 0:
+                remaining -= 1
+                await run_operation(
+                    user_id=FIRST_BUYER_USER_ID + index,
+                    rng=rng,
+                    max_quantity=options.max_quantity,
+                    recorder=recorder,
+                )
+
+        start = time.perf_counter()
+        await asyncio.gather(*(user_session(i) for i in range(options.users)))
+        duration = time.perf_counter() - start
+
+        invariants = await check_invariants(product_id=PRODUCT_ID)
+
+        from src.database import close_db
+        from src.redis_client import close_redis_clients
+
+        await close_redis_clients()
+        await close_db()
+
+    all_latencies = [l for latencies in recorder.latencies.values() for l in latencies]
+    total_errors = sum(recorder.errors.values())
+    results = {
+        "cart_operations": {
+            **summarize_latencies(all_latencies, total_errors, duration),
+            "ops_per_second": round(options.operations / duration, 2),
+        }
+    }
+    for operation, latencies in sorted(recorder.latencies.items()):
+        results[f"cart_{operation}"] = summarize_latencies(
+            latencies, recorder.errors[operation], duration
+        )
+
+    for operation, error in recorder.first_error.items():
+        print(f"{operation}: first error: {error}", file=sys.stderr)
+    if duration > 60:
+        # 장바구니/예약 키 TTL(60초)이 지나면 불변식 위반이 만료로 가려질 수 있음
+        print("Run took longer than the cart TTL (60s)", file=sys.stderr)
+
+    return {
+        "benchmark": "cart_stress",
+        "meta": {
+            **environment_info(),
+            "users": options.users,
+            "operations": options.operations,
+            "stock": options.stock,
+            "max_quantity": options.max_quantity,
+            "seed": options.seed,
+            "duration_seconds": round(duration, 3),
+        },
+        "results": results,
+        "outcomes": dict(sorted(recorder.outcomes.items())),
+        "invariants": invariants,
+    }
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=200, help="concurrent users")
+    parser.add_argument("--operations", type=int, default=5000)
+    parser.add_argument("--stock", type=int, default=50)
+    parser.add_argument("--max-quantity", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--output", help="write JSON report to this path (default: stdout)"
+    )
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--save-baseline", action="store_true")
+    return parse_report_args(parser, argv)
+
+
+def main(argv=None) -> int:
+    options = parse_args(argv)
+    report = asyncio.run(run(options))
+
+    for violation in report["invariants"]["violations"]:
+        print(f"INVARIANT VIOLATED: {violation}", file=sys.stderr)
+
+    exit_code = finish_report(
+        report,
+        output=options.output,
+        baseline_path=options.baseline,
+        tolerance=options.tolerance,
+        save_baseline=options.save_baseline,
+    )
+    return 1 if report["invariants"]["violations"] else exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
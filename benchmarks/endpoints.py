@@ -0,0 +1,330 @@
+"""엔드포인트 벤치마크
+
+SQLite, Redis/Elasticsearch 대체 서버 위에서 애플리케이션을 실행하고 시나리오별로 동시 요청을 보내
+처리량과 지연 시간 백분위수를 JSON으로 기록합니다.
+
+    python -m benchmarks.endpoints --concurrency 16 --requests 400
+    python -m benchmarks.endpoints --save-baseline   # 기준 결과 갱신
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List
+
+import httpx
+
+from benchmarks.harness import (
+    PASSWORD,
+    PRODUCT_WORDS,
+    SELLER_EMAIL,
+    BenchmarkEnvironment,
+    buyer_email,
+)
+from benchmarks.report import (
+    environment_info,
+    finish_report,
+    parse_report_args,
+    summarize_latencies,
+)
+
+DEFAULT_BASELINE = os.path.join(
+    os.path.dirname(__file__), "baselines", "endpoints.json"
+)
+
+
+class Recorder:
+    """요청 이름별 지연 시간과 실패 횟수를 기록합니다."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.first_error: Dict[str, str] = {}
+
+    async def request(
+        self,
+        client: httpx.AsyncClient,
+        name: str,
+        method: str,
+        url: str,
+        expected_status: int = 200,
+        **kwargs,
+    ) -> httpx.Response:
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            self.errors[name] += 1
+            self.first_error.setdefault(name, repr(e))
+            return None
+        elapsed = time.perf_counter() - start
+
+        if response.status_code != expected_status:
+            self.errors[name] += 1
+            self.first_error.setdefault(
+                name, f"{response.status_code} {response.text[:200]}"
+            )
+        else:
+            self.latencies[name].append(elapsed)
+        return response
+
+
+class Worker:
+    """동시 사용자 한 명. 자신의 세션과 난수 생성기를 가집니다."""
+
+    def __init__(self, index: int, base_url: str, products: int, seed: int):
+        self.index = index
+        self.products = products
+        self.random = random.Random(seed + index)
+        self.client = httpx.AsyncClient(base_url=base_url, timeout=30)
+
+    async def login(self, email: str) -> None:
+        response = await self.client.post(
+            "/login", json={"email": email, "password": PASSWORD}
+        )
+        response.raise_for_status()
+        # Secure 쿠키는 http로 전송되지 않으므로 헤더로 직접 설정
+        self.client.headers["Cookie"] = f"session_id={response.cookies['session_id']}"
+
+    def random_product_id(self) -> int:
+        return self.random.randint(1, self.products)
+
+
+async def goods_list(worker: Worker, recorder: Recorder) -> None:
+    await recorder.request(worker.client, "goods_list", "GET", "/goods")
+
+
+async def goods_list_by_category(worker: Worker, recorder: Recorder) -> None:
+    category = f"tertiary{worker.random.randint(1, 27)}"
+    await recorder.request(
+        worker.client,
+        "goods_list_category",
+        "GET",
+        "/goods",
+        params={"category": category},
+    )
+
+
+async def goods_detail(worker: Worker, recorder: Recorder) -> None:
+    await recorder.request(
+        worker.client, "goods_detail", "GET", f"/goods/{worker.random_product_id()}"
+    )
+
+
+async def search(worker: Worker, recorder: Recorder) -> None:
+    keyword = worker.random.choice(PRODUCT_WORDS)
+    await recorder.request(
+        worker.client, "search", "GET", "/search", params={"keyword": keyword}
+    )
+
+
+async def cart(worker: Worker, recorder: Recorder) -> None:
+    product_id = worker.random_product_id()
+    client = worker.client
+    await recorder.request(
+        client,
+        "cart_add",
+        "POST",
+        "/cart",
+        json={"product_id": product_id, "quantity": 1},
+    )
+    await recorder.request(client, "cart_get", "GET", "/cart")
+    await recorder.request(
+        client, "cart_update", "PUT", f"/cart/{product_id}", json={"quantity": 2}
+    )
+    await recorder.request(client, "cart_clear", "DELETE", "/cart", expected_status=204)
+
+
+async def login(worker: Worker, recorder: Recorder) -> None:
+    await recorder.request(
+        worker.client,
+        "login",
+        "POST",
+        "/login",
+        json={"email": buyer_email(worker.index + 1), "password": PASSWORD},
+    )
+
+
+async def products_list(worker: Worker, recorder: Recorder) -> None:
+    await recorder.request(worker.client, "products_list", "GET", "/products")
+
+
+async def products_create(worker: Worker, recorder: Recorder) -> None:
+    await recorder.request(
+        worker.client,
+        "products_create",
+        "POST",
+        "/products",
+        expected_status=201,
+        json={
+            "product_name": f"{worker.random.choice(PRODUCT_WORDS)} new",
+            "category_id": worker.random.randint(1, 27),
+            "price": 20000,
+            "discounted_price": 18000,
+            "inventory_quantity": 5,
+        },
+    )
+
+
+Scenario = Callable[[Worker, Recorder], Awaitable[None]]
+
+# 시나리오 이름 -> (실행 함수, 로그인할 사용자 종류)
+SCENARIOS: Dict[str, tuple] = {
+    "goods_list": (goods_list, None),
+    "goods_list_category": (goods_list_by_category, None),
+    "goods_detail": (goods_detail, None),
+    "search": (search, None),
+    "cart": (cart, "buyer"),
+    "login": (login, None),
+    "products_list": (products_list, "seller"),
+    "products_create": (products_create, "seller"),
+}
+
+
+async def run_scenario(
+    name: str,
+    base_url: str,
+    concurrency: int,
+    iterations: int,
+    warmup: int,
+    products: int,
+    seed: int,
+) -> tuple:
+    scenario, login_as = SCENARIOS[name]
+    workers = [Worker(i, base_url, products, seed) for i in range(concurrency)]
+    try:
+        if login_as:
+            await asyncio.gather(
+                *(
+                    worker.login(
+                        SELLER_EMAIL
+                        if login_as == "seller"
+                        else buyer_email(worker.index + 1)
+                    )
+                    for worker in workers
+                )
+            )
+
+        # 커넥션 수립, 캐시 적재 등 초기 비용은 측정에서 제외
+        warmup_recorder = Recorder()
+        for worker in workers[:warmup]:
+            await scenario(worker, warmup_recorder)
+
+        recorder = Recorder()
+        remaining = iterations
+
+        async def work(worker: Worker) -> None:
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                await scenario(worker, recorder)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(work(worker) for worker in workers))
+        duration = time.perf_counter() - start
+    finally:
+        await asyncio.gather(*(worker.client.aclose() for worker in workers))
+
+    return recorder, duration
+
+
+async def run(options: argparse.Namespace) -> dict:
+    scenarios = options.scenarios.split(",") if options.scenarios else list(SCENARIOS)
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        raise SystemExit(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    results = {}
+    async with BenchmarkEnvironment(
+        products=options.products,
+        stocks_per_product=options.stocks_per_product,
+        buyers=options.concurrency,
+        bcrypt_rounds=options.bcrypt_rounds,
+    ) as environment:
+        for name in scenarios:
+            recorder, duration = await run_scenario(
+                name=name,
+                base_url=environment.app.base_url,
+                concurrency=options.concurrency,
+                iterations=options.requests,
+                warmup=options.warmup,
+                products=options.products,
+                seed=options.seed,
+            )
+            for request_name, latencies in sorted(recorder.latencies.items()):
+                results[request_name] = summarize_latencies(
+                    latencies, recorder.errors[request_name], duration
+                )
+            for request_name, error in recorder.first_error.items():
+                print(
+                    f"{request_name}: {recorder.errors[request_name]} errors "
+                    f"(first: {error})",
+                    file=sys.stderr,
+                )
+            print(f"{name}: done in {duration:.2f}s", file=sys.stderr)
+
+    return {
+        "benchmark": "endpoints",
+        "meta": {
+            **environment_info(),
+            "concurrency": options.concurrency,
+            "requests_per_scenario": options.requests,
+            "products": options.products,
+            "stocks_per_product": options.stocks_per_product,
+            "bcrypt_rounds": options.bcrypt_rounds,
+            "seed": options.seed,
+        },
+        "results": results,
+    }
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument(
+        "--requests", type=int, default=400, help="iterations per scenario"
+    )
+    parser.add_argument("--warmup", type=int, default=4)
+    parser.add_argument(
+        "--scenarios",
+        default="",
+        help=f"comma separated, one of {', '.join(SCENARIOS)}",
+    )
+    parser.add_argument("--products", type=int, default=1000)
+    parser.add_argument("--stocks-per-product", type=int, default=20)
+    parser.add_argument(
+        "--bcrypt-rounds",
+        type=int,
+        default=4,
+        help="login cost is dominated by bcrypt; use 12 to measure production cost",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--output", help="write JSON report to this path (default: stdout)"
+    )
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="allowed relative regression"
+    )
+    parser.add_argument("--save-baseline", action="store_true")
+    return parse_report_args(parser, argv)
+
+
+def main(argv=None) -> int:
+    options = parse_args(argv)
+    report = asyncio.run(run(options))
+    return finish_report(
+        report,
+        output=options.output,
+        baseline_path=options.baseline,
+        tolerance=options.tolerance,
+        save_baseline=options.save_baseline,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
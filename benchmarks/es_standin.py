@@ -0,0 +1,353 @@
+import json
+from typing import Dict, List, Optional
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+PRODUCT_HEADERS = {"X-Elastic-Product": "Elasticsearch"}
+
+
+def tokenize(value) -> List[str]:
+    return str(value).lower().split()
+
+
+def term_matches(document_value, value) -> bool:
+    if isinstance(value, dict):
+        value = value.get("value")
+    if isinstance(document_value, list):
+        return any(term_matches(item, value) for item in document_value)
+    if isinstance(document_value, bool) or isinstance(value, bool):
+        return document_value == value
+    # 숫자 필드에 문자열로 조회해도 일치하도록 ES처럼 값을 맞춰 비교
+    return str(document_value) == str(value)
+
+
+def text_matches(document_value, query: str) -> bool:
+    if document_value is None:
+        return False
+    text = str(document_value).lower()
+    return any(token in text for token in tokenize(query))
+
+
+def range_matches(document_value, bounds: dict) -> bool:
+    if document_value is None:
+        return False
+    checks = {
+        "gt": lambda v: document_value > v,
+        "gte": lambda v: document_value >= v,
+        "lt": lambda v: document_value < v,
+        "lte": lambda v: document_value <= v,
+    }
+    return all(checks[op](v) for op, v in bounds.items() if op in checks)
+
+
+def matches(document: dict, query: Optional[dict]) -> bool:
+    """애플리케이션이 사용하는 쿼리 DSL의 부분 집합을 평가합니다. (점수 계산, fuzziness 없음)"""
+    if not query:
+        return True
+
+    (query_type, clause), *_ = query.items()
+    if query_type == "match_all":
+        return True
+    if query_type == "term":
+        (field, value), *_ = clause.items()
+        return term_matches(document.get(field), value)
+    if query_type == "terms":
+        (field, values), *_ = clause.items()
+        return any(term_matches(document.get(field), value) for value in values)
+    if query_type == "range":
+        (field, bounds), *_ = clause.items()
+        return range_matches(document.get(field), bounds)
+    if query_type in ("match", "match_phrase", "match_phrase_prefix"):
+        (field, value), *_ = clause.items()
+        if isinstance(value, dict):
+            value = value.get("query")
+        if query_type == "match":
+            return text_matches(document.get(field), value)
+        return str(value).lower() in str(document.get(field) or "").lower()
+    if query_type == "multi_match":
+        return any(
+            text_matches(document.get(field.split("^")[0]), clause["query"])
+            for field in clause.get("fields", [])
+        )
+    if query_type == "ids":
+        return str(document.get("_id")) in map(str, clause.get("values", []))
+    if query_type == "bool":
+        as_list = lambda value: value if isinstance(value, list) else [value]
+        must = as_list(clause.get("must", [])) + as_list(clause.get("filter", []))
+        should = as_list(clause.get("should", []))
+        must_not = as_list(clause.get("must_not", []))
+
+        if not all(matches(document, q) for q in must):
+            return False
+        if any(matches(document, q) for q in must_not):
+            return False
+        # must/filter 없이 should만 있으면 하나 이상 일치해야 함
+        minimum_should_match = clause.get("minimum_should_match", 0 if must else 1)
+        return sum(matches(document, q) for q in should) >= min(
+            int(minimum_should_match), len(should)
+        )
+
+    raise ValueError(f"Unsupported query type: {query_type}")
+
+
+def sort_key_factory(sort: List):
+    fields = []
+    for item in sort:
+        if isinstance(item, str):
+            fields.append((item, "asc"))
+        else:
+            (field, order), *_ = item.items()
+            fields.append(
+                (field, order.get("order", "asc") if isinstance(order, dict) else order)
+            )
+    return fields
+
+
+def filter_source(source: dict, includes) -> dict:
+    if includes is None or includes is True:
+        return source
+    if includes is False:
+        return {}
+    if isinstance(includes, dict):
+        includes = includes.get("includes", list(source))
+    if isinstance(includes, str):
+        includes = [includes]
+    return {field: source[field] for field in includes if field in source}
+
+
+class ElasticsearchStandIn:
+    """벤치마크용 Elasticsearch 호환 HTTP 서버
+
+    인덱스별 문서를 메모리에 보관하고 애플리케이션이 호출하는 API(search, get, index, update,
+    delete, bulk, refresh)만 구현합니다. 검색은 전체 문서를 순회하는 단순 필터링입니다.
+    """
+
+    def __init__(self):
+        self.indices: Dict[str, Dict[str, dict]] = {}
+        self.request_count = 0
+        self.app = Starlette(
+            routes=[
+                Route("/", self.info, methods=["GET", "HEAD"]),
+                Route("/_bulk", self.bulk, methods=["POST", "PUT"]),
+                Route("/_cluster/health", self.cluster_health, methods=["GET"]),
+                Route("/{index}", self.index_exists, methods=["HEAD", "PUT"]),
+                Route("/{index}/_bulk", self.bulk, methods=["POST", "PUT"]),
+                Route("/{index}/_search", self.search, methods=["GET", "POST"]),
+                Route("/{index}/_count", self.count, methods=["GET", "POST"]),
+                Route("/{index}/_refresh", self.refresh, methods=["GET", "POST"]),
+                Route(
+                    "/{index}/_doc/{id}",
+                    self.document,
+                    methods=["GET", "HEAD", "PUT", "POST", "DELETE"],
+                ),
+                Route("/{index}/_update/{id}", self.update, methods=["POST"]),
+            ]
+        )
+
+    def respond(self, content, status_code: int = 200) -> JSONResponse:
+        self.request_count += 1
+        return JSONResponse(content, status_code=status_code, headers=PRODUCT_HEADERS)
+
+    def get_index(self, name: str) -> Dict[str, dict]:
+        return self.indices.setdefault(name, {})
+
+    def index_document(self, index: str, document_id, source: dict) -> str:
+        documents = self.get_index(index)
+        result = "updated" if str(document_id) in documents else "created"
+        documents[str(document_id)] = source
+        return result
+
+    def update_document(self, index: str, document_id, body: dict) -> Optional[str]:
+        documents = self.get_index(index)
+        source = documents.get(str(document_id))
+        if source is None:
+            if "upsert" in body or body.get("doc_as_upsert"):
+                documents[str(document_id)] = body.get("upsert") or body["doc"]
+                return "created"
+            return None
+        source.update(body.get("doc", {}))
+        return "updated"
+
+    async def info(self, request: Request) -> Response:
+        if request.method == "HEAD":
+            self.request_count += 1
+            return Response(headers=PRODUCT_HEADERS)
+        return self.respond(
+            {
+                "name": "es-standin",
+                "cluster_name": "benchmark",
+                "version": {"number": "8.11.0"},
+                "tagline": "You Know, for Search",
+            }
+        )
+
+    async def cluster_health(self, request: Request) -> Response:
+        return self.respond({"status": "green", "number_of_nodes": 1})
+
+    async def index_exists(self, request: Request) -> Response:
+        index = request.path_params["index"]
+        if request.method == "PUT":
+            self.get_index(index)
+            return self.respond({"acknowledged": True, "index": index})
+        self.request_count += 1
+        return Response(
+            status_code=200 if index in self.indices else 404, headers=PRODUCT_HEADERS
+        )
+
+    async def refresh(self, request: Request) -> Response:
+        return self.respond({"_shards": {"total": 1, "successful": 1, "failed": 0}})
+
+    def query_documents(self, index: str, body: dict) -> List[tuple]:
+        hits = [
+            (document_id, source)
+            for document_id, source in self.get_index(index).items()
+            if matches({**source, "_id": document_id}, body.get("query"))
+        ]
+
+        for field, order in reversed(sort_key_factory(body.get("sort", []))):
+            hits.sort(
+                key=lambda hit: (hit[1].get(field) is None, hit[1].get(field)),
+                reverse=order == "desc",
+            )
+        return hits
+
+    async def search(self, request: Request) -> Response:
+        index = request.path_params["index"]
+        body = json.loads(await request.body() or b"{}")
+        hits = self.query_documents(index, body)
+        total = len(hits)
+
+        sort_fields = sort_key_factory(body.get("sort", []))
+        if "search_after" in body and sort_fields:
+            field, order = sort_fields[0]
+            after = body["search_after"][0]
+            hits = [
+                hit
+                for hit in hits
+                if (
+                    hit[1].get(field) < after
+                    if order == "desc"
+                    else hit[1].get(field) > after
+                )
+            ]
+
+        start = int(body.get("from", request.query_params.get("from", 0)))
+        size = int(body.get("size", request.query_params.get("size", 10)))
+        hits = hits[start : start + size]
+
+        return self.respond(
+            {
+                "took": 0,
+                "timed_out": False,
+                "hits": {
+                    "total": {"value": total, "relation": "eq"},
+                    "max_score": None,
+                    "hits": [
+                        {
+                            "_index": index,
+                            "_id": document_id,
+                            "_score": None,
+                            "_source": filter_source(source, body.get("_source")),
+                            **(
+                                {"sort": [source.get(f) for f, _ in sort_fields]}
+                                if sort_fields
+                                else {}
+                            ),
+                        }
+                        for document_id, source in hits
+                    ],
+                },
+            }
+        )
+
+    async def count(self, request: Request) -> Response:
+        body = json.loads(await request.body() or b"{}")
+        hits = self.query_documents(request.path_params["index"], body)
+        return self.respond({"count": len(hits)})
+
+    async def document(self, request: Request) -> Response:
+        index, document_id = request.path_params["index"], request.path_params["id"]
+        documents = self.get_index(index)
+
+        if request.method in ("PUT", "POST"):
+            result = self.index_document(index, document_id, await request.json())
+            return self.respond(
+                {"_index": index, "_id": document_id, "result": result},
+                status_code=201 if result == "created" else 200,
+            )
+
+        if request.method == "DELETE":
+            found = documents.pop(document_id, None) is not None
+            return self.respond(
+                {
+                    "_index": index,
+                    "_id": document_id,
+                    "result": "deleted" if found else "not_found",
+                },
+                status_code=200 if found else 404,
+            )
+
+        source = documents.get(document_id)
+        if source is None:
+            return self.respond(
+                {"_index": index, "_id": document_id, "found": False}, status_code=404
+            )
+        return self.respond(
+            {"_index": index, "_id": document_id, "found": True, "_source": source}
+        )
+
+    async def update(self, request: Request) -> Response:
+        index, document_id = request.path_params["index"], request.path_params["id"]
+        result = self.update_document(index, document_id, await request.json())
+        if result is None:
+            return self.respond(
+                {
+                    "error": {
+                        "type": "document_missing_exception",
+                        "reason": f"[{document_id}]: document missing",
+                    },
+                    "status": 404,
+                },
+                status_code=404,
+            )
+        return self.respond({"_index": index, "_id": document_id, "result": result})
+
+    async def bulk(self, request: Request) -> Response:
+        default_index = request.path_params.get("index")
+        lines = [line for line in (await request.body()).splitlines() if line.strip()]
+
+        items, errors, position = [], False, 0
+        while position < len(lines):
+            (action, meta), *_ = json.loads(lines[position]).items()
+            position += 1
+            index = meta.get("_index", default_index)
+            document_id = meta.get("_id")
+
+            if action in ("index", "create"):
+                source = json.loads(lines[position])
+                position += 1
+                result = self.index_document(index, document_id, source)
+                status = 201 if result == "created" else 200
+            elif action == "update":
+                body = json.loads(lines[position])
+                position += 1
+                result = self.update_document(index, document_id, body)
+                status = 200 if result else 404
+            elif action == "delete":
+                found = self.get_index(index).pop(str(document_id), None) is not None
+                result, status = ("deleted", 200) if found else ("not_found", 404)
+            else:
+                raise ValueError(f"Unsupported bulk action: {action}")
+
+            item = {"_index": index, "_id": str(document_id), "status": status}
+            if result is None:
+                errors = True
+                item["error"] = {"type": "document_missing_exception"}
+            else:
+                item["result"] = result
+            items.append({action: item})
+
+        return self.respond({"took": 0, "errors": errors, "items": items})
@@ -0,0 +1,372 @@
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Optional
+
+import httpx
+import uvicorn
+
+from benchmarks.es_standin import ElasticsearchStandIn
+from benchmarks.redis_standin import RedisStandIn
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PASSWORD = "benchmark-password"
+SELLER_EMAIL = "seller@bench.example.com"
+PRODUCT_WORDS = ["cream", "serum", "toner", "lotion", "cleanser", "mask", "essence"]
+
+
+def find_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def buyer_email(index: int) -> str:
+    return f"buyer{index}@bench.example.com"
+
+
+class StandIns:
+    """Redis, Elasticsearch 대체 서버를 별도 스레드의 이벤트 루프에서 실행합니다.
+
+    부하를 만드는 클라이언트와 같은 루프를 쓰면 측정값이 서로의 지연에 섞이므로 분리합니다.
+    """
+
+    def __init__(self):
+        self.redis = RedisStandIn()
+        self.es = ElasticsearchStandIn()
+        self.redis_port = find_free_port()
+        self.es_port = find_free_port()
+        self.loop = asyncio.new_event_loop()
+        self.es_server = uvicorn.Server(
+            uvicorn.Config(
+                self.es.app,
+                host="127.0.0.1",
+                port=self.es_port,
+                log_level="warning",
+                access_log=False,
+                lifespan="off",
+            )
+        )
+        self.thread = threading.Thread(
+            target=self.loop.run_forever, name="bench-standins", daemon=True
+        )
+
+    def start(self) -> None:
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(
+            self.redis.start(port=self.redis_port), self.loop
+        ).result()
+        self.es_task = asyncio.run_coroutine_threadsafe(
+            self.start_es_server(), self.loop
+        ).result()
+        while not self.es_server.started:
+            time.sleep(0.01)
+
+    async def start_es_server(self) -> asyncio.Task:
+        return asyncio.create_task(self.es_server.serve())
+
+    async def stop_es_server(self) -> None:
+        # serve()가 끝나기 전에 루프를 멈추면 대기 중인 태스크가 파괴되었다는 경고가 남음
+        self.es_server.should_exit = True
+        try:
+            await asyncio.wait_for(self.es_task, timeout=5)
+        except asyncio.TimeoutError:
+            # wait_for가 태스크를 취소하고 취소가 끝날 때까지 기다림
+            print("Elasticsearch stand-in did not stop in time", file=sys.stderr)
+
+    def stop(self) -> None:
+        asyncio.run_coroutine_threadsafe(self.stop_es_server(), self.loop).result()
+        asyncio.run_coroutine_threadsafe(self.redis.stop(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=5)
+        if not self.thread.is_alive():
+            self.loop.close()
+
+
+def configure_environment(
+    standins: StandIns, database_path: str, app_port: int, bcrypt_rounds: int
+) -> dict:
+    """애플리케이션 설정을 대체 서버로 향하게 합니다. src 모듈을 import하기 전에 호출해야 합니다."""
+    environment = {
+        "DATABASE_URL": f"sqlite+aiosqlite:///{database_path}",
+        "DATABASE_ECHO": "False",
+        "REDIS_HOST": "127.0.0.1",
+        "REDIS_PORT": str(standins.redis_port),
+        "REDIS_SESSION_DB": "0",
+        "REDIS_TASK_DB": "1",
+        "ELASTICSEARCH_HOST": f"http://127.0.0.1:{standins.es_port}",
+        "ELASTICSEARCH_USERNAME": "benchmark",
+        "ELASTICSEARCH_PASSWORD": "benchmark",
+        # http 대체 서버에는 TLS 옵션을 사용할 수 없음
+        "ELASTICSEARCH_CA_CERT": "",
+        "CORS_ORIGINS": "*",
+        "CORS_CREDENTIALS": "True",
+        "CORS_METHODS": "*",
+        "CORS_HEADERS": "*",
+        "WEB_HOST": "127.0.0.1",
+        "WEB_PORT": str(app_port),
+        "BCRYPT_ROUNDS": str(bcrypt_rounds),
+        # 대체 Redis는 Lua 스크립트를 지원하지 않음
+        "RATE_LIMIT_LOGIN_IP": "",
+        "RATE_LIMIT_LOGIN_EMAIL": "",
+        "RATE_LIMIT_SEARCH": "",
+        "TIMING_SAMPLE_RATE": "0",
+        "N_PLUS_ONE_ACTION": "off",
+    }
+    os.environ.update(environment)
+    return environment
+
+
+async def seed_data(
+    products: int, stocks_per_product: int, buyers: int, bcrypt_rounds: int
+) -> None:
+    """벤치마크용 카테고리, 사용자, 상품, 재고를 적재하고 검색 인덱스를 동기화합니다."""
+    import bcrypt
+    from sqlalchemy import insert
+
+    from src.database import close_db, create_db_and_tables, get_engine
+    from src.elastic_client import close_elasticsearch_client
+    from src.models.product import (
+        PrimaryCategory,
+        Product,
+        SecondaryCategory,
+        StatusType,
+        Stock,
+        TertiaryCategory,
+    )
+    from src.models.user import Buyer, Seller, User, UserType
+    from src.redis_client import close_redis_clients
+    from src.service.sync import sync_changed_products
+
+    await create_db_and_tables()
+
+    password = bcrypt.hashpw(PASSWORD.encode(), bcrypt.gensalt(bcrypt_rounds)).decode()
+    sellers = 5
+
+    async with get_engine().begin() as conn:
+        await conn.execute(
+            insert(PrimaryCategory),
+            [{"id": i, "name": f"primary-{i}"} for i in range(1, 4)],
+        )
+        await conn.execute(
+            insert(SecondaryCategory),
+            [
+                {
+                    "id": i,
+                    "name": f"secondary-{i}",
+                    "primary_category_id": (i - 1) // 3 + 1,
+                }
+                for i in range(1, 10)
+            ],
+        )
+        await conn.execute(
+            insert(TertiaryCategory),
+            [
+                {
+                    "id": i,
+                    "name": f"tertiary-{i}",
+                    "secondary_category_id": (i - 1) // 3 + 1,
+                }
+                for i in range(1, 28)
+            ],
+        )
+
+        await conn.execute(
+            insert(User),
+            [
+                {
+                    "id": i,
+                    "email": SELLER_EMAIL if i == 1 else f"seller{i}@bench.example.com",
+                    "password": password,
+                    "user_type": UserType.SELLER,
+                }
+                for i in range(1, sellers + 1)
+            ]
+            + [
+                {
+                    "id": sellers + i,
+                    "email": buyer_email(i),
+                    "password": password,
+                    "user_type": UserType.BUYER,
+                }
+                for i in range(1, buyers + 1)
+            ],
+        )
+        await conn.execute(
+            insert(Seller),
+            [
+                {
+                    "id": i,
+                    "user_id": i,
+                    "registration_number": f"000-00-{i:05d}",
+                    "brand_name": f"brand-{i}",
+                    "contact_number": "010-0000-0000",
+                }
+                for i in range(1, sellers + 1)
+            ],
+        )
+        await conn.execute(
+            insert(Buyer),
+            [
+                {
+                    "id": i,
+                    "user_id": sellers + i,
+                    "name": f"buyer-{i}",
+                    "phone_number": "010-0000-0000",
+                    "address": "Seoul",
+                }
+                for i in range(1, buyers + 1)
+            ],
+        )
+
+        await conn.execute(
+            insert(Product),
+            [
+                {
+                    "id": i,
+                    "seller_id": (i - 1) % sellers + 1,
+                    "product_name": f"{PRODUCT_WORDS[i % len(PRODUCT_WORDS)]} {i}",
+                    "category_id": (i - 1) % 27 + 1,
+                    "price": 10000 + i % 50 * 1000,
+                    "discounted_price": 9000 + i % 50 * 1000,
+                    "capacity": "50ml",
+                    "ingredient": "water, glycerin",
+                    "inventory_quantity": stocks_per_product,
+                }
+                for i in range(1, products + 1)
+            ],
+        )
+        await conn.execute(
+            insert(Stock),
+            [
+                {"product_id": product_id, "status": StatusType.AVAILABLE}
+                for product_id in range(1, products + 1)
+                for _ in range(stocks_per_product)
+            ],
+        )
+
+    # 애플리케이션의 변경분 동기화로 색인하여 워터마크까지 기록
+    await sync_changed_products()
+    await close_db()
+    await close_elasticsearch_client()
+    await close_redis_clients()
+
+
+class AppServer:
+    """uvicorn으로 애플리케이션을 별도 프로세스에서 실행합니다."""
+
+    def __init__(self, port: int, environment: dict, log_path: str):
+        self.port = port
+        self.environment = environment
+        self.log_path = log_path
+        self.process: Optional[subprocess.Popen] = None
+        self.base_url = f"http://127.0.0.1:{port}"
+
+    def start(self, timeout: float = 30) -> None:
+        env = {**os.environ, **self.environment}
+        self.log_file = open(self.log_path, "w")
+        self.process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "uvicorn",
+                "src.main:app",
+                "--host",
+                "127.0.0.1",
+                "--port",
+                str(self.port),
+                "--log-level",
+                "warning",
+                "--no-access-log",
+            ],
+            cwd=ROOT_DIR,
+            env=env,
+            stdout=self.log_file,
+            stderr=subprocess.STDOUT,
+        )
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(
+                    f"Application exited during startup:\n{self.log_tail()}"
+                )
+            try:
+                if httpx.get(f"{self.base_url}/health", timeout=1).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.1)
+        raise RuntimeError(f"Application did not become healthy:\n{self.log_tail()}")
+
+    def log_tail(self, lines: int = 30) -> str:
+        # 임시 디렉터리는 종료 시 삭제되므로 실패 원인을 예외 메시지에 포함
+        self.log_file.flush()
+        with open(self.log_path) as f:
+            return "".join(f.readlines()[-lines:])
+
+    def stop(self) -> None:
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self.log_file.close()
+
+
+class BenchmarkEnvironment:
+    """대체 서버 기동, 데이터 적재, 애플리케이션 실행을 한 번에 관리합니다."""
+
+    def __init__(
+        self,
+        products: int,
+        stocks_per_product: int,
+        buyers: int,
+        bcrypt_rounds: int,
+        start_app: bool = True,
+    ):
+        self.products = products
+        self.stocks_per_product = stocks_per_product
+        self.buyers = buyers
+        self.bcrypt_rounds = bcrypt_rounds
+        self.start_app = start_app
+        self.directory = tempfile.TemporaryDirectory(prefix="bench-")
+        self.standins = StandIns()
+        self.app: Optional[AppServer] = None
+
+    async def __aenter__(self) -> "BenchmarkEnvironment":
+        self.standins.start()
+        environment = configure_environment(
+            self.standins,
+            database_path=os.path.join(self.directory.name, "bench.db"),
+            app_port=find_free_port(),
+            bcrypt_rounds=self.bcrypt_rounds,
+        )
+        await seed_data(
+            products=self.products,
+            stocks_per_product=self.stocks_per_product,
+            buyers=self.buyers,
+            bcrypt_rounds=self.bcrypt_rounds,
+        )
+
+        if self.start_app:
+            self.app = AppServer(
+                port=int(environment["WEB_PORT"]),
+                environment=environment,
+                log_path=os.path.join(self.directory.name, "app.log"),
+            )
+            await asyncio.get_running_loop().run_in_executor(None, self.app.start)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self.app:
+            self.app.stop()
+        self.standins.stop()
+        self.directory.cleanup()
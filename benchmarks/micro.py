@@ -0,0 +1,554 @@
+"""함수 단위 마이크로벤치마크
+
+장바구니 저장소(Redis 대체 서버), 재고 저장소(SQLite, 테이블 크기별), ES 응답 변환, 세션 JSON
+직렬화의 호출당 시간을 여러 라운드로 측정하고 중앙값 기준으로 이전 결과와 비교합니다.
+
+    python -m benchmarks.micro --only cart,session
+    python -m benchmarks.micro --save-baseline
+    python -m benchmarks.micro --against main   # 같은 머신에서 main과 번갈아 측정해 비교
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Dict, Iterator, List
+
+from benchmarks.harness import ROOT_DIR, StandIns, configure_environment, find_free_port
+from benchmarks.report import (
+    compare_results,
+    environment_info,
+    finish_report,
+    format_comparison,
+    load_report,
+    meta_differences,
+    parse_report_args,
+    write_report,
+)
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baselines", "micro.json")
+GROUPS = ("cart", "stock", "es", "session")
+
+
+@contextmanager
+def paused_gc() -> Iterator[None]:
+    # 측정 도중 GC가 실행되면 라운드별 편차가 커지므로 라운드 사이에서만 수집
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+class MicroBenchmark:
+    """라운드마다 number번 호출한 평균을 기록하고, 라운드 간 중앙값으로 요약합니다.
+
+    중앙값은 GC, 스케줄링 등으로 튀는 라운드의 영향을 덜 받아 비교 결과가 안정적입니다.
+    """
+
+    def __init__(self, rounds: int, min_round_seconds: float):
+        self.rounds = rounds
+        self.min_round_seconds = min_round_seconds
+        self.results: Dict[str, dict] = {}
+
+    def calibrate(self, elapsed_per_call: float) -> int:
+        # 라운드 하나가 타이머 해상도보다 충분히 길어지도록 호출 횟수를 정함
+        return max(1, int(self.min_round_seconds / max(elapsed_per_call, 1e-9)))
+
+    def summarize(self, name: str, samples: List[float], number: int) -> None:
+        median = statistics.median(samples)
+        # 사분위 범위(IQR)를 중앙값 대비 비율로 기록하여 비교 시 노이즈 허용 범위로 사용
+        quartiles = (
+            statistics.quantiles(samples, n=4) if len(samples) > 1 else [0, 0, 0]
+        )
+        iqr = quartiles[2] - quartiles[0]
+        self.results[name] = {
+            "median_us": round(median * 1e6, 3),
+            "min_us": round(min(samples) * 1e6, 3),
+            "max_us": round(max(samples) * 1e6, 3),
+            "stdev_us": round(statistics.pstdev(samples) * 1e6, 3),
+            "iqr_us": round(iqr * 1e6, 3),
+            "spread_pct": round(iqr / median * 100, 1) if median else 0.0,
+            "rounds": len(samples),
+            "number": number,
+        }
+        print(
+            f"{name:<44} {self.results[name]['median_us']:>12.3f} us/op "
+            f"(IQR {self.results[name]['spread_pct']:.1f}%)",
+            file=sys.stderr,
+        )
+
+    def run(self, name: str, func: Callable[[], object]) -> None:
+        start = time.perf_counter()
+        func()
+        number = self.calibrate(time.perf_counter() - start)
+
+        samples = []
+        with paused_gc():
+            for _ in range(self.rounds):
+                gc.collect()
+                start = time.perf_counter()
+                for _ in range(number):
+                    func()
+                samples.append((time.perf_counter() - start) / number)
+        self.summarize(name, samples, number)
+
+    async def arun(self, name: str, func: Callable[[], Awaitable[object]]) -> None:
+        start = time.perf_counter()
+        await func()
+        number = self.calibrate(time.perf_counter() - start)
+
+        samples = []
+        with paused_gc():
+            for _ in range(self.rounds):
+                gc.collect()
+                start = time.perf_counter()
+                for _ in range(number):
+                    await func()
+                samples.append((time.perf_counter() - start) / number)
+        self.summarize(name, samples, number)
+
+
+async def bench_cart(bench: MicroBenchmark, standins: StandIns) -> None:
+    from redis.asyncio import Redis
+
+    from src.models.repository import CartRepository
+
+    redis = Redis(port=standins.redis_port, decode_responses=True)
+    cart_repo = CartRepository(redis=redis)
+    product_id, user_id = 1, 1
+
+    # 같은 상품을 담은 다른 사용자들 (total_stocks_in_cart가 순회하는 키)
+    for other_user_id in range(2, 102):
+        await cart_repo.add_product(
+            user_id=other_user_id, product_id=product_id, quantity=1
+        )
+    for other_product_id in range(2, 12):
+        await cart_repo.add_product(
+            user_id=user_id, product_id=other_product_id, quantity=1
+        )
+
+    await bench.arun(
+        "cart.add_product",
+        lambda: cart_repo.add_product(
+            user_id=user_id, product_id=product_id, quantity=2
+        ),
+    )
+    await bench.arun(
+        "cart.get_product_quantity_in_cart",
+        lambda: cart_repo.get_product_quantity_in_cart(
+            user_id=user_id, product_id=product_id
+        ),
+    )
+    await bench.arun(
+        "cart.get_cart_product_keys[11 items]",
+        lambda: cart_repo.get_cart_product_keys(user_id=user_id),
+    )
+    await bench.arun(
+        "cart.total_stocks_in_cart[101 holders]",
+        lambda: cart_repo.total_stocks_in_cart(product_id=product_id),
+    )
+
+    async def reserve_and_cancel():
+        await cart_repo.product_reservation(
+            user_id=user_id, product_id=product_id, quantity=1
+        )
+        await cart_repo.cancel_reservation(
+            user_id=user_id, product_id=product_id, quantity=1
+        )
+
+    await bench.arun("cart.product_reservation+cancel_reservation", reserve_and_cancel)
+    await bench.arun(
+        "cart.reserve_key_exists",
+        lambda: cart_repo.reserve_key_exists(user_id=user_id, product_id=product_id),
+    )
+    await redis.aclose()
+
+
+async def bench_stock(bench: MicroBenchmark, directory: str, sizes: List[int]) -> None:
+    from sqlalchemy import insert
+    from sqlmodel import SQLModel
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    from src.database import create_engine_from_url
+    from src.models.product import (
+        PrimaryCategory,
+        Product,
+        SecondaryCategory,
+        StatusType,
+        Stock,
+        TertiaryCategory,
+    )
+    from src.models.repository import StockRepository
+    from src.models.user import Seller, User, UserType
+
+    rows_per_product = 100
+    for size in sizes:
+        engine = create_engine_from_url(
+            f"sqlite+aiosqlite:///{os.path.join(directory, f'stocks-{size}.db')}"
+        )
+        products = max(size // rows_per_product, 1)
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+            await conn.execute(insert(PrimaryCategory), [{"id": 1, "name": "p"}])
+            await conn.execute(
+                insert(SecondaryCategory),
+                [{"id": 1, "name": "s", "primary_category_id": 1}],
+            )
+            await conn.execute(
+                insert(TertiaryCategory),
+                [{"id": 1, "name": "t", "secondary_category_id": 1}],
+            )
+            await conn.execute(
+                insert(User),
+                [
+                    {
+                        "id": 1,
+                        "email": "s@b.com",
+                        "password": "x",
+                        "user_type": UserType.SELLER,
+                    }
+                ],
+            )
+            await conn.execute(
+                insert(Seller),
+                [
+                    {
+                        "id": 1,
+                        "user_id": 1,
+                        "registration_number": "0",
+                        "brand_name": "b",
+                        "contact_number": "0",
+                    }
+                ],
+            )
+            await conn.execute(
+                insert(Product),
+                [
+                    {
+                        "id": i,
+                        "seller_id": 1,
+                        "product_name": f"p{i}",
+                        "category_id": 1,
+                        "price": 1000,
+                    }
+                    for i in range(1, products + 1)
+                ],
+            )
+            await conn.execute(
+                insert(Stock),
+                [
+                    {"product_id": i % products + 1, "status": StatusType.AVAILABLE}
+                    for i in range(size)
+                ],
+            )
+
+        async with AsyncSession(engine) as session:
+            stock_repo = StockRepository(session=session, read_session=session)
+            product_id = products // 2 + 1
+            await bench.arun(
+                f"stock.count_stocks_by_product_id[rows={size}]",
+                lambda: stock_repo.count_stocks_by_product_id(product_id=product_id),
+            )
+            await bench.arun(
+                f"stock.create_stocks[rows={size},quantity=10]",
+                lambda: stock_repo.create_stocks(product_id=product_id, quantity=10),
+            )
+        await engine.dispose()
+
+
+def build_search_response(hits: int) -> dict:
+    return {
+        "took": 1,
+        "hits": {
+            "total": {"value": hits, "relation": "eq"},
+            "hits": [
+                {
+                    "_index": "products",
+                    "_id": str(i),
+                    "_source": {
+                        "id": i,
+                        "seller_id": 1,
+                        "brand_name": "brand",
+                        "product_name": f"product {i}",
+                        "category_id": 3,
+                        "category_id_1": 1,
+                        "category_id_2": 2,
+                        "category_1": "primary",
+                        "category_2": "secondary",
+                        "category_3": "tertiary",
+                        "price": 10000 + i,
+                        "discounted_price": 9000 + i,
+                        "capacity": "50ml",
+                        "ingredient": "water, glycerin",
+                        "use_status": True,
+                        "updated_at": "2024-01-01T00:00:00",
+                    },
+                }
+                for i in range(1, hits + 1)
+            ],
+        },
+    }
+
+
+class CannedElasticsearch:
+    """고정된 검색 응답을 돌려주는 클라이언트 (네트워크를 제외한 변환 비용만 측정)"""
+
+    def __init__(self, response: dict):
+        self.response = response
+
+    async def search(self, **kwargs) -> dict:
+        return self.response
+
+
+async def bench_es(bench: MicroBenchmark) -> None:
+    from pydantic import TypeAdapter
+
+    from src.apis.store.goods import get_goods_list_handler, search_goods_handler
+    from src.models.repository import ElasticsearchRepository
+    from src.schema.response import GetGoodsResponse
+
+    goods_adapter = TypeAdapter(List[GetGoodsResponse])
+    for hits in (10, 100, 1000):
+        es_repo = ElasticsearchRepository(
+            es=CannedElasticsearch(build_search_response(hits))
+        )
+        await bench.arun(
+            f"es.goods_list_to_response[hits={hits}]",
+            lambda: get_goods_list_handler(category=None, es_repo=es_repo),
+        )
+        await bench.arun(
+            f"es.search_to_response[hits={hits}]",
+            lambda: search_goods_handler(keyword="cream", es_repo=es_repo),
+        )
+        goods = await get_goods_list_handler(category=None, es_repo=es_repo)
+        bench.run(
+            f"es.goods_response_serialize[hits={hits}]",
+            lambda: goods_adapter.dump_json(goods),
+        )
+
+
+def bench_session(bench: MicroBenchmark) -> None:
+    from src.models.user import UserType
+    from src.service.auth import AuthenticatedUser
+
+    session_data = {"user_id": 12345, "user_type": UserType.BUYER, "buyer_id": 6789}
+    encoded = json.dumps(session_data)
+
+    bench.run("session.encode", lambda: json.dumps(session_data))
+    bench.run("session.decode", lambda: json.loads(encoded))
+    bench.run(
+        "session.decode_to_authenticated_user",
+        lambda: AuthenticatedUser(session_id="0" * 32, **json.loads(encoded)),
+    )
+
+
+async def run(options: argparse.Namespace) -> dict:
+    groups = options.only.split(",") if options.only else list(GROUPS)
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        raise SystemExit(f"Unknown groups: {', '.join(sorted(unknown))}")
+    sizes = [int(size) for size in options.sizes.split(",")]
+
+    bench = MicroBenchmark(
+        rounds=options.rounds, min_round_seconds=options.min_round_seconds
+    )
+    standins = StandIns()
+    standins.start()
+    with tempfile.TemporaryDirectory(prefix="bench-micro-") as directory:
+        try:
+            configure_environment(
+                standins,
+                database_path=os.path.join(directory, "bench.db"),
+                app_port=find_free_port(),
+                bcrypt_rounds=4,
+            )
+            if "cart" in groups:
+                await bench_cart(bench, standins)
+            if "stock" in groups:
+                await bench_stock(bench, directory, sizes)
+            if "es" in groups:
+                await bench_es(bench)
+            if "session" in groups:
+                bench_session(bench)
+        finally:
+            standins.stop()
+
+    return {
+        "benchmark": "micro",
+        "meta": {
+            **environment_info(),
+            "rounds": options.rounds,
+            "min_round_seconds": options.min_round_seconds,
+            "stock_table_sizes": sizes,
+        },
+        "results": bench.results,
+    }
+
+
+def run_in_tree(
+    code_dir: str, tree: str, options: argparse.Namespace, output: str
+) -> dict:
+    # 벤치마크 코드는 code_dir의 복사본을, src 패키지는 tree의 것을 import
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.micro",
+            "--only",
+            options.only,
+            "--rounds",
+            str(options.rounds),
+            "--min-round-seconds",
+            str(options.min_round_seconds),
+            "--sizes",
+            options.sizes,
+            "--baseline",
+            "",
+            "--output",
+            output,
+        ],
+        cwd=code_dir,
+        env={**os.environ, "PYTHONPATH": tree},
+        check=True,
+    )
+    return load_report(output)
+
+
+def best_of(reports: List[dict]) -> Dict[str, dict]:
+    """반복 실행 결과 중 벤치마크별로 중앙값이 가장 작은 결과를 고릅니다."""
+    best = {}
+    for report in reports:
+        for name, result in report["results"].items():
+            if name not in best or result["median_us"] < best[name]["median_us"]:
+                best[name] = result
+    return best
+
+
+def run_against(options: argparse.Namespace) -> dict:
+    """기준 ref의 작업 트리와 현재 트리를 번갈아 측정해 비교합니다.
+
+    저장된 기준 결과와의 비교는 측정 시점의 머신 부하 차이가 그대로 변화율에 섞이지만, 같은
+    시간대에 번갈아 실행한 결과끼리 비교하면 부하 변동이 양쪽에 고르게 나뉩니다.
+    """
+    with tempfile.TemporaryDirectory(prefix="bench-against-") as directory:
+        base_tree = os.path.join(directory, "base")
+        code_dir = os.path.join(directory, "code")
+        subprocess.run(
+            ["git", "worktree", "add", "--detach", base_tree, options.against],
+            cwd=ROOT_DIR,
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        # 기준 ref에 벤치마크 코드가 없거나 다를 수 있으므로 현재 코드로 양쪽을 측정
+        shutil.copytree(
+            os.path.dirname(os.path.abspath(__file__)),
+            os.path.join(code_dir, "benchmarks"),
+            ignore=shutil.ignore_patterns("__pycache__"),
+        )
+        try:
+            reports = {base_tree: [], ROOT_DIR: []}
+            output = os.path.join(directory, "report.json")
+            for repeat in range(options.repeat):
+                print(f"repeat {repeat + 1}/{options.repeat}", file=sys.stderr)
+                # 먼저 실행되는 쪽이 유리하거나 불리하지 않도록 순서를 번갈아 바꿈
+                order = [base_tree, ROOT_DIR][:: 1 if repeat % 2 == 0 else -1]
+                for tree in order:
+                    reports[tree].append(run_in_tree(code_dir, tree, options, output))
+        finally:
+            subprocess.run(
+                ["git", "worktree", "remove", "--force", base_tree],
+                cwd=ROOT_DIR,
+                check=False,
+            )
+
+    base_results, results = best_of(reports[base_tree]), best_of(reports[ROOT_DIR])
+    report = {
+        "benchmark": "micro",
+        "meta": {
+            **reports[ROOT_DIR][0]["meta"],
+            "against": options.against,
+            "repeat": options.repeat,
+        },
+        "results": results,
+        "base_results": base_results,
+    }
+
+    differences = meta_differences(reports[ROOT_DIR][0], reports[base_tree][0])
+    if differences:
+        report["comparison"] = {"baseline": options.against, "skipped": differences}
+        print(
+            "Runs measured under different conditions, skipping comparison:",
+            file=sys.stderr,
+        )
+        for difference in differences:
+            print(f"  {difference}", file=sys.stderr)
+        return report
+
+    rows = compare_results(results, base_results, options.tolerance)
+    print(format_comparison(rows), file=sys.stderr)
+    report["comparison"] = {
+        "baseline": options.against,
+        "tolerance_pct": round(options.tolerance * 100, 1),
+        "rows": rows,
+    }
+    return report
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--only", default="", help=f"comma separated, one of {', '.join(GROUPS)}"
+    )
+    parser.add_argument("--rounds", type=int, default=30)
+    parser.add_argument("--min-round-seconds", type=float, default=0.02)
+    parser.add_argument(
+        "--sizes", default="1000,10000,100000", help="stock table sizes"
+    )
+    parser.add_argument(
+        "--output", help="write JSON report to this path (default: stdout)"
+    )
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument(
+        "--against", help="git ref to measure alternately with the working tree"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="alternating runs per tree (--against)"
+    )
+    return parse_report_args(parser, argv)
+
+
+def main(argv=None) -> int:
+    options = parse_args(argv)
+    if options.against:
+        report = run_against(options)
+        write_report(report, options.output)
+        regressions = [
+            row for row in report["comparison"].get("rows", []) if row["regression"]
+        ]
+        return 1 if regressions else 0
+
+    report = asyncio.run(run(options))
+    return finish_report(
+        report,
+        output=options.output,
+        baseline_path=options.baseline,
+        tolerance=options.tolerance,
+        save_baseline=options.save_baseline,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
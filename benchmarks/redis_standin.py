@@ -0,0 +1,552 @@
+import asyncio
+import fnmatch
+import hashlib
+import time
+from typing import Dict, List, Optional
+
+
+class CommandError(Exception):
+    pass
+
+
+WRONGTYPE = "WRONGTYPE Operation against a key holding the wrong kind of value"
+
+
+class Stream:
+    def __init__(self):
+        self.entries: List[tuple] = []  # (id, [field, value, ...])
+        self.last_id = (0, 0)
+        # 그룹 이름 -> {"last_delivered": (ms, seq), "pending": {id: consumer}}
+        self.groups: Dict[bytes, dict] = {}
+
+    def next_id(self) -> tuple:
+        ms = int(time.time() * 1000)
+        if ms <= self.last_id[0]:
+            return self.last_id[0], self.last_id[1] + 1
+        return ms, 0
+
+
+def format_stream_id(stream_id: tuple) -> bytes:
+    return f"{stream_id[0]}-{stream_id[1]}".encode()
+
+
+def parse_stream_id(value: bytes) -> tuple:
+    ms, _, seq = value.decode().partition("-")
+    return int(ms), int(seq or 0)
+
+
+class Database:
+    def __init__(self):
+        self.data: dict = {}
+        self.expires: Dict[bytes, float] = {}
+
+    def purge(self, key: bytes) -> None:
+        expires_at = self.expires.get(key)
+        if expires_at is not None and expires_at <= time.monotonic():
+            self.data.pop(key, None)
+            del self.expires[key]
+
+    def get(self, key: bytes, expected_type=None):
+        self.purge(key)
+        value = self.data.get(key)
+        if value is not None and expected_type and not isinstance(value, expected_type):
+            raise CommandError(WRONGTYPE)
+        return value
+
+    def set(self, key: bytes, value, keep_ttl: bool = False) -> None:
+        self.data[key] = value
+        if not keep_ttl:
+            self.expires.pop(key, None)
+
+    def delete(self, key: bytes) -> bool:
+        self.purge(key)
+        self.expires.pop(key, None)
+        return self.data.pop(key, None) is not None
+
+    def keys(self) -> List[bytes]:
+        for key in list(self.expires):
+            self.purge(key)
+        return list(self.data)
+
+
+class RedisStandIn:
+    """벤치마크용 Redis 호환 서버
+
+    애플리케이션이 사용하는 명령(문자열, 해시, 셋, 스트림, 만료, MULTI/EXEC)만 구현하며,
+    redis-py 기본값인 RESP3(HELLO 3)와 RESP2를 모두 지원합니다.
+    명령은 이벤트 루프 안에서 하나씩 실행되므로 실제 Redis처럼 각 명령은 원자적입니다.
+    Lua 스크립트는 지원하지 않으므로 레이트 리밋은 비활성화한 상태로 사용해야 합니다.
+    """
+
+    def __init__(self, databases: int = 16):
+        self.databases = [Database() for _ in range(databases)]
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.connections: set = set()
+        self.command_count = 0
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        self.server = await asyncio.start_server(self.handle_connection, host, port)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self.server:
+            self.server.close()
+        for task in self.connections:
+            task.cancel()
+        await asyncio.gather(*self.connections, return_exceptions=True)
+
+    def flushall(self) -> None:
+        self.databases = [Database() for _ in self.databases]
+
+    async def handle_connection(self, reader, writer) -> None:
+        state = {"db": 0, "queue": None, "protocol": 2}
+        task = asyncio.current_task()
+        self.connections.add(task)
+        try:
+            while True:
+                args = await read_command(reader)
+                if args is None:
+                    break
+                reply = await self.dispatch(state, args)
+                writer.write(encode(reply, state["protocol"]))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connections.discard(task)
+            writer.close()
+
+    async def dispatch(self, state: dict, args: List[bytes]):
+        name = args[0].decode().upper()
+        self.command_count += 1
+
+        if state["queue"] is not None and name not in ("EXEC", "DISCARD", "MULTI"):
+            state["queue"].append(args)
+            return SimpleString("QUEUED")
+
+        try:
+            if name == "MULTI":
+                state["queue"] = []
+                return SimpleString("OK")
+            if name == "DISCARD":
+                state["queue"] = None
+                return SimpleString("OK")
+            if name == "EXEC":
+                queued, state["queue"] = state["queue"] or [], None
+                # 대기 없이 연속 실행되므로 다른 연결의 명령이 끼어들지 않음
+                return [
+                    await self.execute(state, queued_args) for queued_args in queued
+                ]
+            return await self.execute(state, args)
+        except CommandError as e:
+            return e
+
+    async def execute(self, state: dict, args: List[bytes]):
+        name = args[0].decode().upper()
+        handler = getattr(self, f"cmd_{name.lower()}", None)
+        if handler is None:
+            return CommandError(f"ERR unknown command '{name}'")
+        try:
+            return await handler(state, self.databases[state["db"]], *args[1:])
+        except TypeError:
+            return CommandError(f"ERR wrong number of arguments for '{name}' command")
+        except CommandError as e:
+            return e
+
+    # 연결 관리
+    async def cmd_hello(self, state, db, *args):
+        if args:
+            protocol = int(args[0])
+            if protocol not in (2, 3):
+                raise CommandError("NOPROTO unsupported protocol version")
+            state["protocol"] = protocol
+        return {
+            b"server": b"redis",
+            b"version": b"7.2.0",
+            b"proto": state["protocol"],
+            b"id": id(state),
+            b"mode": b"standalone",
+            b"role": b"master",
+            b"modules": [],
+        }
+
+    async def cmd_ping(self, state, db, message=None):
+        return message if message is not None else SimpleString("PONG")
+
+    async def cmd_echo(self, state, db, message):
+        return message
+
+    async def cmd_select(self, state, db, index):
+        state["db"] = int(index)
+        return SimpleString("OK")
+
+    async def cmd_client(self, state, db, *args):
+        return SimpleString("OK")
+
+    async def cmd_info(self, state, db, *args):
+        return b"# Server\r\nredis_version:7.2.0\r\n"
+
+    async def cmd_flushdb(self, state, db, *args):
+        self.databases[state["db"]] = Database()
+        return SimpleString("OK")
+
+    async def cmd_flushall(self, state, db, *args):
+        self.flushall()
+        return SimpleString("OK")
+
+    async def cmd_dbsize(self, state, db):
+        return len(db.keys())
+
+    async def cmd_script(self, state, db, subcommand, *args):
+        if subcommand.upper() == b"LOAD":
+            return hashlib.sha1(args[0]).hexdigest().encode()
+        return SimpleString("OK")
+
+    async def cmd_evalsha(self, state, db, *args):
+        raise CommandError("NOSCRIPT scripting is not supported by the stand-in")
+
+    async def cmd_eval(self, state, db, *args):
+        raise CommandError("ERR scripting is not supported by the stand-in")
+
+    # 키 공통
+    async def cmd_del(self, state, db, *keys):
+        return sum(db.delete(key) for key in keys)
+
+    async def cmd_unlink(self, state, db, *keys):
+        return await self.cmd_del(state, db, *keys)
+
+    async def cmd_exists(self, state, db, *keys):
+        return sum(db.get(key) is not None for key in keys)
+
+    async def cmd_expire(self, state, db, key, seconds, *options):
+        if db.get(key) is None:
+            return 0
+        db.expires[key] = time.monotonic() + int(seconds)
+        return 1
+
+    async def cmd_pexpire(self, state, db, key, milliseconds, *options):
+        if db.get(key) is None:
+            return 0
+        db.expires[key] = time.monotonic() + int(milliseconds) / 1000
+        return 1
+
+    async def cmd_ttl(self, state, db, key):
+        if db.get(key) is None:
+            return -2
+        expires_at = db.expires.get(key)
+        return -1 if expires_at is None else round(expires_at - time.monotonic())
+
+    async def cmd_keys(self, state, db, pattern):
+        pattern = pattern.decode()
+        return [key for key in db.keys() if fnmatch.fnmatchcase(key.decode(), pattern)]
+
+    async def cmd_scan(self, state, db, cursor, *args):
+        options = {args[i].upper(): args[i + 1] for i in range(0, len(args) - 1, 2)}
+        keys = db.keys()
+        if b"MATCH" in options:
+            pattern = options[b"MATCH"].decode()
+            keys = [key for key in keys if fnmatch.fnmatchcase(key.decode(), pattern)]
+        return [b"0", keys]
+
+    async def cmd_type(self, state, db, key):
+        value = db.get(key)
+        type_names = {bytes: "string", dict: "hash", set: "set", Stream: "stream"}
+        return SimpleString(type_names.get(type(value), "none"))
+
+    # 문자열
+    async def cmd_get(self, state, db, key):
+        return db.get(key, bytes)
+
+    async def cmd_set(self, state, db, key, value, *args):
+        options = [arg.upper() for arg in args]
+        exists = db.get(key) is not None
+        if (b"NX" in options and exists) or (b"XX" in options and not exists):
+            return None
+
+        db.set(key, value, keep_ttl=b"KEEPTTL" in options)
+        for option, scale in ((b"EX", 1), (b"PX", 0.001)):
+            if option in options:
+                ttl = int(args[options.index(option) + 1]) * scale
+                db.expires[key] = time.monotonic() + ttl
+        return SimpleString("OK")
+
+    async def cmd_setex(self, state, db, key, seconds, value):
+        return await self.cmd_set(state, db, key, value, b"EX", seconds)
+
+    async def cmd_getex(self, state, db, key, *args):
+        value = db.get(key, bytes)
+        if value is None:
+            return None
+
+        options = [arg.upper() for arg in args]
+        if b"PERSIST" in options:
+            db.expires.pop(key, None)
+        for option, scale in ((b"EX", 1), (b"PX", 0.001)):
+            if option in options:
+                ttl = int(args[options.index(option) + 1]) * scale
+                db.expires[key] = time.monotonic() + ttl
+        return value
+
+    async def cmd_incrby(self, state, db, key, amount):
+        value = int(db.get(key, bytes) or 0) + int(amount)
+        db.set(key, str(value).encode(), keep_ttl=True)
+        return value
+
+    async def cmd_incr(self, state, db, key):
+        return await self.cmd_incrby(state, db, key, b"1")
+
+    async def cmd_decrby(self, state, db, key, amount):
+        return await self.cmd_incrby(state, db, key, str(-int(amount)).encode())
+
+    # 해시
+    def get_hash(self, db: Database, key: bytes, create: bool = False) -> dict:
+        value = db.get(key, dict)
+        if value is None:
+            value = {}
+            if create:
+                db.set(key, value)
+        return value
+
+    async def cmd_hset(self, state, db, key, *pairs):
+        if not pairs or len(pairs) % 2:
+            raise TypeError
+        value = self.get_hash(db, key, create=True)
+        added = 0
+        for field, field_value in zip(pairs[::2], pairs[1::2]):
+            added += field not in value
+            value[field] = field_value
+        return added
+
+    async def cmd_hmset(self, state, db, key, *pairs):
+        await self.cmd_hset(state, db, key, *pairs)
+        return SimpleString("OK")
+
+    async def cmd_hget(self, state, db, key, field):
+        return self.get_hash(db, key).get(field)
+
+    async def cmd_hmget(self, state, db, key, *fields):
+        value = self.get_hash(db, key)
+        return [value.get(field) for field in fields]
+
+    async def cmd_hgetall(self, state, db, key):
+        return dict(self.get_hash(db, key))
+
+    async def cmd_hdel(self, state, db, key, *fields):
+        value = self.get_hash(db, key)
+        removed = sum(value.pop(field, None) is not None for field in fields)
+        if not value:
+            db.delete(key)
+        return removed
+
+    async def cmd_hlen(self, state, db, key):
+        return len(self.get_hash(db, key))
+
+    async def cmd_hincrby(self, state, db, key, field, amount):
+        value = self.get_hash(db, key, create=True)
+        result = int(value.get(field, 0)) + int(amount)
+        value[field] = str(result).encode()
+        return result
+
+    # 셋
+    async def cmd_sadd(self, state, db, key, *members):
+        value = db.get(key, set)
+        if value is None:
+            value = set()
+            db.set(key, value)
+        before = len(value)
+        value.update(members)
+        return len(value) - before
+
+    async def cmd_srem(self, state, db, key, *members):
+        value = db.get(key, set) or set()
+        removed = sum(member in value for member in members)
+        value.difference_update(members)
+        if not value:
+            db.delete(key)
+        return removed
+
+    async def cmd_smembers(self, state, db, key):
+        return set(db.get(key, set) or ())
+
+    async def cmd_scard(self, state, db, key):
+        return len(db.get(key, set) or ())
+
+    # 스트림
+    def get_stream(self, db: Database, key: bytes, create: bool = False) -> Stream:
+        stream = db.get(key, Stream)
+        if stream is None:
+            if not create:
+                raise CommandError("ERR no such key")
+            stream = Stream()
+            db.set(key, stream)
+        return stream
+
+    async def cmd_xadd(self, state, db, key, *args):
+        args = list(args)
+        if args[0].upper() == b"MAXLEN":
+            args = args[3:] if args[1] in (b"~", b"=") else args[2:]
+        entry_id, pairs = args[0], args[1:]
+
+        stream = self.get_stream(db, key, create=True)
+        stream_id = stream.next_id() if entry_id == b"*" else parse_stream_id(entry_id)
+        stream.last_id = stream_id
+        stream.entries.append((stream_id, list(pairs)))
+        return format_stream_id(stream_id)
+
+    async def cmd_xlen(self, state, db, key):
+        stream = db.get(key, Stream)
+        return len(stream.entries) if stream else 0
+
+    async def cmd_xgroup(self, state, db, subcommand, key, group, *args):
+        subcommand = subcommand.upper()
+        if subcommand == b"CREATE":
+            options = [arg.upper() for arg in args[1:]]
+            stream = self.get_stream(db, key, create=b"MKSTREAM" in options)
+            if group in stream.groups:
+                raise CommandError("BUSYGROUP Consumer Group name already exists")
+            last_delivered = (
+                stream.last_id if args[0] == b"$" else parse_stream_id(args[0])
+            )
+            stream.groups[group] = {"last_delivered": last_delivered, "pending": {}}
+            return SimpleString("OK")
+        if subcommand == b"DESTROY":
+            return int(self.get_stream(db, key).groups.pop(group, None) is not None)
+        raise CommandError(f"ERR unsupported XGROUP subcommand {subcommand.decode()}")
+
+    async def cmd_xreadgroup(self, state, db, *args):
+        upper = [arg.upper() for arg in args]
+        group, consumer = args[upper.index(b"GROUP") + 1 : upper.index(b"GROUP") + 3]
+        count = int(args[upper.index(b"COUNT") + 1]) if b"COUNT" in upper else None
+        block = int(args[upper.index(b"BLOCK") + 1]) if b"BLOCK" in upper else None
+        streams_at = upper.index(b"STREAMS") + 1
+        half = (len(args) - streams_at) // 2
+        keys = args[streams_at : streams_at + half]
+
+        deadline = time.monotonic() + (block or 0) / 1000
+        while True:
+            reply = {}
+            for key in keys:
+                stream = self.get_stream(db, key)
+                group_state = stream.groups.get(group)
+                if group_state is None:
+                    raise CommandError("NOGROUP No such consumer group")
+
+                entries = [
+                    entry
+                    for entry in stream.entries
+                    if entry[0] > group_state["last_delivered"]
+                ][:count]
+                if entries:
+                    group_state["last_delivered"] = entries[-1][0]
+                    for entry_id, _ in entries:
+                        group_state["pending"][entry_id] = consumer
+                    reply[key] = [
+                        [format_stream_id(i), fields] for i, fields in entries
+                    ]
+            if reply or block is None or time.monotonic() >= deadline:
+                if not reply:
+                    return None
+                # RESP2는 맵 대신 [스트림, 항목 목록] 쌍의 배열로 응답
+                return (
+                    reply if state["protocol"] == 3 else list(map(list, reply.items()))
+                )
+            await asyncio.sleep(0.01)
+
+    async def cmd_xack(self, state, db, key, group, *ids):
+        group_state = self.get_stream(db, key).groups.get(group, {"pending": {}})
+        return sum(
+            group_state["pending"].pop(parse_stream_id(entry_id), None) is not None
+            for entry_id in ids
+        )
+
+    async def cmd_xinfo(self, state, db, subcommand, key, *args):
+        if subcommand.upper() != b"GROUPS":
+            raise CommandError(
+                f"ERR unsupported XINFO subcommand {subcommand.decode()}"
+            )
+        stream = self.get_stream(db, key)
+        return [
+            {
+                b"name": group,
+                b"consumers": len(set(group_state["pending"].values())),
+                b"pending": len(group_state["pending"]),
+                b"last-delivered-id": format_stream_id(group_state["last_delivered"]),
+                b"lag": sum(
+                    1 for i, _ in stream.entries if i > group_state["last_delivered"]
+                ),
+            }
+            for group, group_state in stream.groups.items()
+        ]
+
+
+class SimpleString(str):
+    pass
+
+
+def encode(reply, protocol: int = 2) -> bytes:
+    """응답을 RESP로 직렬화합니다. RESP2에서는 맵과 셋을 평탄화한 배열로 보냅니다."""
+    if reply is None:
+        return b"_\r\n" if protocol == 3 else b"$-1\r\n"
+    if isinstance(reply, CommandError):
+        return f"-{reply}\r\n".encode()
+    if isinstance(reply, SimpleString):
+        return f"+{reply}\r\n".encode()
+    if isinstance(reply, bool):
+        return f":{int(reply)}\r\n".encode()
+    if isinstance(reply, int):
+        return f":{reply}\r\n".encode()
+    if isinstance(reply, str):
+        reply = reply.encode()
+    if isinstance(reply, bytes):
+        return b"$%d\r\n%s\r\n" % (len(reply), reply)
+    if isinstance(reply, dict):
+        items = [item for pair in reply.items() for item in pair]
+        if protocol == 3:
+            return b"%%%d\r\n" % len(reply) + b"".join(
+                encode(item, protocol) for item in items
+            )
+        return encode(items, protocol)
+    if isinstance(reply, (set, frozenset)):
+        prefix = b"~" if protocol == 3 else b"*"
+        return (
+            prefix
+            + b"%d\r\n" % len(reply)
+            + b"".join(encode(item, protocol) for item in reply)
+        )
+    if isinstance(reply, (list, tuple)):
+        return b"*%d\r\n" % len(reply) + b"".join(
+            encode(item, protocol) for item in reply
+        )
+    raise TypeError(f"Cannot encode reply of type {type(reply).__name__}")
+
+
+async def read_command(reader: asyncio.StreamReader) -> Optional[List[bytes]]:
+    line = await reader.readline()
+    if not line:
+        return None
+    if not line.startswith(b"*"):
+        # 인라인 명령 (redis-cli, telnet 등)
+        return line.split()
+
+    args = []
+    for _ in range(int(line[1:])):
+        length = int((await reader.readline())[1:])
+        args.append((await reader.readexactly(length + 2))[:-2])
+    return args
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Redis-compatible stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6379)
+    options = parser.parse_args()
+
+    async def serve():
+        standin = RedisStandIn()
+        port = await standin.start(options.host, options.port)
+        print(f"Redis stand-in listening on {options.host}:{port}")
+        await standin.server.serve_forever()
+
+    asyncio.run(serve())
@@ -0,0 +1,206 @@
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence
+
+# 지표별 개선 방향: 처리량은 클수록, 지연 시간은 작을수록 좋음
+HIGHER_IS_BETTER = {"throughput_rps", "ops_per_second"}
+COMPARED_METRICS = (
+    "throughput_rps",
+    "ops_per_second",
+    "p50_ms",
+    "p95_ms",
+    "p99_ms",
+    "median_us",
+)
+
+
+# 실행할 때마다 달라지는 값은 기준 결과와의 비교 조건에서 제외
+VOLATILE_META_KEYS = {"timestamp", "duration_seconds"}
+
+
+def percentile(sorted_samples: Sequence[float], q: float) -> float:
+    """nearest-rank 방식의 백분위수 (samples는 정렬된 상태여야 함)"""
+    if not sorted_samples:
+        return 0.0
+    rank = max(math.ceil(q * len(sorted_samples)) - 1, 0)
+    return sorted_samples[min(rank, len(sorted_samples) - 1)]
+
+
+def summarize_latencies(latencies: List[float], errors: int, duration: float) -> dict:
+    """초 단위 지연 시간 목록을 처리량과 백분위수(ms)로 요약합니다."""
+    samples = sorted(latencies)
+    total = len(samples)
+    return {
+        "requests": total,
+        "errors": errors,
+        "throughput_rps": round(total / duration, 2) if duration else 0.0,
+        "mean_ms": round(sum(samples) / total * 1000, 3) if total else 0.0,
+        "p50_ms": round(percentile(samples, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(samples, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(samples, 0.99) * 1000, 3),
+        "max_ms": round(samples[-1] * 1000, 3) if total else 0.0,
+    }
+
+
+def environment_info() -> dict:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def meta_differences(current: dict, baseline: dict) -> List[str]:
+    """측정 환경(파이썬, 플랫폼, CPU 수)과 실행 옵션 중 기준 결과와 다른 항목을 반환합니다."""
+    differences = []
+    if current.get("benchmark") != baseline.get("benchmark"):
+        differences.append(
+            f"benchmark: {baseline.get('benchmark')!r} -> {current.get('benchmark')!r}"
+        )
+
+    current_meta, baseline_meta = current.get("meta", {}), baseline.get("meta", {})
+    for key in sorted(
+        (current_meta.keys() | baseline_meta.keys()) - VOLATILE_META_KEYS
+    ):
+        if current_meta.get(key) != baseline_meta.get(key):
+            differences.append(
+                f"{key}: {baseline_meta.get(key)!r} -> {current_meta.get(key)!r}"
+            )
+    return differences
+
+
+def compare_results(
+    current: Dict[str, dict], baseline: Dict[str, dict], tolerance: float
+) -> List[dict]:
+    """기준 결과 대비 변화율을 계산하고 허용 범위를 벗어난 악화를 회귀로 표시합니다.
+
+    결과에 측정 편차(spread_pct)가 있으면 양쪽 편차의 합보다 작은 변화는 노이즈로 보고
+    허용 범위를 그만큼 넓힙니다.
+    """
+    rows = []
+    for name, result in current.items():
+        baseline_result = baseline.get(name)
+        if baseline_result is None:
+            continue
+
+        for metric in COMPARED_METRICS:
+            if metric not in result or not baseline_result.get(metric):
+                continue
+
+            before, after = baseline_result[metric], result[metric]
+            change = (after - before) / before
+            worse = -change if metric in HIGHER_IS_BETTER else change
+            noise = (
+                result.get("spread_pct", 0.0) + baseline_result.get("spread_pct", 0.0)
+            ) / 100
+            threshold = max(tolerance, noise)
+            rows.append(
+                {
+                    "name": name,
+                    "metric": metric,
+                    "baseline": before,
+                    "current": after,
+                    "change_pct": round(change * 100, 1),
+                    "threshold_pct": round(threshold * 100, 1),
+                    "regression": worse > threshold,
+                }
+            )
+    return rows
+
+
+def format_comparison(rows: List[dict]) -> str:
+    lines = [
+        f"{'name':<48} {'metric':<16} {'baseline':>12} {'current':>12} {'change':>9} "
+        f"{'limit':>7}"
+    ]
+    for row in rows:
+        marker = "  REGRESSION" if row["regression"] else ""
+        lines.append(
+            f"{row['name']:<48} {row['metric']:<16} {row['baseline']:>12.3f} "
+            f"{row['current']:>12.3f} {row['change_pct']:>+8.1f}% "
+            f"{row['threshold_pct']:>6.1f}%{marker}"
+        )
+    return "\n".join(lines)
+
+
+def load_report(path: str) -> Optional[dict]:
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_report(report: dict, path: Optional[str]) -> None:
+    """path가 없으면 표준 출력으로 JSON을 씁니다. (사람이 읽는 요약은 표준 에러로 출력)"""
+    content = json.dumps(report, indent=2, ensure_ascii=False) + "\n"
+    if path is None:
+        sys.stdout.write(content)
+        return
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+
+
+def parse_report_args(
+    parser: argparse.ArgumentParser, argv: Optional[Sequence[str]]
+) -> argparse.Namespace:
+    """인자를 해석하고, 측정 전에 기준 결과 옵션 조합을 검증합니다."""
+    options = parser.parse_args(argv)
+    if options.save_baseline and not options.baseline:
+        # 경로 없이 저장하면 기준 결과를 남기지 못하고 측정 시간만 허비함
+        parser.error("--save-baseline requires a --baseline path")
+    return options
+
+
+def finish_report(
+    report: dict,
+    output: Optional[str],
+    baseline_path: Optional[str],
+    tolerance: float,
+    save_baseline: bool,
+) -> int:
+    """결과를 기록하고 측정 조건이 같은 기준 결과와 비교합니다. 회귀가 있으면 1을 반환합니다."""
+    if save_baseline:
+        write_report(report, baseline_path)
+        print(f"Baseline saved to {baseline_path}", file=sys.stderr)
+
+    baseline = None if save_baseline else load_report(baseline_path or "")
+    if baseline is None:
+        if baseline_path and not save_baseline:
+            print(
+                f"Baseline {baseline_path} not found, skipping comparison",
+                file=sys.stderr,
+            )
+    elif differences := meta_differences(report, baseline):
+        # 다른 머신이나 옵션으로 측정한 결과와의 변화율은 코드 변경의 영향으로 볼 수 없음
+        report["comparison"] = {"baseline": baseline_path, "skipped": differences}
+        print(
+            f"Baseline {baseline_path} was measured under different conditions, "
+            "skipping comparison:",
+            file=sys.stderr,
+        )
+        for difference in differences:
+            print(f"  {difference}", file=sys.stderr)
+    else:
+        rows = compare_results(report["results"], baseline["results"], tolerance)
+        report["comparison"] = {
+            "baseline": baseline_path,
+            "tolerance_pct": round(tolerance * 100, 1),
+            "rows": rows,
+        }
+        print(format_comparison(rows), file=sys.stderr)
+
+    write_report(report, output)
+    regressions = [
+        row for row in report.get("comparison", {}).get("rows", []) if row["regression"]
+    ]
+    return 1 if regressions else 0
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Depends, status
 
-from src.apis.common import health
+from src.apis.common import debug, health, metrics
+from src.service.auth import verify_internal_token
 
 common_router = APIRouter(tags=["common"])
 
@@ -10,3 +11,32 @@ common_router.add_api_route(
     endpoint=health.handler,
     status_code=status.HTTP_200_OK,
 )
+
+common_router.add_api_route(
+    methods=["GET"],
+    path="/health/database",
+    endpoint=health.database_pool_handler,
+    status_code=status.HTTP_200_OK,
+)
+
+common_router.add_api_route(
+    methods=["GET"],
+    path="/metrics",
+    endpoint=metrics.handler,
+    status_code=status.HTTP_200_OK,
+)
+
+common_router.add_api_route(
+    methods=["GET"],
+    path="/ready",
+    endpoint=health.readiness_handler,
+    status_code=status.HTTP_200_OK,
+)
+
+common_router.add_api_route(
+    methods=["POST"],
+    path="/debug/profile",
+    endpoint=debug.profile_handler,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(verify_internal_token)],
+)
@@ -0,0 +1,25 @@
+import os
+
+from fastapi import HTTPException, Query
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+
+from src.config import profiler as profiler_config
+from src.service.profiler import profile, profiler_lock
+
+
+async def profile_handler(
+    seconds: float = Query(default=10, gt=0, le=profiler_config.max_seconds),
+    interval_ms: float = Query(default=10, ge=1, le=1000),
+    file_format: str = Query(
+        default="collapsed", alias="format", pattern="^(collapsed|speedscope)$"
+    ),
+) -> Response:
+    if profiler_lock.locked():
+        raise HTTPException(status_code=409, detail="Profiling already in progress")
+
+    async with profiler_lock:
+        profiler = await profile(seconds=seconds, interval=interval_ms / 1000)
+
+    if file_format == "speedscope":
+        return JSONResponse(content=profiler.to_speedscope(name=f"pid {os.getpid()}"))
+    return PlainTextResponse(content=profiler.to_collapsed())
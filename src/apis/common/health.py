@@ -1,8 +1,29 @@
+from fastapi import Request, Response
+
+from src.database import get_engine, get_pool_status, get_read_engine
 from src.elastic_client import get_elasticsearch_client
+from src.service.readiness import readiness_checker
 
 
-def handler() -> dict:
+async def handler() -> dict:
     es_client = get_elasticsearch_client()
-    if es_client.ping():
+    if await es_client.ping():
         return {"status": "Elasticsearch is connected!"}
     return {"status": "Elasticsearch connection failure"}
+
+
+def database_pool_handler() -> dict:
+    engine, read_engine = get_engine(), get_read_engine()
+    status = {"primary": get_pool_status(engine)}
+    if read_engine is not engine:
+        status["replica"] = get_pool_status(read_engine)
+    return status
+
+
+async def readiness_handler(request: Request, response: Response) -> dict:
+    result = await readiness_checker.check(
+        stream_task=getattr(request.app.state, "stream_task", None)
+    )
+    if not result["ready"]:
+        response.status_code = 503
+    return result
@@ -0,0 +1,15 @@
+from fastapi import Depends
+from fastapi.responses import PlainTextResponse
+from redis.asyncio import Redis
+
+from src.metrics import render_metrics
+from src.redis_client import get_task_redis_client
+
+
+async def handler(
+    task_redis: Redis = Depends(get_task_redis_client),
+) -> PlainTextResponse:
+    return PlainTextResponse(
+        content=await render_metrics(task_redis),
+        media_type="text/plain; version=0.0.4",
+    )
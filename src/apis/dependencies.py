@@ -1,8 +1,22 @@
+from fastapi import Depends
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.database import engine
+from src.database import get_engine, get_read_engine
 
 
 async def get_session() -> AsyncSession:
-    async with AsyncSession(engine) as session:
+    async with AsyncSession(get_engine()) as session:
         yield session
+
+
+async def get_read_session(
+    session: AsyncSession = Depends(get_session),
+) -> AsyncSession:
+    # 복제본이 없으면 요청 내에서 쓰기용 세션을 그대로 공유
+    read_engine = get_read_engine()
+    if read_engine is get_engine():
+        yield session
+        return
+
+    async with AsyncSession(read_engine) as read_session:
+        yield read_session
@@ -1,16 +1,22 @@
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Depends, status
 
-from src.apis.store import cart, goods, product
+from src import config
+from src.apis.store import cart, category, goods, product
 from src.schema import response
+from src.service.rate_limit import ConcurrencyLimiter, rate_limit, session_or_ip_key
 
 store_router = APIRouter(tags=["store"])
 
+# Elasticsearch를 사용하는 API의 프로세스 내 동시 처리 수 제한
+es_concurrency_limit = ConcurrencyLimiter(limit=config.rate_limit.es_concurrency)
+
 store_router.add_api_route(
     methods=["GET"],
     path="/goods",
     endpoint=goods.get_goods_list_handler,
     response_model=list[goods.GetGoodsResponse],
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(es_concurrency_limit)],
 )
 
 store_router.add_api_route(
@@ -19,6 +25,7 @@ store_router.add_api_route(
     endpoint=goods.get_goods_by_id_handler,
     response_model=goods.GetGoodsDetailResponse,
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(es_concurrency_limit)],
 )
 
 store_router.add_api_route(
@@ -27,6 +34,20 @@ store_router.add_api_route(
     endpoint=goods.search_goods_handler,
     response_model=list[goods.GetGoodsResponse],
     status_code=status.HTTP_200_OK,
+    dependencies=[
+        # 세션(사용자) 단위 제한과 별개로 IP 단위 제한을 함께 적용
+        Depends(rate_limit(scope="search:ip", rule="search_ip")),
+        Depends(rate_limit(scope="search", rule="search", key_func=session_or_ip_key)),
+        Depends(es_concurrency_limit),
+    ],
+)
+
+store_router.add_api_route(
+    methods=["GET"],
+    path="/categories",
+    endpoint=category.get_category_list_handler,
+    response_model=list[response.CategoryResponse],
+    status_code=status.HTTP_200_OK,
 )
 
 store_router.add_api_route(
@@ -37,6 +58,45 @@ store_router.add_api_route(
     status_code=status.HTTP_201_CREATED,
 )
 
+store_router.add_api_route(
+    methods=["GET"],
+    path="/products",
+    endpoint=product.get_product_list_handler,
+    response_model=response.GetSellerProductListResponse,
+    status_code=status.HTTP_200_OK,
+)
+
+store_router.add_api_route(
+    methods=["GET"],
+    path="/products/export",
+    endpoint=product.export_product_list_handler,
+    status_code=status.HTTP_200_OK,
+)
+
+store_router.add_api_route(
+    methods=["POST"],
+    path="/products/import",
+    endpoint=product.import_product_list_handler,
+    response_model=response.ImportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+
+store_router.add_api_route(
+    methods=["GET"],
+    path="/products/import/{job_id}",
+    endpoint=product.get_import_job_handler,
+    response_model=response.ImportJobResponse,
+    status_code=status.HTTP_200_OK,
+)
+
+store_router.add_api_route(
+    methods=["PATCH"],
+    path="/products/prices",
+    endpoint=product.bulk_update_price_handler,
+    response_model=response.BulkUpdatePriceResponse,
+    status_code=status.HTTP_200_OK,
+)
+
 store_router.add_api_route(
     methods=["GET"],
     path="/products/{product_id}",
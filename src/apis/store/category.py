@@ -0,0 +1,17 @@
+from fastapi import Depends, Header, Response, status
+
+from src.service.category import CategoryTree, get_category_tree
+
+
+async def get_category_list_handler(
+    if_none_match: str | None = Header(default=None),
+    category_tree: CategoryTree = Depends(get_category_tree),
+) -> Response:
+    headers = {"ETag": category_tree.etag, "Cache-Control": "public, max-age=60"}
+
+    if if_none_match == category_tree.etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(
+        content=category_tree.body, media_type="application/json", headers=headers
+    )
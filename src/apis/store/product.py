@@ -1,57 +1,66 @@
 import asyncio
+from typing import Optional
 
-from fastapi import Cookie, Depends, HTTPException
+from fastapi import Depends, HTTPException, Query, UploadFile
+from fastapi.responses import StreamingResponse
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.apis.dependencies import get_read_session
+from src.config import product_import as import_config
+from src.config import sync as sync_config
 from src.models.product import Product
-from src.models.repository import ProductRepository, StockRepository, UserRepository
-from src.models.user import User
-from src.schema.request import CreateProductRequest, UpdateProductRequest
-from src.schema.response import GetProductDetailResponse, GetProductResponse
-from src.service.auth import verify_seller, verify_user_can_access_product
-from src.service.background_task import add_product_to_stream
-from src.service.session import SessionService
+from src.models.repository import ProductRepository, StockRepository
+from src.schema.request import (
+    BulkUpdatePriceRequest,
+    CreateProductRequest,
+    UpdateProductRequest,
+)
+from src.schema.response import (
+    BulkUpdatePriceResponse,
+    GetProductDetailResponse,
+    GetProductResponse,
+    GetSellerProductListResponse,
+    ImportJobResponse,
+    ProductPriceResponse,
+    SellerProductResponse,
+)
+from src.service.auth import (
+    AuthenticatedUser,
+    get_current_seller,
+    verify_user_can_access_product,
+)
+from src.service.background_task import (
+    add_product_to_stream,
+    add_product_updates_to_stream,
+)
+from src.service.category import category_tree_cache
+from src.service.export import stream_seller_products
+from src.service.product_import import (
+    create_import_job,
+    get_import_job,
+    start_product_import,
+)
 
 
 async def create_product_handler(
     request: CreateProductRequest,
     product_repo: ProductRepository = Depends(ProductRepository),
     stock_repo: StockRepository = Depends(StockRepository),
-    user_repo: UserRepository = Depends(UserRepository),
-    session_id: str = Cookie(None),
-    session_service: SessionService = Depends(),
+    seller: AuthenticatedUser = Depends(get_current_seller),
+    read_session: AsyncSession = Depends(get_read_session),
 ) -> GetProductResponse:
-    if not session_id:
-        raise HTTPException(status_code=400, detail="Missing Session ID")
-
-    user_id: int = await verify_seller(
-        session_id=session_id, session_service=session_service
+    category_tree = await category_tree_cache.reload_on_miss(
+        read_session, "tertiary", request.category_id
     )
-    user: User = await user_repo.get_user_by_id(user_id=user_id)
+    if category_tree.get("tertiary", request.category_id) is None:
+        raise HTTPException(status_code=400, detail="Invalid category.")
 
     request_data: dict = request.model_dump(exclude_unset=True)
-    product: Product = Product(seller_id=user.seller.id, **request_data)
+    product: Product = Product(seller_id=seller.seller_id, **request_data)
     created_product: Product = await product_repo.create_product(product)
 
-    created_product: Product = await product_repo.fetch_product(created_product.id)
-    product_info: dict = created_product.model_dump()
-
-    ##### 필요한 추가 정보 입력 #####
-    # 1. 판매자 정보 : 브랜드명, 전화번호
-    product_info["brand_name"] = created_product.seller.brand_name
-    product_info["contact_number"] = created_product.seller.contact_number
-    # 2. 카테고리 정보 : 종류별(대/중/소) 카테고리 ID, 카테고리명
-    # 소분류 (id는 상품 정보에 category_id 필드로 이미 포함되어 있음)
-    product_info["category_3"] = created_product.category.name
-    # 중분류
-    product_info["category_id_2"] = created_product.category.secondary_category.id
-    product_info["category_2"] = created_product.category.secondary_category.name
-    # 대분류
-    product_info[
-        "category_id_1"
-    ] = created_product.category.secondary_category.primary_category.id
-    product_info[
-        "category_1"
-    ] = created_product.category.secondary_category.primary_category.name
+    # 판매자 정보(브랜드명, 전화번호)와 대/중/소 카테고리 정보가 포함된 ES 문서
+    product_info: dict = await product_repo.get_product_document(created_product.id)
 
     await asyncio.create_task(
         add_product_to_stream(product_info=product_info, action_type="create")
@@ -69,33 +78,113 @@ async def create_product_handler(
     )
 
 
-async def get_product_by_id_handler(
-    product_id: int,
+async def get_product_list_handler(
+    cursor: Optional[int] = Query(default=None),
+    size: int = Query(default=20, ge=1, le=100),
     product_repo: ProductRepository = Depends(ProductRepository),
     stock_repo: StockRepository = Depends(StockRepository),
-    user_repo: UserRepository = Depends(UserRepository),
-    session_id: str = Cookie(None),
-    session_service: SessionService = Depends(),
-) -> GetProductDetailResponse:
-    if not session_id:
-        raise HTTPException(status_code=400, detail="Missing Session ID")
+    seller: AuthenticatedUser = Depends(get_current_seller),
+) -> GetSellerProductListResponse:
+    # 다음 페이지 존재 여부 확인을 위해 한 건 더 조회
+    products = await product_repo.get_seller_product_list(
+        seller_id=seller.seller_id, size=size + 1, cursor=cursor
+    )
+    has_next = len(products) > size
+    products = products[:size]
 
-    user_id: int = await verify_seller(
-        session_id=session_id, session_service=session_service
+    # 페이지 내 상품들의 가용 재고를 한 번에 집계
+    stock_counts: dict = await stock_repo.count_stocks_by_product_ids(
+        product_ids=[product.id for product in products]
     )
-    user: User = await user_repo.get_user_by_id(user_id=user_id)
 
-    product: Product | None = await product_repo.get_product_by_id(product_id)
+    return GetSellerProductListResponse(
+        items=[
+            SellerProductResponse(
+                id=product.id,
+                product_name=product.product_name,
+                category_id=product.category_id,
+                price=product.price,
+                discounted_price=product.discounted_price,
+                inventory_quantity=stock_counts.get(product.id, 0),
+            )
+            for product in products
+        ],
+        next_cursor=products[-1].id if has_next else None,
+    )
 
-    quantity = await stock_repo.count_stocks_by_product_id(product_id=product.id)
+
+async def export_product_list_handler(
+    file_format: str = Query(
+        default="ndjson", alias="format", pattern="^(ndjson|csv)$"
+    ),
+    seller: AuthenticatedUser = Depends(get_current_seller),
+) -> StreamingResponse:
+    media_type = "text/csv" if file_format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        stream_seller_products(seller_id=seller.seller_id, file_format=file_format),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="products.{file_format}"'
+        },
+    )
+
+
+async def import_product_list_handler(
+    file: UploadFile,
+    file_format: str = Query(default="csv", alias="format", pattern="^(ndjson|csv)$"),
+    seller: AuthenticatedUser = Depends(get_current_seller),
+) -> ImportJobResponse:
+    # 파일 전체를 메모리에 올리지 않도록 제한보다 1바이트만 더 읽어 초과 여부를 확인
+    data: bytes = await file.read(import_config.max_file_size + 1)
+    if len(data) > import_config.max_file_size:
+        raise HTTPException(status_code=413, detail="File is too large.")
+
+    try:
+        content: str = data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="File must be UTF-8 encoded.")
+
+    # 대량 등록은 백그라운드 작업으로 처리하고 진행 상황은 작업 ID로 조회
+    job_id: str = await create_import_job(seller_id=seller.seller_id)
+    start_product_import(
+        job_id=job_id,
+        seller_id=seller.seller_id,
+        content=content,
+        file_format=file_format,
+    )
+    return ImportJobResponse(job_id=job_id, status="pending")
+
+
+async def get_import_job_handler(
+    job_id: str,
+    seller: AuthenticatedUser = Depends(get_current_seller),
+) -> ImportJobResponse:
+    job: Optional[dict] = await get_import_job(job_id)
+    if job is None or job["seller_id"] != seller.seller_id:
+        raise HTTPException(status_code=404, detail="Import job not found.")
+
+    return ImportJobResponse(**job)
+
+
+async def get_product_by_id_handler(
+    product_id: int,
+    product_repo: ProductRepository = Depends(ProductRepository),
+    stock_repo: StockRepository = Depends(StockRepository),
+    seller: AuthenticatedUser = Depends(get_current_seller),
+) -> GetProductDetailResponse:
+    product: Product | None = await product_repo.get_product_by_id(
+        product_id, read_only=True
+    )
 
     if product is None:
         raise HTTPException(status_code=404, detail="Product Not Found")
 
     await verify_user_can_access_product(
-        seller_id=user.seller.id, product_seller_id=product.seller_id
+        seller_id=seller.seller_id, product_seller_id=product.seller_id
     )
 
+    quantity = await stock_repo.count_stocks_by_product_id(product_id=product.id)
+
     return GetProductDetailResponse(
         id=product.id,
         category=f"{product.category.name}({product.category_id})",
@@ -117,68 +206,119 @@ async def update_product_handler(
     product_id: int,
     request: UpdateProductRequest,
     product_repo: ProductRepository = Depends(ProductRepository),
-    user_repo: UserRepository = Depends(UserRepository),
-    session_id: str = Cookie(None),
-    session_service: SessionService = Depends(),
+    seller: AuthenticatedUser = Depends(get_current_seller),
+    read_session: AsyncSession = Depends(get_read_session),
 ):
-    if not session_id:
-        raise HTTPException(status_code=400, detail="Missing Session ID")
+    request_data = {
+        key: value
+        for key, value in request.model_dump(exclude_unset=True).items()
+        if value is not None
+    }
+
+    product_info = dict(request_data)
+    if "category_id" in request_data:
+        category_tree = await category_tree_cache.reload_on_miss(
+            read_session, "tertiary", request_data["category_id"]
+        )
+        category_fields = category_tree.build_category_fields(
+            request_data["category_id"]
+        )
+        if category_fields is None:
+            raise HTTPException(status_code=400, detail="Invalid category.")
+        product_info.update(category_fields)
 
-    user_id: int = await verify_seller(
-        session_id=session_id, session_service=session_service
+    # 판매자 조건을 WHERE 절에 포함하여 조회 없이 한 번의 UPDATE로 수정
+    updated_product = await product_repo.update_product_fields(
+        product_id=product_id, seller_id=seller.seller_id, values=request_data
     )
-    user: User = await user_repo.get_user_by_id(user_id=user_id)
 
-    product: Product | None = await product_repo.get_product_by_id(product_id)
-
-    if product:
+    if updated_product is None:
+        # 수정된 행이 없을 때만 존재 여부를 확인하여 404/403을 구분
+        product_seller_id = await product_repo.get_product_seller_id(product_id)
+        if product_seller_id is None:
+            raise HTTPException(status_code=404, detail="Product Not Found")
         await verify_user_can_access_product(
-            seller_id=user.seller.id, product_seller_id=product.seller_id
+            seller_id=seller.seller_id, product_seller_id=product_seller_id
         )
+        # 본인 상품이지만 조회와 수정 사이에 삭제된 경우
+        raise HTTPException(status_code=404, detail="Product Not Found")
+
+    product_info["id"] = updated_product.id
+    product_info["updated_at"] = updated_product.updated_at.isoformat()
+    await asyncio.create_task(
+        add_product_to_stream(product_info=product_info, action_type="update")
+    )
+
+    return GetProductResponse(
+        id=updated_product.id,
+        product_name=updated_product.product_name,
+        price=updated_product.price,
+        discounted_price=updated_product.discounted_price,
+    )
 
-        request_data = request.model_dump(exclude_unset=True)
-        for key, value in request_data.items():
-            if hasattr(product, key) and value is not None:
-                setattr(product, key, value)
 
-        updated_product: Product = await product_repo.update_product(product)
-        request_data["id"] = updated_product.id
-        await asyncio.create_task(
-            add_product_to_stream(product_info=request_data, action_type="update")
+async def bulk_update_price_handler(
+    request: BulkUpdatePriceRequest,
+    product_repo: ProductRepository = Depends(ProductRepository),
+    seller: AuthenticatedUser = Depends(get_current_seller),
+    read_session: AsyncSession = Depends(get_read_session),
+) -> BulkUpdatePriceResponse:
+    category_ids: Optional[frozenset] = None
+    if request.category_id is not None:
+        category_tree = await category_tree_cache.reload_on_miss(
+            read_session, request.category_type, request.category_id
+        )
+        category_ids = category_tree.get_tertiary_ids(
+            request.category_type, request.category_id
         )
+        if not category_ids:
+            raise HTTPException(status_code=400, detail="Invalid category.")
+
+    # 판매자 조건을 WHERE 절에 포함하여 본인 상품만 한 번의 UPDATE로 변경
+    rows = await product_repo.bulk_update_discounted_price(
+        seller_id=seller.seller_id,
+        discount_type=request.discount_type,
+        discount_value=request.discount_value,
+        product_ids=request.product_ids,
+        category_ids=category_ids,
+    )
 
-        return GetProductResponse(
-            id=updated_product.id,
-            product_name=updated_product.product_name,
-            price=updated_product.price,
-            discounted_price=updated_product.discounted_price,
+    product_infos = [
+        {
+            "id": row.id,
+            "discounted_price": row.discounted_price,
+            "updated_at": row.updated_at.isoformat(),
+        }
+        for row in rows
+    ]
+    for start in range(0, len(product_infos), sync_config.chunk_size):
+        await add_product_updates_to_stream(
+            product_infos=product_infos[start : start + sync_config.chunk_size]
         )
 
-    raise HTTPException(status_code=404, detail="Product Not Found")
+    return BulkUpdatePriceResponse(
+        updated_count=len(rows),
+        items=[
+            ProductPriceResponse(
+                id=row.id, price=row.price, discounted_price=row.discounted_price
+            )
+            for row in rows
+        ],
+    )
 
 
 async def delete_product_handler(
     product_id: int,
     product_repo: ProductRepository = Depends(ProductRepository),
-    user_repo: UserRepository = Depends(UserRepository),
-    session_id: str = Cookie(None),
-    session_service: SessionService = Depends(),
+    seller: AuthenticatedUser = Depends(get_current_seller),
 ):
-    if not session_id:
-        raise HTTPException(status_code=400, detail="Missing Session ID")
-
-    user_id: int = await verify_seller(
-        session_id=session_id, session_service=session_service
-    )
-    user: User = await user_repo.get_user_by_id(user_id=user_id)
-
     product: Product | None = await product_repo.get_product_by_id(product_id)
 
     if not product:
         raise HTTPException(status_code=404, detail="Product Not Found")
 
     await verify_user_can_access_product(
-        seller_id=user.seller.id, product_seller_id=product.seller_id
+        seller_id=seller.seller_id, product_seller_id=product.seller_id
     )
 
     await product_repo.delete_product(product)
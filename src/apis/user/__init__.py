@@ -1,6 +1,7 @@
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Depends, status
 
 from src.apis.user import user
+from src.service.rate_limit import rate_limit
 
 user_router = APIRouter(tags=["user"])
 
@@ -17,6 +18,7 @@ user_router.add_api_route(
     path="/login",
     endpoint=user.login_user_handler,
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(rate_limit(scope="login", rule="login_ip"))],
 )
 
 user_router.add_api_route(
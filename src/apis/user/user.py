@@ -1,8 +1,9 @@
 import asyncio
 
-from fastapi import Cookie, Depends, HTTPException
+from fastapi import Depends, HTTPException
 from fastapi.responses import JSONResponse
 
+from src.config import rate_limit as rate_limit_config
 from src.models.repository import UserRepository
 from src.models.user import Buyer, Seller, User, UserType
 from src.schema.request import LoginUserRequest, RegisterUserRequest
@@ -11,7 +12,9 @@ from src.schema.response import (
     GetRegisterInfoResponse,
     GetSellerInfoResponse,
 )
+from src.service.auth import AuthenticatedUser, build_session_data, get_current_user
 from src.service.background_task import add_email_to_stream
+from src.service.rate_limit import RateLimiter
 from src.service.session import SessionService
 from src.service.user import UserService
 
@@ -36,7 +39,7 @@ async def register_user_handler(
                 status_code=400, detail="Seller data validation failed."
             )
 
-    hashed_password = user_service.hash_password(request.password)
+    hashed_password = await user_service.hash_password(request.password)
 
     user: User = User(email=email, password=hashed_password, user_type=user_type)
     created_user: User = await user_repo.save_entity(instance=user)
@@ -92,18 +95,33 @@ async def login_user_handler(
     user_service: UserService = Depends(),
     session_service: SessionService = Depends(),
     user_repo: UserRepository = Depends(),
+    rate_limiter: RateLimiter = Depends(),
 ) -> JSONResponse:
+    await rate_limiter.hit(
+        scope="login:email",
+        # 대소문자만 바꿔 계정별 제한을 우회하지 못하도록 정규화한 이메일을 키로 사용
+        key=request.email.strip().lower(),
+        rule=rate_limit_config.login_email,
+    )
+
     user: User = await user_repo.get_user_by_email(email=request.email)
     if not user:
         raise HTTPException(status_code=404, detail="User Not Found.")
 
-    is_verified: bool = user_service.verify_password(
+    is_verified: bool = await user_service.verify_password(
         plain_password=request.password, hashed_password=user.password
     )
     if not is_verified:
         raise HTTPException(status_code=401, detail="Not Authorized")
 
-    session_data = {"user_id": user.id, "user_type": user.user_type}
+    # 비용 인자(cost factor)가 변경된 경우 로그인 시점에 새 비용으로 재해싱
+    if user_service.needs_rehash(hashed_password=user.password):
+        await user_repo.update_password(
+            user_id=user.id,
+            hashed_password=await user_service.hash_password(request.password),
+        )
+
+    session_data = build_session_data(user=user)
     session_id = await session_service.create_session(session_data=session_data)
 
     response = JSONResponse(content={"message": "Login successful"})
@@ -112,16 +130,12 @@ async def login_user_handler(
 
 
 async def logout_user_handler(
-    session_id: str = Cookie(None), session_service: SessionService = Depends()
+    user: AuthenticatedUser = Depends(get_current_user),
+    session_service: SessionService = Depends(),
 ) -> JSONResponse:
-    if not session_id:
-        raise HTTPException(status_code=400, detail="Missing Session ID")
-
-    session_data = await session_service.get_session(session_id)
-    if not session_data:
-        raise HTTPException(status_code=404, detail="Session Not Found")
-
-    await session_service.delete_session(session_id)
+    await session_service.delete_session(
+        session_id=user.session_id, user_id=user.user_id
+    )
 
     response = JSONResponse(content={"message": "Logout successful"})
     response.delete_cookie(key="session_id")
@@ -129,19 +143,12 @@ async def logout_user_handler(
 
 
 async def get_user_info_handler(
-    session_id: str = Cookie(None),
-    session_service: SessionService = Depends(),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     user_repo: UserRepository = Depends(),
 ) -> GetSellerInfoResponse | GetBuyerInfoResponse:
-    if not session_id:
-        raise HTTPException(status_code=400, detail="Missing Session ID")
-
-    session_data = await session_service.get_session(session_id)
-    if not session_data:
-        raise HTTPException(status_code=404, detail="Session Not Found")
-
-    user_id = session_data["user_id"]
-    user: User = await user_repo.get_user_by_id(user_id=user_id)
+    user: User = await user_repo.get_user_by_id(
+        user_id=current_user.user_id, read_only=True
+    )
     if not user:
         raise HTTPException(status_code=404, detail="User Not Found")
 
@@ -1,12 +1,110 @@
 import os
+import re
 
-from pydantic import Field
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
 
 
 class DatabaseConfig(BaseSettings):
     url: str = Field(default=os.getenv("DATABASE_URL"), alias="DATABASE_URL")
     echo: bool = Field(default=os.getenv("DATABASE_ECHO"), alias="DATABASE_ECHO")
+    # 읽기 전용 복제본 URL, 빈 값이면 모든 조회를 기본 DB에서 처리
+    replica_url: str = Field(
+        default=os.getenv("DATABASE_REPLICA_URL", ""), alias="DATABASE_REPLICA_URL"
+    )
+    # queue | static | null, 빈 값이면 URL에 따라 자동 선택
+    pool_class: str = Field(
+        default=os.getenv("DATABASE_POOL_CLASS", ""), alias="DATABASE_POOL_CLASS"
+    )
+    pool_size: int = Field(
+        default=os.getenv("DATABASE_POOL_SIZE", 10), alias="DATABASE_POOL_SIZE"
+    )
+    max_overflow: int = Field(
+        default=os.getenv("DATABASE_MAX_OVERFLOW", 20), alias="DATABASE_MAX_OVERFLOW"
+    )
+    pool_pre_ping: bool = Field(
+        default=os.getenv("DATABASE_POOL_PRE_PING", True),
+        alias="DATABASE_POOL_PRE_PING",
+    )
+    pool_recycle: int = Field(
+        default=os.getenv("DATABASE_POOL_RECYCLE", 1800), alias="DATABASE_POOL_RECYCLE"
+    )
+    pool_timeout: float = Field(
+        default=os.getenv("DATABASE_POOL_TIMEOUT", 30), alias="DATABASE_POOL_TIMEOUT"
+    )
+
+
+class QueryConfig(BaseSettings):
+    slow_query_ms: float = Field(
+        default=os.getenv("SLOW_QUERY_MS", 200), alias="SLOW_QUERY_MS"
+    )
+    # 한 요청에서 같은 형태의 쿼리가 이 횟수를 넘으면 N+1로 판단
+    n_plus_one_threshold: int = Field(
+        default=os.getenv("N_PLUS_ONE_THRESHOLD", 10), alias="N_PLUS_ONE_THRESHOLD"
+    )
+    # raise | warn | off
+    n_plus_one_action: str = Field(
+        default=os.getenv("N_PLUS_ONE_ACTION", "off"), alias="N_PLUS_ONE_ACTION"
+    )
+
+
+class TimingConfig(BaseSettings):
+    # Server-Timing 헤더와 접근 로그를 남길 요청의 비율 (0.0 ~ 1.0)
+    sample_rate: float = Field(
+        default=os.getenv("TIMING_SAMPLE_RATE", 0.1), alias="TIMING_SAMPLE_RATE"
+    )
+
+
+class MetricsConfig(BaseSettings):
+    # 워커 프로세스별 메트릭 스냅샷을 Redis에 저장하는 주기(초)
+    publish_interval: int = Field(
+        default=os.getenv("METRICS_PUBLISH_INTERVAL", 15),
+        alias="METRICS_PUBLISH_INTERVAL",
+    )
+    # 이 시간(초) 동안 갱신되지 않은 워커의 스냅샷은 종료된 것으로 보고 제외
+    process_ttl: int = Field(
+        default=os.getenv("METRICS_PROCESS_TTL", 60), alias="METRICS_PROCESS_TTL"
+    )
+    loop_lag_interval: float = Field(
+        default=os.getenv("EVENT_LOOP_LAG_INTERVAL", 0.5),
+        alias="EVENT_LOOP_LAG_INTERVAL",
+    )
+    # 루프가 이 시간(초) 이상 늦게 깨어나면 블로킹으로 보고 스택을 수집
+    loop_block_threshold: float = Field(
+        default=os.getenv("EVENT_LOOP_BLOCK_THRESHOLD", 0.1),
+        alias="EVENT_LOOP_BLOCK_THRESHOLD",
+    )
+
+
+class ReadinessConfig(BaseSettings):
+    # 점검 결과를 재사용하는 시간(초)
+    cache_ttl: float = Field(
+        default=os.getenv("READINESS_CACHE_TTL", 2), alias="READINESS_CACHE_TTL"
+    )
+    probe_timeout: float = Field(
+        default=os.getenv("READINESS_PROBE_TIMEOUT", 1), alias="READINESS_PROBE_TIMEOUT"
+    )
+
+
+class WarmupConfig(BaseSettings):
+    # 기동 시 DB, Redis, Elasticsearch마다 미리 열어 둘 커넥션 수, 0이면 캐시만 적재
+    connections: int = Field(
+        default=os.getenv("WARMUP_CONNECTIONS", 4), alias="WARMUP_CONNECTIONS"
+    )
+    # 단계별 제한 시간(초), 넘기면 해당 단계를 건너뛰고 기동을 계속
+    timeout: float = Field(
+        default=os.getenv("WARMUP_TIMEOUT", 5), alias="WARMUP_TIMEOUT"
+    )
+
+
+class ProfilerConfig(BaseSettings):
+    # 내부 디버그 API 인증 토큰, 빈 값이면 디버그 API를 사용하지 않음
+    token: str = Field(
+        default=os.getenv("DEBUG_API_TOKEN", ""), alias="DEBUG_API_TOKEN"
+    )
+    max_seconds: float = Field(
+        default=os.getenv("PROFILER_MAX_SECONDS", 60), alias="PROFILER_MAX_SECONDS"
+    )
 
 
 class CORSConfig(BaseSettings):
@@ -32,6 +130,100 @@ class RedisConfig(BaseSettings):
     task_db: str = Field(default=os.getenv("REDIS_TASK_DB"), alias="REDIS_TASK_DB")
 
 
+class PasswordConfig(BaseSettings):
+    bcrypt_rounds: int = Field(
+        default=os.getenv("BCRYPT_ROUNDS", 12), alias="BCRYPT_ROUNDS"
+    )
+    hash_workers: int = Field(
+        default=os.getenv("PASSWORD_HASH_WORKERS", 4), alias="PASSWORD_HASH_WORKERS"
+    )
+
+
+class RateLimitConfig(BaseSettings):
+    # "<요청 수>/<초>" 형식, 빈 값이면 제한하지 않음
+    login_ip: str = Field(
+        default=os.getenv("RATE_LIMIT_LOGIN_IP", "20/60"), alias="RATE_LIMIT_LOGIN_IP"
+    )
+    login_email: str = Field(
+        default=os.getenv("RATE_LIMIT_LOGIN_EMAIL", "5/60"),
+        alias="RATE_LIMIT_LOGIN_EMAIL",
+    )
+    search: str = Field(
+        default=os.getenv("RATE_LIMIT_SEARCH", "10/1"), alias="RATE_LIMIT_SEARCH"
+    )
+    search_ip: str = Field(
+        default=os.getenv("RATE_LIMIT_SEARCH_IP", "30/1"), alias="RATE_LIMIT_SEARCH_IP"
+    )
+    es_concurrency: int = Field(
+        default=os.getenv("ES_MAX_CONCURRENCY", 64), alias="ES_MAX_CONCURRENCY"
+    )
+
+    @field_validator("login_ip", "login_email", "search", "search_ip")
+    @classmethod
+    def validate_rule(cls, rule: str) -> str:
+        # 잘못된 규칙이 요청마다 500 오류로 이어지지 않도록 기동 시점에 거부
+        rule = rule.strip()
+        if rule and not re.fullmatch(r"[1-9]\d*/[1-9]\d*", rule):
+            raise ValueError(f"Rate limit rule must be '<requests>/<seconds>': {rule}")
+        return rule
+
+
+class CategoryConfig(BaseSettings):
+    cache_ttl: int = Field(
+        default=os.getenv("CATEGORY_CACHE_TTL", 300), alias="CATEGORY_CACHE_TTL"
+    )
+    # 캐시에 없는 카테고리로 트리를 다시 불러온 뒤 이 시간(초) 동안은 다시 불러오지 않음
+    miss_reload_interval: float = Field(
+        default=os.getenv("CATEGORY_MISS_RELOAD_INTERVAL", 1),
+        alias="CATEGORY_MISS_RELOAD_INTERVAL",
+    )
+
+
+class SyncConfig(BaseSettings):
+    interval: int = Field(
+        default=os.getenv("PRODUCT_SYNC_INTERVAL", 60), alias="PRODUCT_SYNC_INTERVAL"
+    )
+    chunk_size: int = Field(
+        default=os.getenv("PRODUCT_SYNC_CHUNK_SIZE", 1000),
+        alias="PRODUCT_SYNC_CHUNK_SIZE",
+    )
+    # 커밋 지연으로 누락되는 변경분이 없도록 워터마크 이전 구간을 다시 확인
+    overlap: int = Field(
+        default=os.getenv("PRODUCT_SYNC_OVERLAP", 5), alias="PRODUCT_SYNC_OVERLAP"
+    )
+
+
+class ImportConfig(BaseSettings):
+    batch_size: int = Field(
+        default=os.getenv("PRODUCT_IMPORT_BATCH_SIZE", 500),
+        alias="PRODUCT_IMPORT_BATCH_SIZE",
+    )
+    # 작업 상태에 저장하는 행별 오류의 최대 개수
+    max_errors: int = Field(
+        default=os.getenv("PRODUCT_IMPORT_MAX_ERRORS", 100),
+        alias="PRODUCT_IMPORT_MAX_ERRORS",
+    )
+    job_ttl: int = Field(
+        default=os.getenv("PRODUCT_IMPORT_JOB_TTL", 86400),
+        alias="PRODUCT_IMPORT_JOB_TTL",
+    )
+    # 업로드 파일 최대 크기(바이트)
+    max_file_size: int = Field(
+        default=os.getenv("PRODUCT_IMPORT_MAX_FILE_SIZE", 10 * 1024 * 1024),
+        alias="PRODUCT_IMPORT_MAX_FILE_SIZE",
+    )
+    # 행별 재고 수량 상한, 재고는 수량만큼 행을 만들므로 한 행이 거대한 INSERT가 되지 않도록 제한
+    max_quantity: int = Field(
+        default=os.getenv("PRODUCT_IMPORT_MAX_QUANTITY", 10000),
+        alias="PRODUCT_IMPORT_MAX_QUANTITY",
+    )
+    # 재고 다중 행 INSERT 한 번에 저장하는 최대 행 수
+    stock_chunk_size: int = Field(
+        default=os.getenv("PRODUCT_IMPORT_STOCK_CHUNK_SIZE", 1000),
+        alias="PRODUCT_IMPORT_STOCK_CHUNK_SIZE",
+    )
+
+
 class ElasticsearchConfig(BaseSettings):
     host: str = Field(
         default=os.getenv("ELASTICSEARCH_HOST"), alias="ELASTICSEARCH_HOST"
@@ -48,7 +240,18 @@ class ElasticsearchConfig(BaseSettings):
 
 
 db = DatabaseConfig()
+query = QueryConfig()
+timing = TimingConfig()
+metrics = MetricsConfig()
+readiness = ReadinessConfig()
+warmup = WarmupConfig()
+profiler = ProfilerConfig()
 cors = CORSConfig()
 web = WebConfig()
 redis = RedisConfig()
 es = ElasticsearchConfig()
+password = PasswordConfig()
+rate_limit = RateLimitConfig()
+category = CategoryConfig()
+sync = SyncConfig()
+product_import = ImportConfig()
@@ -1,19 +1,169 @@
-from sqlalchemy.ext.asyncio import create_async_engine
-from sqlmodel import SQLModel, pool
+import time
+from typing import Optional
+
+from sqlalchemy import exc, pool
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
 
 from src import config
+from src.instrumentation import instrument_engine
+
+# 동기 드라이버 URL을 비동기 드라이버로 변환
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+# 대량 등록 시 INSERT ... RETURNING 순서 보장(sort_by_parameter_order)이 필요하므로 지원하지 않음
+UNSUPPORTED_BACKENDS = ("mysql", "mariadb")
+
+
+class PoolMetrics:
+    def __init__(self):
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record_checkout(self, wait_seconds: float) -> None:
+        self.checkouts += 1
+        self.wait_seconds_total += wait_seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+
+
+class InstrumentedQueuePool(pool.AsyncAdaptedQueuePool):
+    """커넥션 체크아웃 대기 시간(pre-ping 포함)을 기록하는 커넥션 풀"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.metrics.checkout_timeouts += 1
+            raise
+        finally:
+            self.metrics.record_checkout(time.perf_counter() - start)
+
+
+def build_database_url(url: str) -> str:
+    database_url = make_url(url)
+    if database_url.get_backend_name() in UNSUPPORTED_BACKENDS:
+        raise ValueError(
+            f"Unsupported database backend: {database_url.get_backend_name()} "
+            "(INSERT ... RETURNING is required; use sqlite or postgresql)"
+        )
+    if database_url.drivername in ASYNC_DRIVERS:
+        database_url = database_url.set(
+            drivername=ASYNC_DRIVERS[database_url.drivername]
+        )
+    return database_url.render_as_string(hide_password=False)
+
+
+def build_engine_options(db_config: config.DatabaseConfig, url: str) -> dict:
+    database_url = make_url(build_database_url(url))
+    pool_class = db_config.pool_class
+    if not pool_class:
+        # 인메모리 SQLite는 커넥션마다 DB가 분리되므로 단일 커넥션을 공유해야 함
+        is_memory_sqlite = database_url.get_backend_name() == "sqlite" and (
+            database_url.database in (None, "", ":memory:")
+        )
+        pool_class = "static" if is_memory_sqlite else "queue"
+
+    options = {
+        "echo": db_config.echo,
+        "pool_pre_ping": db_config.pool_pre_ping,
+        "pool_recycle": db_config.pool_recycle,
+    }
+    if pool_class == "queue":
+        options.update(
+            poolclass=InstrumentedQueuePool,
+            pool_size=db_config.pool_size,
+            max_overflow=db_config.max_overflow,
+            pool_timeout=db_config.pool_timeout,
+        )
+    elif pool_class == "static":
+        options.update(poolclass=pool.StaticPool)
+    elif pool_class == "null":
+        options.update(poolclass=pool.NullPool)
+    else:
+        raise ValueError(f"Unsupported DATABASE_POOL_CLASS: {pool_class}")
+
+    return options
+
+
+def create_engine_from_url(url: str) -> AsyncEngine:
+    created_engine = create_async_engine(
+        build_database_url(url), **build_engine_options(config.db, url)
+    )
+    instrument_engine(created_engine)
+    return created_engine
+
+
+# 엔진은 처음 사용할 때 생성 (import 시점에 드라이버 로딩이나 커넥션 풀 생성을 하지 않음)
+_engine: Optional[AsyncEngine] = None
+_read_engine: Optional[AsyncEngine] = None
+
+
+def get_engine() -> AsyncEngine:
+    global _engine
+    if _engine is None:
+        _engine = create_engine_from_url(config.db.url)
+    return _engine
+
+
+def get_read_engine() -> AsyncEngine:
+    """읽기 전용 복제본 엔진을 반환합니다. 복제본이 설정되지 않으면 기본 엔진을 그대로 사용합니다."""
+    global _read_engine
+    if _read_engine is None:
+        _read_engine = (
+            create_engine_from_url(config.db.replica_url)
+            if config.db.replica_url
+            else get_engine()
+        )
+    return _read_engine
+
+
+def get_pool_status(target_engine: Optional[AsyncEngine] = None) -> dict:
+    target_engine = target_engine or get_engine()
+    engine_pool = target_engine.pool
+    status = {"pool_class": type(engine_pool).__name__}
+
+    metrics: PoolMetrics | None = getattr(engine_pool, "metrics", None)
+    if metrics:
+        status.update(
+            checkouts=metrics.checkouts,
+            checkout_timeouts=metrics.checkout_timeouts,
+            checkout_wait_seconds_total=metrics.wait_seconds_total,
+            checkout_wait_seconds_max=metrics.wait_seconds_max,
+        )
+
+    if isinstance(engine_pool, pool.QueuePool):
+        capacity = engine_pool.size() + max(engine_pool._max_overflow, 0)
+        status.update(
+            size=engine_pool.size(),
+            checked_in=engine_pool.checkedin(),
+            checked_out=engine_pool.checkedout(),
+            overflow=engine_pool.overflow(),
+            utilization=engine_pool.checkedout() / capacity if capacity else 0.0,
+        )
 
-engine = create_async_engine(
-    config.db.url,
-    echo=config.db.echo,
-    poolclass=pool.StaticPool,
-)
+    return status
 
 
 async def create_db_and_tables() -> None:
-    async with engine.begin() as conn:
+    async with get_engine().begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
 
 
 async def close_db() -> None:
-    await engine.dispose()
+    global _engine, _read_engine
+    if _read_engine is not None and _read_engine is not _engine:
+        await _read_engine.dispose()
+    if _engine is not None:
+        await _engine.dispose()
+    # 종료 후 다시 사용하면 새 엔진을 생성
+    _engine = _read_engine = None
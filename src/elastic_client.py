@@ -1,14 +1,45 @@
+import time
+from typing import Optional
+
 from elasticsearch import AsyncElasticsearch
 
 from src.config import es as es_config
+from src.instrumentation import current_timings, record_timing
+
+
+class TimedAsyncElasticsearch(AsyncElasticsearch):
+    """요청별 Elasticsearch 호출 소요 시간을 Server-Timing에 합산하는 클라이언트"""
+
+    async def perform_request(self, *args, **kwargs):
+        if current_timings.get() is None:
+            return await super().perform_request(*args, **kwargs)
 
-es_client = AsyncElasticsearch(
-    hosts=[es_config.host],
-    http_auth=(es_config.username, es_config.password),
-    ca_certs=es_config.ca_certs,
-    verify_certs=True,
-)
+        start = time.perf_counter()
+        try:
+            return await super().perform_request(*args, **kwargs)
+        finally:
+            record_timing("es", time.perf_counter() - start)
+
+
+# 클라이언트는 처음 사용할 때 생성 (TLS 컨텍스트 생성, 인증서 로딩을 import 시점에 하지 않음)
+_es_client: Optional[AsyncElasticsearch] = None
 
 
 def get_elasticsearch_client() -> AsyncElasticsearch:
-    return es_client
+    global _es_client
+    if _es_client is None:
+        _es_client = TimedAsyncElasticsearch(
+            hosts=[es_config.host],
+            http_auth=(es_config.username, es_config.password),
+            # CA 인증서를 비워 두면 TLS 없이 http로 접속 (로컬 개발, 벤치마크용 대체 서버)
+            ca_certs=es_config.ca_certs or None,
+            verify_certs=True,
+        )
+    return _es_client
+
+
+async def close_elasticsearch_client() -> None:
+    global _es_client
+    if _es_client is not None:
+        await _es_client.close()
+    _es_client = None
@@ -0,0 +1,230 @@
+import hashlib
+import json
+import random
+import time
+import warnings
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+
+from src.config import query as query_config
+from src.config import timing as timing_config
+
+
+class NPlusOneQueryError(RuntimeError):
+    pass
+
+
+class NPlusOneQueryWarning(UserWarning):
+    pass
+
+
+def fingerprint_parameters(parameters) -> str:
+    """바인딩 값을 그대로 남기지 않고 같은 값으로 실행된 쿼리인지 구분할 수 있는 해시"""
+    return hashlib.sha1(repr(parameters).encode()).hexdigest()[:12]
+
+
+class QueryStats:
+    """요청 하나에서 실행된 SQL의 개수, 총 실행 시간, 느린 쿼리를 기록합니다."""
+
+    def __init__(self, parent: Optional["QueryStats"] = None, slowest_limit: int = 5):
+        self.parent = parent
+        self.slowest_limit = slowest_limit
+        self.count = 0
+        self.total_seconds = 0.0
+        # 같은 형태(바인딩 전 SQL)의 쿼리가 실행된 횟수
+        self.statement_counts: dict = {}
+        self.slowest: List[Tuple[float, str]] = []
+
+    def record(self, statement: str, seconds: float) -> int:
+        self.count += 1
+        self.total_seconds += seconds
+        self.statement_counts[statement] = self.statement_counts.get(statement, 0) + 1
+
+        if len(self.slowest) < self.slowest_limit or seconds > self.slowest[-1][0]:
+            self.slowest.append((seconds, statement))
+            self.slowest.sort(key=lambda item: item[0], reverse=True)
+            del self.slowest[self.slowest_limit :]
+
+        if self.parent is not None:
+            self.parent.record(statement, seconds)
+        return self.statement_counts[statement]
+
+
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+class RequestTimings:
+    """요청 하나에서 외부 의존성(db, redis, es)별로 소요된 시간과 호출 횟수를 합산합니다."""
+
+    def __init__(self):
+        self.totals: dict = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        total = self.totals.setdefault(name, [0.0, 0])
+        total[0] += seconds
+        total[1] += 1
+
+    def to_dict(self) -> dict:
+        return {
+            name: {"ms": round(seconds * 1000, 2), "count": count}
+            for name, (seconds, count) in self.totals.items()
+        }
+
+    def to_server_timing(self, total_seconds: float) -> str:
+        metrics = [
+            f'{name};dur={seconds * 1000:.1f};desc="{count} calls"'
+            for name, (seconds, count) in self.totals.items()
+        ]
+        metrics.append(f"total;dur={total_seconds * 1000:.1f}")
+        return ", ".join(metrics)
+
+
+# 샘플링되지 않은 요청에서는 None이므로 계측 비용이 거의 없음
+current_timings: ContextVar[Optional[RequestTimings]] = ContextVar(
+    "current_timings", default=None
+)
+
+
+def record_timing(name: str, seconds: float) -> None:
+    timings = current_timings.get()
+    if timings is not None:
+        timings.add(name, seconds)
+
+
+@contextmanager
+def capture_queries() -> Iterator[QueryStats]:
+    """블록 안에서 실행된 쿼리를 집계합니다. 테스트에서 API별 쿼리 수 한도를 검증할 때 사용합니다."""
+    stats = QueryStats(parent=current_query_stats.get())
+    token = current_query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        current_query_stats.reset(token)
+
+
+def check_n_plus_one(statement: str, count: int) -> None:
+    if count != query_config.n_plus_one_threshold + 1:
+        return
+
+    message = (
+        f"Same statement executed more than {query_config.n_plus_one_threshold} "
+        f"times in one request: {statement}"
+    )
+    if query_config.n_plus_one_action == "raise":
+        raise NPlusOneQueryError(message)
+    if query_config.n_plus_one_action == "warn":
+        warnings.warn(message, NPlusOneQueryWarning, stacklevel=2)
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # 실패한 쿼리는 after_cursor_execute가 호출되지 않으므로 커넥션이 아닌 실행 단위(context)에 저장
+    if context is not None:
+        context.query_start = time.perf_counter()
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "query_start", None)
+    if start is None:
+        return
+
+    seconds = time.perf_counter() - start
+    record_timing("db", seconds)
+
+    if seconds * 1000 >= query_config.slow_query_ms:
+        print(
+            f"Slow query ({seconds * 1000:.1f}ms, "
+            f"params={fingerprint_parameters(parameters)}): {statement}"
+        )
+
+    stats = current_query_stats.get()
+    if stats is None:
+        return
+
+    count = stats.record(statement, seconds)
+    check_n_plus_one(statement, count)
+
+
+def instrument_engine(target_engine: AsyncEngine) -> None:
+    event.listen(
+        target_engine.sync_engine, "before_cursor_execute", before_cursor_execute
+    )
+    event.listen(
+        target_engine.sync_engine, "after_cursor_execute", after_cursor_execute
+    )
+
+
+class QueryStatsMiddleware:
+    """요청마다 쿼리 집계를 시작하고, DB 시간이 긴 요청은 요약을 남기는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with capture_queries() as stats:
+            await self.app(scope, receive, send)
+
+        if stats.total_seconds * 1000 >= query_config.slow_query_ms:
+            slowest = ", ".join(
+                f"{seconds * 1000:.1f}ms {statement[:80]!r}"
+                for seconds, statement in stats.slowest
+            )
+            print(
+                f"Slow request {scope['method']} {scope['path']}: "
+                f"{stats.count} queries, {stats.total_seconds * 1000:.1f}ms "
+                f"(slowest: {slowest})"
+            )
+
+
+class ServerTimingMiddleware:
+    """샘플링된 요청에 Server-Timing 헤더를 추가하고 의존성별 시간을 접근 로그로 남기는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or random.random() >= timing_config.sample_rate:
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = current_timings.set(timings)
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_server_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    timings.to_server_timing(time.perf_counter() - start),
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_server_timing)
+        finally:
+            current_timings.reset(token)
+            print(
+                json.dumps(
+                    {
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "status": status_code,
+                        "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+                        **timings.to_dict(),
+                    }
+                )
+            )
@@ -0,0 +1,150 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Callable, List, Optional
+
+from src.config import metrics as metrics_config
+
+
+class EventLoopMonitor:
+    """이벤트 루프의 스케줄링 지연을 측정하고, 루프를 오래 점유한 코드의 스택을 수집합니다.
+
+    루프 안의 태스크가 주기적으로 깨어나며 지연을 기록하고, 별도 감시 스레드는 예정된 시각이
+    임계값 이상 지나도 루프가 깨어나지 않으면 그 순간의 루프 스레드 스택을 캡처합니다.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        block_threshold: float,
+        window: int = 1024,
+        max_offenders: int = 10,
+        stack_limit: int = 20,
+    ):
+        self.interval = interval
+        self.block_threshold = block_threshold
+        self.max_offenders = max_offenders
+        self.stack_limit = stack_limit
+        self.samples: deque = deque(maxlen=window)
+        self.blocked_count = 0
+        # 스택 요약 -> {"count", "max_seconds", "total_seconds", "stack"}
+        self.offenders: dict = {}
+        self.sample_listeners: List[Callable[[float], None]] = []
+
+        self.loop_thread_id: Optional[int] = None
+        self.deadline: Optional[float] = None
+        self.captured_stack: Optional[List[str]] = None
+        self.stopped = threading.Event()
+
+    def capture_loop_stack(self) -> Optional[List[str]]:
+        frame = sys._current_frames().get(self.loop_thread_id)
+        if frame is None:
+            return None
+        return traceback.format_list(
+            traceback.extract_stack(frame)[-self.stack_limit :]
+        )
+
+    def watch(self) -> None:
+        """감시 스레드: 루프가 예정 시각을 넘겨서도 깨어나지 못하면 스택을 캡처합니다."""
+        while not self.stopped.wait(self.block_threshold / 2):
+            deadline = self.deadline
+            if (
+                deadline is not None
+                and self.captured_stack is None
+                and time.monotonic() - deadline > self.block_threshold
+            ):
+                self.captured_stack = self.capture_loop_stack()
+
+    def record_block(self, lag: float) -> None:
+        self.blocked_count += 1
+        stack = self.captured_stack or ["<stack not captured>\n"]
+        key = "".join(stack)
+
+        offender = self.offenders.get(key)
+        if offender is None:
+            offender = self.offenders[key] = {
+                "count": 0,
+                "max_seconds": 0.0,
+                "total_seconds": 0.0,
+                "stack": stack,
+            }
+        offender["count"] += 1
+        offender["total_seconds"] += lag
+        offender["max_seconds"] = max(offender["max_seconds"], lag)
+
+        # 가장 오래 점유한 스택만 유지
+        if len(self.offenders) > self.max_offenders:
+            smallest = min(
+                self.offenders, key=lambda k: self.offenders[k]["max_seconds"]
+            )
+            del self.offenders[smallest]
+
+        print(f"Event loop blocked for {lag * 1000:.1f}ms at:\n{''.join(stack)}")
+
+    async def run(self) -> None:
+        self.loop_thread_id = threading.get_ident()
+        self.stopped.clear()
+        threading.Thread(
+            target=self.watch, name="event-loop-watchdog", daemon=True
+        ).start()
+
+        try:
+            while True:
+                self.captured_stack = None
+                # 감시 스레드와 같은 시계를 사용
+                self.deadline = time.monotonic() + self.interval
+                await asyncio.sleep(self.interval)
+                lag = max(time.monotonic() - self.deadline, 0.0)
+                self.deadline = None
+
+                self.samples.append(lag)
+                for listener in self.sample_listeners:
+                    listener(lag)
+                if lag >= self.block_threshold:
+                    self.record_block(lag)
+        finally:
+            self.stopped.set()
+            # 종료 시 워커 수명 동안 루프를 가장 오래 점유한 스택을 요약하여 남김
+            self.log_worst_offenders()
+
+    def percentiles(self, quantiles=(0.5, 0.9, 0.99)) -> dict:
+        samples = sorted(self.samples)
+        if not samples:
+            return {}
+
+        result = {
+            str(q): samples[min(int(q * len(samples)), len(samples) - 1)]
+            for q in quantiles
+        }
+        result["max"] = samples[-1]
+        return result
+
+    def worst_offenders(self) -> List[dict]:
+        return sorted(
+            self.offenders.values(), key=lambda o: o["max_seconds"], reverse=True
+        )
+
+    def log_worst_offenders(self) -> None:
+        offenders = self.worst_offenders()
+        if not offenders:
+            return
+
+        lines = [
+            f"{rank}. max={o['max_seconds'] * 1000:.1f}ms "
+            f"total={o['total_seconds'] * 1000:.1f}ms count={o['count']}\n"
+            f"{''.join(o['stack'][-1:])}"
+            for rank, o in enumerate(offenders, 1)
+        ]
+        print(
+            f"Event loop blocked {self.blocked_count} times, worst offenders:\n"
+            + "".join(lines)
+        )
+
+
+event_loop_monitor = EventLoopMonitor(
+    interval=metrics_config.loop_lag_interval,
+    block_threshold=metrics_config.loop_block_threshold,
+)
@@ -11,8 +11,14 @@ from src.apis.common import common_router
 from src.apis.store import store_router
 from src.apis.user import user_router
 from src.database import close_db, create_db_and_tables
-from src.redis_client import get_task_redis_client
+from src.elastic_client import close_elasticsearch_client
+from src.instrumentation import QueryStatsMiddleware, ServerTimingMiddleware
+from src.loop_monitor import event_loop_monitor
+from src.metrics import MetricsMiddleware, run_metrics_publisher_periodically
+from src.redis_client import close_redis_clients, get_task_redis_client
 from src.service.background_task import process_tasks
+from src.service.sync import run_product_sync_periodically
+from src.service.warmup import warm_up
 
 
 async def create_consumer_group(stream_name: str, group_name: str):
@@ -26,15 +32,20 @@ async def create_consumer_group(stream_name: str, group_name: str):
 
 
 async def stop_background_tasks(app: FastAPI):
-    task = app.state.stream_task
-    if task:
-        task.cancel()
-        try:
-            await task
-        except asyncio.CancelledError:
-            pass
-        except Exception as e:
-            print(f"Error occurred while canceling task: {e}")
+    for task in (
+        app.state.stream_task,
+        app.state.sync_task,
+        app.state.loop_lag_task,
+        app.state.metrics_task,
+    ):
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                print(f"Error occurred while canceling task: {e}")
 
 
 @asynccontextmanager
@@ -42,6 +53,9 @@ async def lifespan(app: FastAPI):
     # DB 및 테이블 생성
     await create_db_and_tables()
 
+    # 커넥션 풀을 미리 열고 카테고리 트리 등 메모리 캐시 적재
+    await warm_up()
+
     # 상품 정보 동기화
     # await sync_all_products()
 
@@ -52,17 +66,31 @@ async def lifespan(app: FastAPI):
     loop = asyncio.get_event_loop()
     app.state.stream_task = loop.create_task(process_tasks())
 
+    # 변경된 상품 정보 주기적 동기화
+    app.state.sync_task = loop.create_task(run_product_sync_periodically())
+
+    # 이벤트 루프 지연 및 블로킹 호출 감시, 워커별 메트릭 스냅샷 공유
+    app.state.loop_lag_task = loop.create_task(event_loop_monitor.run())
+    app.state.metrics_task = loop.create_task(
+        run_metrics_publisher_periodically(get_task_redis_client())
+    )
+
     yield
 
     await stop_background_tasks(app)
 
     await close_db()
+    await close_redis_clients()
+    await close_elasticsearch_client()
 
 
 app = FastAPI(lifespan=lifespan)
 app.include_router(common_router)
 app.include_router(store_router)
 app.include_router(user_router)
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(ServerTimingMiddleware)
+app.add_middleware(MetricsMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=config.cors.origins.split(","),
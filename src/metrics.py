@@ -0,0 +1,394 @@
+import asyncio
+import bisect
+import json
+import os
+import time
+from typing import Callable, Dict, List, Tuple
+
+from src.config import metrics as metrics_config
+from src.database import get_engine, get_pool_status, get_read_engine
+from src.elastic_client import get_elasticsearch_client
+from src.loop_monitor import event_loop_monitor
+from src.redis_client import get_redis_client, get_task_redis_client
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRICS_PROCESSES_KEY = "metrics:processes"
+
+LabelValues = Tuple[str, ...]
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        self.values[labelvalues] = self.values.get(labelvalues, 0.0) + amount
+
+    def snapshot(self) -> dict:
+        return {
+            "type": "counter",
+            "help": self.documentation,
+            "labelnames": list(self.labelnames),
+            "samples": [[list(labels), value] for labels, value in self.values.items()],
+        }
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...],
+        buckets: Tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = buckets
+        # 라벨별 [버킷별 개수..., +Inf 개수, 합계]
+        self.values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        counts = self.values.get(labelvalues)
+        if counts is None:
+            counts = self.values[labelvalues] = [0] * (len(self.buckets) + 2)
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def snapshot(self) -> dict:
+        return {
+            "type": "histogram",
+            "help": self.documentation,
+            "labelnames": list(self.labelnames),
+            "buckets": list(self.buckets),
+            "samples": [
+                [list(labels), counts] for labels, counts in self.values.items()
+            ],
+        }
+
+
+class MetricsRegistry:
+    """프로세스 내 메트릭을 보관하고 Prometheus 텍스트 형식으로 내보냅니다."""
+
+    def __init__(self):
+        self.metrics: Dict[str, object] = {}
+        # 수집 시점에 값을 읽는 게이지: 이름 -> (설명, 라벨 이름, 콜백)
+        self.gauges: Dict[str, Tuple[str, Tuple[str, ...], Callable]] = {}
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        self.metrics[name] = Counter(name, documentation, tuple(labelnames))
+        return self.metrics[name]
+
+    def histogram(self, name: str, documentation: str, labelnames=()) -> Histogram:
+        self.metrics[name] = Histogram(name, documentation, tuple(labelnames))
+        return self.metrics[name]
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...],
+        collect: Callable[[], List[Tuple[LabelValues, float]]],
+    ) -> None:
+        self.gauges[name] = (documentation, tuple(labelnames), collect)
+
+    def snapshot(self) -> dict:
+        snapshot = {name: metric.snapshot() for name, metric in self.metrics.items()}
+        for name, (documentation, labelnames, collect) in self.gauges.items():
+            try:
+                samples = collect()
+            except Exception as e:
+                print(f"Error collecting metric {name}: {e}")
+                continue
+            snapshot[name] = {
+                "type": "gauge",
+                "help": documentation,
+                "labelnames": list(labelnames),
+                "samples": [[list(labels), value] for labels, value in samples],
+            }
+        return snapshot
+
+
+def merge_snapshots(snapshots: Dict[str, dict]) -> dict:
+    """워커 프로세스별 스냅샷을 합칩니다. 카운터와 히스토그램은 더하고 게이지는 pid 라벨로 구분합니다."""
+    merged: dict = {}
+    for pid, snapshot in snapshots.items():
+        for name, metric in snapshot.items():
+            target = merged.setdefault(
+                name,
+                {
+                    **metric,
+                    "labelnames": metric["labelnames"]
+                    + (["pid"] if metric["type"] == "gauge" else []),
+                    "samples": {},
+                },
+            )
+            for labels, value in metric["samples"]:
+                if metric["type"] == "gauge":
+                    target["samples"][tuple(labels) + (pid,)] = value
+                elif metric["type"] == "counter":
+                    key = tuple(labels)
+                    target["samples"][key] = target["samples"].get(key, 0) + value
+                else:
+                    key = tuple(labels)
+                    current = target["samples"].get(key, [0] * len(value))
+                    target["samples"][key] = [a + b for a, b in zip(current, value)]
+    return merged
+
+
+def format_labels(labelnames: List[str], labels: tuple, extra: str = "") -> str:
+    pairs = [
+        f'{name}="{str(value)}"'.replace("\n", " ")
+        for name, value in zip(labelnames, labels)
+    ]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def render(merged: dict) -> str:
+    lines = []
+    for name, metric in sorted(merged.items()):
+        lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        labelnames = metric["labelnames"]
+        for labels, value in metric["samples"].items():
+            if metric["type"] != "histogram":
+                lines.append(f"{name}{format_labels(labelnames, labels)} {value}")
+                continue
+
+            cumulative = 0
+            for bound, count in zip(metric["buckets"] + ["+Inf"], value[:-1]):
+                cumulative += count
+                le = f'le="{bound}"'
+                lines.append(
+                    f"{name}_bucket{format_labels(labelnames, labels, le)} {cumulative}"
+                )
+            lines.append(
+                f"{name}_count{format_labels(labelnames, labels)} {cumulative}"
+            )
+            lines.append(f"{name}_sum{format_labels(labelnames, labels)} {value[-1]}")
+    return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests_total = registry.counter(
+    "http_requests_total",
+    "HTTP requests by route and status",
+    ("method", "route", "status"),
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route",
+    ("method", "route"),
+)
+event_loop_lag_seconds = registry.histogram(
+    "event_loop_lag_seconds", "Delay of scheduled event loop wake-ups"
+)
+
+
+event_loop_monitor.sample_listeners.append(event_loop_lag_seconds.observe)
+
+
+class MetricsMiddleware:
+    """라우트 템플릿별 요청 수와 지연 시간을 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # 경로 파라미터 값 대신 라우트 템플릿을 라벨로 사용하여 카디널리티를 제한
+            route = scope.get("route")
+            route_path = getattr(route, "path", "unmatched")
+            http_requests_total.inc(scope["method"], route_path, str(status_code))
+            http_request_duration_seconds.observe(
+                time.perf_counter() - start, scope["method"], route_path
+            )
+
+
+async def publish_snapshot(redis_client) -> None:
+    """다른 워커가 합산할 수 있도록 현재 프로세스의 스냅샷을 Redis에 저장합니다."""
+    await redis_client.hset(
+        METRICS_PROCESSES_KEY,
+        str(os.getpid()),
+        json.dumps({"published_at": time.time(), "metrics": registry.snapshot()}),
+    )
+
+
+async def collect_snapshots(redis_client) -> Dict[str, dict]:
+    """모든 워커의 최근 스냅샷을 읽고, 오래된 프로세스의 스냅샷은 정리합니다."""
+    snapshots = {str(os.getpid()): registry.snapshot()}
+    try:
+        await publish_snapshot(redis_client)
+        published = await redis_client.hgetall(METRICS_PROCESSES_KEY)
+    except Exception as e:
+        print(f"Error collecting metrics from other workers: {e}")
+        return snapshots
+
+    expired = []
+    for pid, data in published.items():
+        entry = json.loads(data)
+        if time.time() - entry["published_at"] > metrics_config.process_ttl:
+            expired.append(pid)
+        elif pid not in snapshots:
+            snapshots[pid] = entry["metrics"]
+
+    if expired:
+        await redis_client.hdel(METRICS_PROCESSES_KEY, *expired)
+    return snapshots
+
+
+async def run_metrics_publisher_periodically(
+    redis_client, interval: int = metrics_config.publish_interval
+) -> None:
+    while True:
+        try:
+            await publish_snapshot(redis_client)
+        except Exception as e:
+            print(f"Error publishing metrics: {e}")
+        await asyncio.sleep(interval)
+
+
+async def collect_stream_gauges(redis_client) -> List[Tuple[str, str, float]]:
+    """작업 스트림의 적재 길이, 미처리(pending) 메시지 수, 소비 지연(lag)을 조회합니다."""
+    gauges = [
+        (
+            "task_stream_length",
+            "Entries in the task stream",
+            await redis_client.xlen("task_stream"),
+        )
+    ]
+    for group in await redis_client.xinfo_groups("task_stream"):
+        if group["name"] != "task_group":
+            continue
+        gauges.append(
+            (
+                "task_stream_pending",
+                "Delivered but unacknowledged tasks",
+                group["pending"],
+            )
+        )
+        # lag는 Redis 7 이상에서만 제공
+        if group.get("lag") is not None:
+            gauges.append(
+                (
+                    "task_stream_lag",
+                    "Tasks not yet delivered to the consumer group",
+                    group["lag"],
+                )
+            )
+    return gauges
+
+
+async def render_metrics(redis_client) -> str:
+    merged = merge_snapshots(await collect_snapshots(redis_client))
+
+    # 프로세스와 무관한 전역 값은 수집을 요청받은 프로세스에서 한 번만 기록
+    try:
+        global_gauges = await collect_stream_gauges(redis_client)
+    except Exception as e:
+        print(f"Error collecting task stream metrics: {e}")
+        global_gauges = []
+
+    for name, documentation, value in global_gauges:
+        merged[name] = {
+            "type": "gauge",
+            "help": documentation,
+            "labelnames": [],
+            "samples": {(): value},
+        }
+    return render(merged)
+
+
+def collect_db_pool_gauges() -> List[Tuple[LabelValues, float]]:
+    engine, read_engine = get_engine(), get_read_engine()
+    engines = {"primary": engine}
+    if read_engine is not engine:
+        engines["replica"] = read_engine
+
+    samples = []
+    for name, target_engine in engines.items():
+        status = get_pool_status(target_engine)
+        for key in (
+            "size",
+            "checked_in",
+            "checked_out",
+            "overflow",
+            "checkouts",
+            "checkout_timeouts",
+            "checkout_wait_seconds_total",
+        ):
+            if key in status:
+                samples.append(((name, key), status[key]))
+    return samples
+
+
+def collect_redis_pool_gauges() -> List[Tuple[LabelValues, float]]:
+    samples = []
+    for name, client in (
+        ("session", get_redis_client()),
+        ("task", get_task_redis_client()),
+    ):
+        connection_pool = client.connection_pool
+        samples.append(((name, "in_use"), len(connection_pool._in_use_connections)))
+        samples.append(
+            ((name, "available"), len(connection_pool._available_connections))
+        )
+    return samples
+
+
+def collect_es_pool_gauges() -> List[Tuple[LabelValues, float]]:
+    node_pool = get_elasticsearch_client().transport.node_pool
+    return [
+        (("alive",), len(node_pool._alive_nodes)),
+        (("dead",), node_pool._dead_nodes.qsize()),
+    ]
+
+
+registry.gauge(
+    "db_pool",
+    "SQLAlchemy pool connections and checkout totals",
+    ("engine", "stat"),
+    collect_db_pool_gauges,
+)
+registry.gauge(
+    "redis_pool_connections",
+    "redis-py pool connections",
+    ("client", "state"),
+    collect_redis_pool_gauges,
+)
+registry.gauge(
+    "es_nodes", "Elasticsearch transport nodes", ("state",), collect_es_pool_gauges
+)
+registry.gauge(
+    "event_loop_lag_quantile_seconds",
+    "Event loop wake-up delay percentiles over the recent window",
+    ("quantile",),
+    lambda: [((q,), v) for q, v in event_loop_monitor.percentiles().items()],
+)
+registry.gauge(
+    "event_loop_blocked",
+    "Wake-ups delayed beyond the blocking threshold since start",
+    (),
+    lambda: [((), event_loop_monitor.blocked_count)],
+)
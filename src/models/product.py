@@ -1,9 +1,10 @@
+from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
-from sqlalchemy import Column
+from sqlalchemy import Column, DateTime
 from sqlalchemy import Enum as SqlEnum
-from sqlalchemy import Text
+from sqlalchemy import Index, Text, func
 from sqlmodel import Field, Relationship, SQLModel
 
 from src.models.user import Seller
@@ -54,6 +55,8 @@ class TertiaryCategory(SQLModel, table=True):
 
 class Product(SQLModel, table=True):
     __tablename__ = "products"
+    # 판매자별 상품 목록 키셋 페이지네이션용 인덱스
+    __table_args__ = (Index("ix_products_seller_id_id", "seller_id", "id"),)
 
     id: Optional[int] = Field(default=None, primary_key=True, index=True)
     seller_id: int = Field(foreign_key="sellers.id", nullable=False)
@@ -73,6 +76,27 @@ class Product(SQLModel, table=True):
     caution: Optional[str] = Field(default=None, sa_column=Column(Text, nullable=True))
     inventory_quantity: Optional[int] = Field(default=0, nullable=False)
     use_status: bool = Field(default=True, nullable=False)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(
+            DateTime,
+            nullable=False,
+            default=datetime.utcnow,
+            server_default=func.now(),
+        ),
+    )
+    # 변경분 동기화(sync_changed_products)의 기준 컬럼
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(
+            DateTime,
+            nullable=False,
+            index=True,
+            default=datetime.utcnow,
+            server_default=func.now(),
+            onupdate=datetime.utcnow,
+        ),
+    )
 
     category: "TertiaryCategory" = Relationship(back_populates="products")
     seller: "Seller" = Relationship(back_populates="products")
@@ -86,6 +110,8 @@ class StatusType(str, Enum):
 
 class Stock(SQLModel, table=True):
     __tablename__ = "stocks"
+    # 상품별 가용 재고 집계용 인덱스
+    __table_args__ = (Index("ix_stocks_product_id_status", "product_id", "status"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     product_id: int = Field(foreign_key="products.id")
@@ -1,13 +1,19 @@
-from typing import List, Optional, TypeVar
+from datetime import datetime
+from itertools import islice
+from typing import AsyncIterator, Iterable, List, Optional, Tuple, TypeVar
 
 from elasticsearch import AsyncElasticsearch
 from fastapi import Depends
 from redis.asyncio import Redis
+from sqlalchemy import Row, and_, case
+from sqlalchemy import insert as sa_insert
+from sqlalchemy import or_
+from sqlalchemy import select as sa_select
 from sqlalchemy.orm import joinedload, selectinload
-from sqlmodel import SQLModel, func, select
+from sqlmodel import SQLModel, func, select, update
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.apis.dependencies import get_session
+from src.apis.dependencies import get_read_session, get_session
 from src.elastic_client import get_elasticsearch_client
 from src.models.product import (
     PrimaryCategory,
@@ -24,11 +30,17 @@ T = TypeVar("T", bound=SQLModel)
 
 
 class ProductRepository:
-    def __init__(self, session: AsyncSession = Depends(get_session)):
+    def __init__(
+        self,
+        session: AsyncSession = Depends(get_session),
+        read_session: AsyncSession = Depends(get_read_session),
+    ):
+        # 쓰기 및 쓰기 직후 조회는 session(기본 DB), 읽기 전용 조회는 read_session(복제본) 사용
         self.session = session
+        self.read_session = read_session
 
     async def get_product_list(self) -> List[Product]:
-        result = await self.session.exec(
+        result = await self.read_session.exec(
             select(Product)
             .where(Product.use_status == True)
             .options(joinedload(Product.seller))
@@ -36,38 +48,27 @@ class ProductRepository:
         return list(result.all())
 
     async def get_product_list_by_category(
-        self, category_type: str, category_id: int
+        self, category_ids: Iterable[int]
     ) -> Optional[List[Product]]:
-        query = select(Product).options(
-            selectinload(Product.seller).load_only(Seller.brand_name)
-        )
-
-        if category_type == "primary":
-            query = (
-                query.join(TertiaryCategory)
-                .join(SecondaryCategory)
-                .join(PrimaryCategory)
-                .where(PrimaryCategory.id == category_id)
-            )
-        elif category_type == "secondary":
-            query = (
-                query.join(TertiaryCategory)
-                .join(SecondaryCategory)
-                .where(SecondaryCategory.id == category_id)
-            )
-        elif category_type == "tertiary":
-            query = query.join(TertiaryCategory).where(
-                TertiaryCategory.id == category_id
-            )
-        else:
+        # 카테고리 계층은 CategoryTree에서 소분류 ID 목록으로 변환하여 조인 없이 조회
+        category_ids = list(category_ids)
+        if not category_ids:
             return None
 
-        result = await self.session.exec(query)
+        result = await self.read_session.exec(
+            select(Product)
+            .where(Product.category_id.in_(category_ids))
+            .options(selectinload(Product.seller).load_only(Seller.brand_name))
+        )
         result = list(result.all())
         return result if result else None
 
-    async def get_product_by_id(self, product_id: int) -> Product:
-        result = await self.session.exec(
+    async def get_product_by_id(
+        self, product_id: int, read_only: bool = False
+    ) -> Product:
+        # 조회 후 수정/삭제하는 경우 같은 세션에서 변경해야 하므로 기본 DB에서 조회
+        session = self.read_session if read_only else self.session
+        result = await session.exec(
             select(Product)
             .where(Product.id == product_id, Product.use_status == True)
             .options(joinedload(Product.category), joinedload(Product.seller))
@@ -80,43 +81,220 @@ class ProductRepository:
         await self.session.refresh(instance=product)
         return product
 
-    async def update_product(self, product: Product) -> Product:
-        self.session.add(instance=product)
+    async def update_product_fields(
+        self, product_id: int, seller_id: int, values: dict
+    ) -> Optional[Row]:
+        """판매자 본인의 상품만 한 번의 UPDATE ... RETURNING으로 부분 수정합니다."""
+        result = await self.session.execute(
+            update(Product)
+            .where(
+                Product.id == product_id,
+                Product.seller_id == seller_id,
+                Product.use_status == True,
+            )
+            .values(**values)
+            .returning(
+                Product.id,
+                Product.product_name,
+                Product.price,
+                Product.discounted_price,
+                Product.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        row = result.one_or_none()
         await self.session.commit()
-        await self.session.refresh(instance=product)
-        return product
+        return row
+
+    async def get_product_seller_id(self, product_id: int) -> Optional[int]:
+        result = await self.session.exec(
+            select(Product.seller_id).where(
+                Product.id == product_id, Product.use_status == True
+            )
+        )
+        return result.one_or_none()
 
     async def delete_product(self, product: Product) -> None:
         product.use_status = False
         await self.session.commit()
 
-    async def fetch_all_products(self) -> List[Product]:
-        async with self.session as session:
-            result = await session.exec(
-                select(Product).options(
-                    joinedload(Product.seller),
-                    selectinload(Product.category)
-                    .joinedload(TertiaryCategory.secondary_category)
-                    .joinedload(SecondaryCategory.primary_category),
+    @staticmethod
+    def product_document_query():
+        """상품, 판매자, 카테고리(대/중/소)를 한 번에 조인하여 ES 문서 필드를 조회하는 쿼리"""
+        return (
+            sa_select(
+                *Product.__table__.columns,
+                Seller.brand_name,
+                Seller.contact_number,
+                TertiaryCategory.name.label("category_3"),
+                SecondaryCategory.id.label("category_id_2"),
+                SecondaryCategory.name.label("category_2"),
+                PrimaryCategory.id.label("category_id_1"),
+                PrimaryCategory.name.label("category_1"),
+            )
+            .join(Seller, Seller.id == Product.seller_id)
+            .join(TertiaryCategory, TertiaryCategory.id == Product.category_id)
+            .join(
+                SecondaryCategory,
+                SecondaryCategory.id == TertiaryCategory.secondary_category_id,
+            )
+            .join(
+                PrimaryCategory,
+                PrimaryCategory.id == SecondaryCategory.primary_category_id,
+            )
+        )
+
+    @staticmethod
+    def to_document(row) -> dict:
+        # 작업 스트림에 JSON으로 저장할 수 있도록 시간 값은 ISO 8601 문자열로 변환
+        return {
+            key: value.isoformat() if isinstance(value, datetime) else value
+            for key, value in row.items()
+        }
+
+    async def get_product_document(self, product_id: int) -> Optional[dict]:
+        # 생성 직후 조회하는 경우가 있으므로 기본 DB에서 조회
+        result = await self.session.execute(
+            self.product_document_query().where(Product.id == product_id)
+        )
+        row = result.mappings().one_or_none()
+        return self.to_document(row) if row else None
+
+    async def get_product_documents(self, product_ids: List[int]) -> List[dict]:
+        if not product_ids:
+            return []
+
+        result = await self.session.execute(
+            self.product_document_query()
+            .where(Product.id.in_(product_ids))
+            .order_by(Product.id)
+        )
+        return [self.to_document(row) for row in result.mappings()]
+
+    async def bulk_create_products(self, values: List[dict]) -> List[int]:
+        """
+        여러 상품을 한 번의 다중 행 INSERT로 저장하고 생성된 ID를 입력 순서대로 반환합니다.
+        재고와 함께 한 트랜잭션으로 저장할 수 있도록 커밋은 호출하는 쪽에서 합니다.
+        """
+        result = await self.session.execute(
+            sa_insert(Product).returning(Product.id, sort_by_parameter_order=True),
+            values,
+        )
+        return list(result.scalars().all())
+
+    async def bulk_update_discounted_price(
+        self,
+        seller_id: int,
+        discount_type: str,
+        discount_value: int,
+        product_ids: Optional[List[int]] = None,
+        category_ids: Optional[Iterable[int]] = None,
+    ) -> List[Row]:
+        """할인가를 정가 기준으로 계산하여 대상 상품 전체에 한 번의 UPDATE로 반영합니다."""
+        if discount_type == "percent":
+            discounted_price = Product.price * (100 - discount_value) // 100
+        else:
+            discounted_price = case(
+                (Product.price > discount_value, Product.price - discount_value),
+                else_=0,
+            )
+
+        statement = update(Product).where(
+            Product.seller_id == seller_id, Product.use_status == True
+        )
+        if product_ids is not None:
+            statement = statement.where(Product.id.in_(product_ids))
+        if category_ids is not None:
+            statement = statement.where(Product.category_id.in_(category_ids))
+
+        result = await self.session.execute(
+            statement.values(discounted_price=discounted_price)
+            .returning(
+                Product.id, Product.price, Product.discounted_price, Product.updated_at
+            )
+            .execution_options(synchronize_session=False)
+        )
+        rows = list(result.all())
+        await self.session.commit()
+        return rows
+
+    async def get_product_documents_updated_since(
+        self, updated_at: datetime, after_id: int, limit: int
+    ) -> List[dict]:
+        """(updated_at, id) 순으로 기준 시점 이후 변경된 상품 문서를 조회합니다."""
+        result = await self.read_session.execute(
+            self.product_document_query()
+            .where(
+                or_(
+                    Product.updated_at > updated_at,
+                    and_(Product.updated_at == updated_at, Product.id > after_id),
                 )
             )
-            return list(result.all())
+            .order_by(Product.updated_at, Product.id)
+            .limit(limit)
+        )
+        return [self.to_document(row) for row in result.mappings()]
 
-    async def fetch_product(self, product_id: int) -> Product:
-        result = await self.session.exec(
-            select(Product)
-            .where(Product.id == product_id)
-            .options(
-                joinedload(Product.seller),
-                selectinload(Product.category)
-                .joinedload(TertiaryCategory.secondary_category)
-                .joinedload(SecondaryCategory.primary_category),
+    async def get_product_documents_after(
+        self, after_id: int, limit: int
+    ) -> List[dict]:
+        """ID 순으로 after_id 다음 상품 문서를 limit개 조회합니다. (키셋 페이지네이션)"""
+        result = await self.read_session.execute(
+            self.product_document_query()
+            .where(Product.id > after_id)
+            .order_by(Product.id)
+            .limit(limit)
+        )
+        return [self.to_document(row) for row in result.mappings()]
+
+    async def stream_product_documents(
+        self, chunk_size: int = 1000
+    ) -> AsyncIterator[List[dict]]:
+        """ID 순으로 상품 문서를 chunk_size 단위로 스트리밍합니다. ORM 객체를 만들지 않습니다."""
+        query = self.product_document_query().order_by(Product.id)
+        result = await self.read_session.stream(
+            query.execution_options(yield_per=chunk_size)
+        )
+        async for rows in result.mappings().partitions(chunk_size):
+            yield [self.to_document(row) for row in rows]
+
+    async def get_seller_product_list(
+        self, seller_id: int, size: int, cursor: Optional[int] = None
+    ) -> List[Row]:
+        """(seller_id, id) 인덱스를 사용하여 판매자의 상품을 최신순으로 키셋 페이지네이션합니다."""
+        query = select(
+            Product.id,
+            Product.product_name,
+            Product.category_id,
+            Product.price,
+            Product.discounted_price,
+        ).where(Product.seller_id == seller_id, Product.use_status == True)
+        if cursor is not None:
+            query = query.where(Product.id < cursor)
+
+        result = await self.read_session.exec(
+            query.order_by(Product.id.desc()).limit(size)
+        )
+        return list(result.all())
+
+    async def get_seller_products_after(
+        self, seller_id: int, after_id: int, limit: int
+    ) -> List[dict]:
+        """판매자의 삭제되지 않은 상품을 ID 오름차순으로 after_id 다음부터 limit건 조회합니다. (내보내기용)"""
+        result = await self.read_session.execute(
+            sa_select(*Product.__table__.columns)
+            .where(
+                Product.seller_id == seller_id,
+                Product.use_status == True,
+                Product.id > after_id,
             )
+            .order_by(Product.id)
+            .limit(limit)
         )
-        return result.one_or_none()
+        return [self.to_document(row) for row in result.mappings()]
 
     async def get_product_stock(self, product_id: int) -> Optional[int]:
-        result = await self.session.exec(
+        result = await self.read_session.exec(
             select(Product.inventory_quantity).where(
                 Product.id == product_id, Product.use_status == True
             )
@@ -124,9 +302,32 @@ class ProductRepository:
         return result.one_or_none()
 
 
+class CategoryRepository:
+    def __init__(
+        self,
+        session: AsyncSession = Depends(get_session),
+        read_session: AsyncSession = Depends(get_read_session),
+    ):
+        self.session = session
+        self.read_session = read_session
+
+    async def get_all_categories(
+        self,
+    ) -> Tuple[List[PrimaryCategory], List[SecondaryCategory], List[TertiaryCategory]]:
+        primary = await self.read_session.exec(select(PrimaryCategory))
+        secondary = await self.read_session.exec(select(SecondaryCategory))
+        tertiary = await self.read_session.exec(select(TertiaryCategory))
+        return list(primary.all()), list(secondary.all()), list(tertiary.all())
+
+
 class StockRepository:
-    def __init__(self, session: AsyncSession = Depends(get_session)):
+    def __init__(
+        self,
+        session: AsyncSession = Depends(get_session),
+        read_session: AsyncSession = Depends(get_read_session),
+    ):
         self.session = session
+        self.read_session = read_session
 
     async def create_stocks(self, product_id: int, quantity: int):
         stock_list = [
@@ -136,7 +337,24 @@ class StockRepository:
         self.session.add_all(stock_list)
         await self.session.commit()
 
+    async def bulk_create_stocks(
+        self, quantities: dict, chunk_size: int = 1000
+    ) -> None:
+        """상품별 수량만큼의 재고를 chunk_size행씩 다중 행 INSERT로 저장합니다. (커밋은 호출하는 쪽에서 함)"""
+        values = (
+            {"product_id": product_id, "status": StatusType.AVAILABLE}
+            for product_id, quantity in quantities.items()
+            for _ in range(quantity)
+        )
+        # 전체 재고 행을 한 번에 만들지 않도록 청크 단위로 생성하여 저장
+        while True:
+            chunk = list(islice(values, chunk_size))
+            if not chunk:
+                break
+            await self.session.execute(sa_insert(Stock), chunk)
+
     async def count_stocks_by_product_id(self, product_id: int):
+        # 주문, 장바구니 직후 재고 수가 복제 지연으로 어긋나지 않도록 기본 DB에서 조회
         result = await self.session.exec(
             select(func.count(Stock.id)).where(
                 Stock.product_id == product_id, Stock.status == StatusType.AVAILABLE
@@ -144,6 +362,21 @@ class StockRepository:
         )
         return result.one_or_none()
 
+    async def count_stocks_by_product_ids(self, product_ids: List[int]) -> dict:
+        """여러 상품의 가용 재고 수를 한 번의 GROUP BY 쿼리로 조회합니다."""
+        if not product_ids:
+            return {}
+
+        result = await self.session.exec(
+            select(Stock.product_id, func.count(Stock.id))
+            .where(
+                Stock.product_id.in_(product_ids),
+                Stock.status == StatusType.AVAILABLE,
+            )
+            .group_by(Stock.product_id)
+        )
+        return dict(result.all())
+
     async def get_available_stock_by_quantity(self, product_id: int, quantity: int):
         result = await self.session.exec(
             select(Stock)
@@ -154,17 +387,31 @@ class StockRepository:
 
 
 class UserRepository:
-    def __init__(self, session: AsyncSession = Depends(get_session)):
+    def __init__(
+        self,
+        session: AsyncSession = Depends(get_session),
+        read_session: AsyncSession = Depends(get_read_session),
+    ):
         self.session = session
+        self.read_session = read_session
 
-    async def get_user_by_email(self, email: str) -> User:
-        result = await self.session.exec(select(User).where(User.email == email))
+    async def get_user_by_email(self, email: str, read_only: bool = False) -> User:
+        # 회원가입 중복 확인, 로그인은 복제 지연의 영향을 받지 않도록 기본 DB에서 조회
+        session = self.read_session if read_only else self.session
+        result = await session.exec(select(User).where(User.email == email))
         return result.one_or_none()
 
-    async def get_user_by_id(self, user_id: int) -> User:
-        result = await self.session.exec(select(User).where(User.id == user_id))
+    async def get_user_by_id(self, user_id: int, read_only: bool = False) -> User:
+        session = self.read_session if read_only else self.session
+        result = await session.exec(select(User).where(User.id == user_id))
         return result.one_or_none()
 
+    async def update_password(self, user_id: int, hashed_password: str) -> None:
+        await self.session.execute(
+            update(User).where(User.id == user_id).values(password=hashed_password)
+        )
+        await self.session.commit()
+
     async def save_entity(self, instance: T) -> T:
         self.session.add(instance=instance)
         await self.session.commit()
@@ -222,6 +469,22 @@ class ElasticsearchRepository:
         response = await self.es.search(index="products", body=query)
         return [hit["_source"] for hit in response["hits"]["hits"]]
 
+    async def get_products_after(
+        self, after_id: int, size: int, fields: List[str]
+    ) -> List[dict]:
+        """ID 오름차순으로 after_id 다음 상품들을 필요한 필드만 조회합니다. (search_after)"""
+        body = {
+            "query": {"match_all": {}},
+            "sort": [{"id": {"order": "asc"}}],
+            "_source": fields,
+            "size": size,
+        }
+        if after_id:
+            body["search_after"] = [after_id]
+
+        response = await self.es.search(index="products", body=body)
+        return [hit["_source"] for hit in response["hits"]["hits"]]
+
     async def get_product_by_id(self, product_id: str) -> dict:
         response = await self.es.get(index="products", id=product_id)
         return response["_source"] if response["found"] else None
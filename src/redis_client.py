@@ -1,31 +1,82 @@
+import time
+from typing import Optional
+
 from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
 
 from src.config import redis as redis_config
+from src.instrumentation import current_timings, record_timing
+
+
+class TimedPipeline(Pipeline):
+    """파이프라인은 execute에서 모아 둔 명령을 한 번에 전송하므로 execute 한 번을 한 호출로 합산"""
+
+    async def execute(self, raise_on_error: bool = True):
+        if current_timings.get() is None:
+            return await super().execute(raise_on_error)
+
+        start = time.perf_counter()
+        try:
+            return await super().execute(raise_on_error)
+        finally:
+            record_timing("redis", time.perf_counter() - start)
+
+
+class TimedRedis(Redis):
+    """요청별 Redis 명령 소요 시간을 Server-Timing에 합산하는 클라이언트"""
+
+    def pipeline(
+        self, transaction: bool = True, shard_hint: Optional[str] = None
+    ) -> Pipeline:
+        return TimedPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
 
-# 세션 관리용 Redis 클라이언트
-redis_client = Redis(
-    host=redis_config.host,
-    port=redis_config.port,
-    db=redis_config.session_db,
-    encoding="UTF-8",
-    decode_responses=True,
-)
-
-# 작업 관리용 Redis 클라이언트
-task_redis_client = Redis(
-    host=redis_config.host,
-    port=redis_config.port,
-    db=redis_config.task_db,
-    encoding="UTF-8",
-    decode_responses=True,
-)
+    async def execute_command(self, *args, **options):
+        if current_timings.get() is None:
+            return await super().execute_command(*args, **options)
+
+        start = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            record_timing("redis", time.perf_counter() - start)
+
+
+def create_redis_client(db: str) -> Redis:
+    return TimedRedis(
+        host=redis_config.host,
+        port=redis_config.port,
+        db=db,
+        encoding="UTF-8",
+        decode_responses=True,
+    )
+
+
+# 클라이언트는 처음 사용할 때 생성 (커넥션은 명령을 실행할 때 풀에서 연결)
+_redis_client: Optional[Redis] = None
+_task_redis_client: Optional[Redis] = None
 
 
 def get_redis_client() -> Redis:
     """세션 관리용 Redis 클라이언트를 반환합니다."""
-    return redis_client
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = create_redis_client(redis_config.session_db)
+    return _redis_client
 
 
 def get_task_redis_client() -> Redis:
     """작업 관리용 Redis 클라이언트를 반환합니다."""
-    return task_redis_client
+    global _task_redis_client
+    if _task_redis_client is None:
+        _task_redis_client = create_redis_client(redis_config.task_db)
+    return _task_redis_client
+
+
+async def close_redis_clients() -> None:
+    global _redis_client, _task_redis_client
+    for client in (_redis_client, _task_redis_client):
+        if client is not None:
+            await client.aclose()
+    _redis_client = _task_redis_client = None
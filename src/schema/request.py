@@ -1,6 +1,6 @@
-from typing import Optional
+from typing import List, Literal, Optional
 
-from pydantic import BaseModel, EmailStr, Field, constr
+from pydantic import BaseModel, EmailStr, Field, constr, model_validator
 
 from src.models.user import UserType
 
@@ -34,6 +34,28 @@ class UpdateProductRequest(BaseModel):
     inventory_quantity: Optional[int] = None
 
 
+class BulkUpdatePriceRequest(BaseModel):
+    # 상품 ID 목록 또는 카테고리 중 하나로 대상 상품을 지정
+    product_ids: Optional[List[int]] = Field(None, min_length=1, max_length=10000)
+    category_type: Optional[Literal["primary", "secondary", "tertiary"]] = None
+    category_id: Optional[int] = None
+
+    # percent: 정가의 n% 할인, amount: 정가에서 n원 할인
+    discount_type: Literal["percent", "amount"]
+    discount_value: int = Field(ge=0)
+
+    @model_validator(mode="after")
+    def validate_target(self) -> "BulkUpdatePriceRequest":
+        has_category = self.category_type is not None and self.category_id is not None
+        if (self.product_ids is None) == (not has_category):
+            raise ValueError(
+                "Specify either product_ids or category_type and category_id."
+            )
+        if self.discount_type == "percent" and self.discount_value > 100:
+            raise ValueError("Percent discount must be between 0 and 100.")
+        return self
+
+
 class RegisterUserRequest(BaseModel):
     email: EmailStr
     password: constr(min_length=8, max_length=20)
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -50,6 +50,48 @@ class GetProductDetailResponse(BaseModel):
     use_status: bool
 
 
+class SellerProductResponse(BaseModel):
+    id: int
+    product_name: str
+    category_id: int
+    price: int
+    discounted_price: int
+    inventory_quantity: int
+
+
+class GetSellerProductListResponse(BaseModel):
+    items: List[SellerProductResponse]
+    next_cursor: Optional[int] = None
+
+
+class ProductPriceResponse(BaseModel):
+    id: int
+    price: int
+    discounted_price: int
+
+
+class BulkUpdatePriceResponse(BaseModel):
+    updated_count: int
+    items: List[ProductPriceResponse]
+
+
+class ImportRowErrorResponse(BaseModel):
+    row: int
+    error: str
+
+
+class ImportJobResponse(BaseModel):
+    job_id: str
+    status: str
+    total: int = 0
+    processed: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    # 저장은 되었지만 검색 색인 작업 등록에 실패한 상품 수 (변경분 동기화로 반영됨)
+    index_failed: int = 0
+    errors: List[ImportRowErrorResponse] = []
+
+
 class GetRegisterInfoResponse(BaseModel):
     user_type: str
     email: str
@@ -76,3 +118,9 @@ class CartResponse(BaseModel):
     price: int
     discounted_price: int
     quantity: int
+
+
+class CategoryResponse(BaseModel):
+    id: int
+    name: str
+    children: List["CategoryResponse"] = []
@@ -1,27 +1,93 @@
-from fastapi import HTTPException
+import hmac
+from typing import Optional
 
-from src.models.user import UserType
+from fastapi import Cookie, Depends, Header, HTTPException
+from pydantic import BaseModel
+
+from src.config import profiler as profiler_config
+from src.models.repository import UserRepository
+from src.models.user import User, UserType
 from src.service.session import SessionService
 
 
+class AuthenticatedUser(BaseModel):
+    session_id: str
+    user_id: int
+    user_type: UserType
+    seller_id: Optional[int] = None
+    buyer_id: Optional[int] = None
+    email: Optional[str] = None
+    # 판매자는 브랜드명, 구매자는 이름
+    name: Optional[str] = None
+
+
+def build_session_data(user: User) -> dict:
+    # 요청마다 사용자 조회가 필요하지 않도록 프로필 ID와 표시 정보를 세션에 함께 저장
+    session_data = {
+        "user_id": user.id,
+        "user_type": user.user_type,
+        "email": user.email,
+    }
+    if user.user_type == UserType.SELLER and user.seller:
+        session_data["seller_id"] = user.seller.id
+        session_data["name"] = user.seller.brand_name
+    elif user.user_type == UserType.BUYER and user.buyer:
+        session_data["buyer_id"] = user.buyer.id
+        session_data["name"] = user.buyer.name
+
+    return session_data
+
+
 async def get_session_data(session_id: str, session_service: SessionService) -> dict:
-    session_data = await session_service.get_session(session_id=session_id)
+    # 세션 조회와 만료 시간 연장(sliding expiry)을 한 번의 Redis 호출로 처리
+    session_data = await session_service.get_session(
+        session_id=session_id, ttl=session_service.session_ttl
+    )
     if not session_data:
         raise HTTPException(status_code=404, detail="Session Not Found")
 
     return session_data
 
 
-async def verify_seller(session_id: str, session_service: SessionService) -> int:
+async def get_current_user(
+    session_id: str = Cookie(None), session_service: SessionService = Depends()
+) -> AuthenticatedUser:
+    if not session_id:
+        raise HTTPException(status_code=400, detail="Missing Session ID")
+
     session_data = await get_session_data(
         session_id=session_id, session_service=session_service
     )
 
-    user_type = session_data["user_type"]
-    if user_type != UserType.SELLER:
+    if "user_id" not in session_data:
+        raise HTTPException(status_code=401, detail="User not authenticated")
+
+    return AuthenticatedUser(
+        session_id=session_id,
+        user_id=session_data["user_id"],
+        user_type=session_data["user_type"],
+        seller_id=session_data.get("seller_id"),
+        buyer_id=session_data.get("buyer_id"),
+        email=session_data.get("email"),
+        name=session_data.get("name"),
+    )
+
+
+async def get_current_seller(
+    user: AuthenticatedUser = Depends(get_current_user),
+    user_repo: UserRepository = Depends(UserRepository),
+) -> AuthenticatedUser:
+    if user.user_type != UserType.SELLER:
         raise HTTPException(status_code=403, detail="Not Authorized")
 
-    return session_data["user_id"]
+    # seller_id가 저장되지 않은 이전 형식의 세션인 경우에만 DB에서 조회
+    if user.seller_id is None:
+        db_user: User | None = await user_repo.get_user_by_id(user_id=user.user_id)
+        if not db_user or not db_user.seller:
+            raise HTTPException(status_code=403, detail="Not Authorized")
+        user.seller_id = db_user.seller.id
+
+    return user
 
 
 async def verify_user_can_access_product(
@@ -29,3 +95,14 @@ async def verify_user_can_access_product(
 ) -> None:
     if seller_id != product_seller_id:
         raise HTTPException(status_code=403, detail="Access denied")
+
+
+async def verify_internal_token(x_internal_token: Optional[str] = Header(None)) -> None:
+    # 토큰이 설정되지 않은 환경에서는 내부 API가 존재하지 않는 것처럼 응답
+    if not profiler_config.token:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    if x_internal_token is None or not hmac.compare_digest(
+        x_internal_token, profiler_config.token
+    ):
+        raise HTTPException(status_code=403, detail="Access denied")
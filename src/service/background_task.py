@@ -6,18 +6,13 @@ from email.mime.text import MIMEText
 
 from aiosmtplib import SMTP
 
-from src.apis.dependencies import get_session
 from src.elastic_client import get_elasticsearch_client
-from src.models.repository import StockRepository
-from src.redis_client import get_redis_client, get_task_redis_client
-
-task_redis = get_task_redis_client()
-es = get_elasticsearch_client()
-cart_redis = get_redis_client()
-stock_repo = StockRepository(get_session())
+from src.redis_client import get_task_redis_client
+from src.service.sync import build_bulk_index_operations, build_bulk_update_operations
 
 
 async def process_tasks():
+    task_redis = get_task_redis_client()
     while True:
         try:
             result = await task_redis.xreadgroup(
@@ -38,6 +33,16 @@ async def process_tasks():
                         if data:
                             product_info = json.loads(data)
                             await sync_product_to_elasticsearch(product_info)
+                    elif task_type == "sync_products":
+                        data = message_data.get("data")
+                        if data:
+                            product_infos = json.loads(data)
+                            await bulk_sync_products_to_elasticsearch(product_infos)
+                    elif task_type == "sync_products_action":
+                        data = message_data.get("data")
+                        if data:
+                            product_infos = json.loads(data)
+                            await bulk_update_products_to_elasticsearch(product_infos)
                     elif task_type == "sync_product_action":
                         data = message_data.get("data")
                         if data:
@@ -61,25 +66,39 @@ async def process_tasks():
 
 async def add_product_to_stream(product_info: dict, action_type: str):
     if action_type == "create":
-        await task_redis.xadd(
+        await get_task_redis_client().xadd(
             "task_stream", {"type": "sync_product", "data": json.dumps(product_info)}
         )
     elif action_type == "update" or action_type == "delete":
-        await task_redis.xadd(
+        await get_task_redis_client().xadd(
             "task_stream",
             {"type": "sync_product_action", "data": json.dumps(product_info)},
         )
 
 
+async def add_products_to_stream(product_infos: list[dict]):
+    # 대량 등록 시 상품마다 메시지를 만들지 않고 묶음 단위로 한 번에 전달
+    await get_task_redis_client().xadd(
+        "task_stream", {"type": "sync_products", "data": json.dumps(product_infos)}
+    )
+
+
+async def add_product_updates_to_stream(product_infos: list[dict]):
+    await get_task_redis_client().xadd(
+        "task_stream",
+        {"type": "sync_products_action", "data": json.dumps(product_infos)},
+    )
+
+
 async def add_email_to_stream(user_info: dict):
-    await task_redis.xadd(
+    await get_task_redis_client().xadd(
         "task_stream", {"type": "send_email", "data": json.dumps(user_info)}
     )
 
 
 async def sync_product_to_elasticsearch(product_info: dict):
     try:
-        await es.index(
+        await get_elasticsearch_client().index(
             index="products",
             id=product_info["id"],
             body=product_info,
@@ -89,9 +108,33 @@ async def sync_product_to_elasticsearch(product_info: dict):
         print(f"Error syncing product to Elasticsearch: {e}")
 
 
+async def bulk_sync_products_to_elasticsearch(product_infos: list[dict]):
+    try:
+        response = await get_elasticsearch_client().bulk(
+            operations=build_bulk_index_operations(product_infos),
+            refresh="wait_for",
+        )
+        if response["errors"]:
+            print("Error syncing some products to Elasticsearch")
+    except Exception as e:
+        print(f"Error syncing products to Elasticsearch: {e}")
+
+
+async def bulk_update_products_to_elasticsearch(product_infos: list[dict]):
+    try:
+        response = await get_elasticsearch_client().bulk(
+            operations=build_bulk_update_operations(product_infos),
+            refresh="wait_for",
+        )
+        if response["errors"]:
+            print("Error updating some products to Elasticsearch")
+    except Exception as e:
+        print(f"Error updating products to Elasticsearch: {e}")
+
+
 async def update_or_delete_product_to_elasticsearch(product_info: dict):
     try:
-        await es.update(
+        await get_elasticsearch_client().update(
             index="products",
             id=product_info["id"],
             body={"doc": product_info},
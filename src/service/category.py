@@ -0,0 +1,206 @@
+import asyncio
+import hashlib
+import json
+import time
+from types import MappingProxyType
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from fastapi import Depends
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.apis.dependencies import get_read_session
+from src.config import category as category_config
+from src.models.product import PrimaryCategory, SecondaryCategory, TertiaryCategory
+from src.models.repository import CategoryRepository
+
+# 대분류 > 중분류 > 소분류
+CATEGORY_TYPES = ("primary", "secondary", "tertiary")
+
+
+class CategoryNode(NamedTuple):
+    id: int
+    name: str
+    category_type: str
+    parent_id: Optional[int]
+    child_ids: Tuple[int, ...]
+
+
+class CategoryTree:
+    """전체 카테고리 계층을 담는 불변 객체. 변경 시에는 새 객체로 교체합니다."""
+
+    def __init__(
+        self,
+        primary_categories: List[PrimaryCategory],
+        secondary_categories: List[SecondaryCategory],
+        tertiary_categories: List[TertiaryCategory],
+    ):
+        children: Dict[Tuple[str, int], List[int]] = {}
+        for category in secondary_categories:
+            children.setdefault(("primary", category.primary_category_id), []).append(
+                category.id
+            )
+        for category in tertiary_categories:
+            children.setdefault(
+                ("secondary", category.secondary_category_id), []
+            ).append(category.id)
+
+        def build_nodes(categories, category_type: str, parent_field: Optional[str]):
+            return MappingProxyType(
+                {
+                    category.id: CategoryNode(
+                        id=category.id,
+                        name=category.name,
+                        category_type=category_type,
+                        parent_id=getattr(category, parent_field)
+                        if parent_field
+                        else None,
+                        child_ids=tuple(
+                            sorted(children.get((category_type, category.id), []))
+                        ),
+                    )
+                    for category in categories
+                }
+            )
+
+        self.nodes = MappingProxyType(
+            {
+                "primary": build_nodes(primary_categories, "primary", None),
+                "secondary": build_nodes(
+                    secondary_categories, "secondary", "primary_category_id"
+                ),
+                "tertiary": build_nodes(
+                    tertiary_categories, "tertiary", "secondary_category_id"
+                ),
+            }
+        )
+
+        # 응답 본문과 ETag는 트리가 만들어질 때 한 번만 계산
+        self.body: bytes = json.dumps(
+            self.to_list(), ensure_ascii=False, separators=(",", ":")
+        ).encode("UTF-8")
+        self.etag: str = f'"{hashlib.sha1(self.body).hexdigest()}"'
+
+    def get(self, category_type: str, category_id: int) -> Optional[CategoryNode]:
+        nodes = self.nodes.get(category_type)
+        return nodes.get(category_id) if nodes is not None else None
+
+    def get_children(self, category_type: str, category_id: int) -> List[CategoryNode]:
+        node = self.get(category_type, category_id)
+        if node is None or category_type == "tertiary":
+            return []
+
+        child_type = CATEGORY_TYPES[CATEGORY_TYPES.index(category_type) + 1]
+        return [self.nodes[child_type][child_id] for child_id in node.child_ids]
+
+    def get_ancestors(self, tertiary_id: int) -> Optional[List[CategoryNode]]:
+        """소분류 ID로 [대분류, 중분류, 소분류] 노드를 반환합니다."""
+        tertiary = self.get("tertiary", tertiary_id)
+        if tertiary is None:
+            return None
+
+        secondary = self.get("secondary", tertiary.parent_id)
+        primary = self.get("primary", secondary.parent_id) if secondary else None
+        if primary is None:
+            return None
+
+        return [primary, secondary, tertiary]
+
+    def get_tertiary_ids(self, category_type: str, category_id: int) -> frozenset:
+        """해당 카테고리에 속한 모든 소분류 ID를 반환합니다."""
+        node = self.get(category_type, category_id)
+        if node is None:
+            return frozenset()
+        if category_type == "tertiary":
+            return frozenset([node.id])
+
+        tertiary_ids = set()
+        for child in self.get_children(category_type, category_id):
+            tertiary_ids |= self.get_tertiary_ids(child.category_type, child.id)
+        return frozenset(tertiary_ids)
+
+    def build_category_fields(self, tertiary_id: int) -> Optional[dict]:
+        """상품 문서에 들어가는 카테고리 필드를 반환합니다."""
+        ancestors = self.get_ancestors(tertiary_id)
+        if ancestors is None:
+            return None
+
+        primary, secondary, tertiary = ancestors
+        return {
+            "category_id_1": primary.id,
+            "category_1": primary.name,
+            "category_id_2": secondary.id,
+            "category_2": secondary.name,
+            "category_id": tertiary.id,
+            "category_3": tertiary.name,
+        }
+
+    def to_list(self) -> List[dict]:
+        def serialize(node: CategoryNode) -> dict:
+            return {
+                "id": node.id,
+                "name": node.name,
+                "children": [
+                    serialize(child)
+                    for child in self.get_children(node.category_type, node.id)
+                ],
+            }
+
+        return [
+            serialize(node)
+            for node in sorted(self.nodes["primary"].values(), key=lambda n: n.id)
+        ]
+
+
+class CategoryTreeCache:
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+        self.tree: Optional[CategoryTree] = None
+        self.loaded_at: float = 0.0
+        self.lock = asyncio.Lock()
+
+    def is_stale(self) -> bool:
+        return time.monotonic() - self.loaded_at > self.ttl
+
+    def invalidate(self) -> None:
+        self.loaded_at = 0.0
+
+    async def load(self, session: AsyncSession) -> CategoryTree:
+        async with self.lock:
+            category_repo = CategoryRepository(session=session, read_session=session)
+            self.tree = CategoryTree(*await category_repo.get_all_categories())
+            self.loaded_at = time.monotonic()
+            return self.tree
+
+    async def get_tree(self, session: AsyncSession) -> CategoryTree:
+        if self.tree is None:
+            return await self.load(session)
+
+        # 만료된 경우 한 요청만 다시 불러오고, 나머지 요청은 기존 트리를 사용
+        if self.is_stale() and not self.lock.locked():
+            return await self.load(session)
+
+        return self.tree
+
+    async def reload_on_miss(
+        self, session: AsyncSession, category_type: str, category_id: int
+    ) -> CategoryTree:
+        """
+        캐시된 트리에 없는 카테고리면 트리를 한 번 다시 불러옵니다.
+        방금 추가된 카테고리가 TTL 동안 거부되지 않도록 하고, 없는 ID로 반복 요청해도
+        DB 조회가 몰리지 않도록 miss_reload_interval 안에는 다시 불러오지 않습니다.
+        """
+        tree = await self.get_tree(session)
+        if tree.get(category_type, category_id) is not None:
+            return tree
+        if time.monotonic() - self.loaded_at < category_config.miss_reload_interval:
+            return tree
+        return await self.load(session)
+
+
+category_tree_cache = CategoryTreeCache(ttl=category_config.cache_ttl)
+
+
+async def get_category_tree(
+    session: AsyncSession = Depends(get_read_session),
+) -> CategoryTree:
+    return await category_tree_cache.get_tree(session)
@@ -0,0 +1,148 @@
+import argparse
+import asyncio
+import hashlib
+import json
+from typing import AsyncIterator
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.database import get_read_engine
+from src.elastic_client import get_elasticsearch_client
+from src.models.repository import ElasticsearchRepository, ProductRepository
+from src.service.background_task import add_product_to_stream
+
+# 시간 값은 부분 업데이트 시 갱신되지 않으므로 비교 대상에서 제외
+EXCLUDED_FIELDS = {"created_at", "updated_at"}
+DOCUMENT_FIELDS = [
+    column.name
+    for column in ProductRepository.product_document_query().selected_columns
+    if column.name not in EXCLUDED_FIELDS
+]
+
+
+def hash_document(document: dict) -> str:
+    content = {field: document.get(field) for field in DOCUMENT_FIELDS}
+    return hashlib.md5(
+        json.dumps(content, sort_keys=True, ensure_ascii=False).encode("UTF-8")
+    ).hexdigest()
+
+
+async def iterate_sql_documents(chunk_size: int, pause: float) -> AsyncIterator[dict]:
+    after_id = 0
+    while True:
+        # 청크마다 세션을 새로 열어 검사 중 트랜잭션과 커넥션을 오래 점유하지 않음
+        async with AsyncSession(get_read_engine()) as session:
+            product_repo = ProductRepository(session=session, read_session=session)
+            documents = await product_repo.get_product_documents_after(
+                after_id=after_id, limit=chunk_size
+            )
+        for document in documents:
+            yield document
+
+        if len(documents) < chunk_size:
+            break
+        after_id = documents[-1]["id"]
+        await asyncio.sleep(pause)
+
+
+async def iterate_es_documents(
+    es_repo: ElasticsearchRepository, chunk_size: int, pause: float
+) -> AsyncIterator[dict]:
+    after_id = 0
+    while True:
+        documents = await es_repo.get_products_after(
+            after_id=after_id, size=chunk_size, fields=DOCUMENT_FIELDS
+        )
+        for document in documents:
+            yield document
+
+        if len(documents) < chunk_size:
+            break
+        after_id = documents[-1]["id"]
+        # 트래픽 영향을 줄이기 위해 청크 사이에 대기
+        await asyncio.sleep(pause)
+
+
+async def check_product_consistency(
+    chunk_size: int = 1000,
+    repair: bool = False,
+    pause: float = 0.0,
+    report_limit: int = 1000,
+) -> dict:
+    """
+    SQL과 Elasticsearch의 상품을 ID 순으로 청크 단위 병합 비교합니다.
+    메모리에는 현재 청크만 유지하고 SQL, Elasticsearch 모두 청크 사이에 pause초 대기하며,
+    repair=True이면 불일치 상품의 동기화 작업을 작업 스트림에 추가합니다.
+    """
+    report = {
+        "sql_count": 0,
+        "es_count": 0,
+        "missing_in_es": [],
+        "extra_in_es": [],
+        "mismatched": [],
+        "missing_in_es_count": 0,
+        "extra_in_es_count": 0,
+        "mismatched_count": 0,
+    }
+
+    def record(kind: str, product_id: int):
+        report[f"{kind}_count"] += 1
+        if len(report[kind]) < report_limit:
+            report[kind].append(product_id)
+
+    es_repo = ElasticsearchRepository(es=get_elasticsearch_client())
+    sql_documents = iterate_sql_documents(chunk_size, pause)
+    es_documents = iterate_es_documents(es_repo, chunk_size, pause)
+    sql_document = await anext(sql_documents, None)
+    es_document = await anext(es_documents, None)
+
+    while sql_document is not None or es_document is not None:
+        if es_document is None or (
+            sql_document is not None and sql_document["id"] < es_document["id"]
+        ):
+            record("missing_in_es", sql_document["id"])
+            if repair:
+                await add_product_to_stream(
+                    product_info=sql_document, action_type="create"
+                )
+            report["sql_count"] += 1
+            sql_document = await anext(sql_documents, None)
+
+        elif sql_document is None or es_document["id"] < sql_document["id"]:
+            record("extra_in_es", es_document["id"])
+            if repair:
+                await add_product_to_stream(
+                    product_info={"id": es_document["id"], "use_status": False},
+                    action_type="delete",
+                )
+            report["es_count"] += 1
+            es_document = await anext(es_documents, None)
+
+        else:
+            if hash_document(sql_document) != hash_document(es_document):
+                record("mismatched", sql_document["id"])
+                if repair:
+                    await add_product_to_stream(
+                        product_info=sql_document, action_type="create"
+                    )
+            report["sql_count"] += 1
+            report["es_count"] += 1
+            sql_document = await anext(sql_documents, None)
+            es_document = await anext(es_documents, None)
+
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SQL-Elasticsearch 상품 정합성 검사")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--pause", type=float, default=0.0)
+    parser.add_argument("--repair", action="store_true")
+    args = parser.parse_args()
+
+    result = asyncio.run(
+        check_product_consistency(
+            chunk_size=args.chunk_size, repair=args.repair, pause=args.pause
+        )
+    )
+    print(json.dumps(result, ensure_ascii=False))
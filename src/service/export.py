@@ -0,0 +1,71 @@
+import csv
+import io
+import json
+from typing import AsyncIterator
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.database import get_read_engine
+from src.models.product import Product
+from src.models.repository import ProductRepository, StockRepository
+
+EXPORT_FIELDS = [
+    column.name for column in Product.__table__.columns if column.name != "seller_id"
+] + ["available_quantity"]
+
+
+def to_ndjson(rows: list[dict]) -> str:
+    return "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+
+
+def to_csv(rows: list[dict], header: bool) -> str:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS, extrasaction="ignore")
+    if header:
+        writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+async def stream_seller_products(
+    seller_id: int, file_format: str, chunk_size: int = 1000
+) -> AsyncIterator[str]:
+    """판매자 상품을 청크 단위로 조회하여 NDJSON/CSV 행을 생성되는 대로 내보냅니다."""
+    # 응답 전송 중에도 사용할 수 있도록 요청 의존성과 별개의 세션을 사용
+    async with AsyncSession(get_read_engine()) as session:
+        product_repo = ProductRepository(session=session, read_session=session)
+        stock_repo = StockRepository(session=session, read_session=session)
+
+        after_id = 0
+        is_first_chunk = True
+        while True:
+            products = await product_repo.get_seller_products_after(
+                seller_id=seller_id, after_id=after_id, limit=chunk_size
+            )
+            if not products and not is_first_chunk:
+                break
+
+            stock_counts = await stock_repo.count_stocks_by_product_ids(
+                product_ids=[product["id"] for product in products]
+            )
+            rows = [
+                {
+                    **{
+                        key: value
+                        for key, value in product.items()
+                        if key != "seller_id"
+                    },
+                    "available_quantity": stock_counts.get(product["id"], 0),
+                }
+                for product in products
+            ]
+
+            if file_format == "csv":
+                yield to_csv(rows, header=is_first_chunk)
+            else:
+                yield to_ndjson(rows)
+
+            if len(products) < chunk_size:
+                break
+            is_first_chunk = False
+            after_id = products[-1]["id"]
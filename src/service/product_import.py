@@ -0,0 +1,260 @@
+import asyncio
+import csv
+import io
+import json
+import uuid
+from itertools import islice
+from typing import Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.config import product_import as import_config
+from src.database import get_engine
+from src.models.product import Product
+from src.models.repository import ProductRepository, StockRepository
+from src.redis_client import get_task_redis_client
+from src.schema.request import CreateProductRequest
+from src.service.background_task import add_products_to_stream
+from src.service.category import CategoryTree, category_tree_cache
+
+IMPORT_FORMATS = ("csv", "ndjson")
+IMPORT_COLUMNS = [
+    column.name
+    for column in Product.__table__.columns
+    if column.name not in ("id", "created_at", "updated_at")
+]
+
+# 실행 중인 작업이 가비지 컬렉션되지 않도록 참조를 보관
+running_import_tasks: set = set()
+
+
+def generate_import_job_key(job_id: str) -> str:
+    return f"import_job:{job_id}"
+
+
+def parse_rows(content: str, file_format: str) -> Iterator[Tuple[int, Optional[dict]]]:
+    """파일 내용을 (행 번호, 행 데이터) 단위로 한 행씩 읽습니다. 해석할 수 없는 행은 None을 반환합니다."""
+    if file_format == "csv":
+        # 헤더가 1행이므로 데이터는 2행부터 시작
+        for row_number, row in enumerate(csv.DictReader(io.StringIO(content)), 2):
+            # 빈 칸은 입력하지 않은 값으로 취급하여 모델 기본값이 적용되도록 함
+            yield row_number, {key: value for key, value in row.items() if value}
+        return
+
+    for row_number, line in enumerate(io.StringIO(content), 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            yield row_number, None
+            continue
+        yield row_number, row if isinstance(row, dict) else None
+
+
+def validate_row(
+    row: Optional[dict], seller_id: int, category_tree: CategoryTree
+) -> Tuple[Optional[dict], Optional[str]]:
+    """행을 CreateProductRequest로 검증하여 (INSERT 값, 오류 메시지)를 반환합니다."""
+    if row is None:
+        return None, "Malformed row."
+
+    try:
+        request = CreateProductRequest.model_validate(row)
+    except ValidationError as e:
+        return None, "; ".join(
+            f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+            for error in e.errors()
+        )
+
+    quantity = request.inventory_quantity or 0
+    if not 0 <= quantity <= import_config.max_quantity:
+        return None, (
+            "inventory_quantity: must be between 0 and "
+            f"{import_config.max_quantity}."
+        )
+
+    if category_tree.get("tertiary", request.category_id) is None:
+        return None, "Invalid category."
+
+    product = Product(
+        seller_id=seller_id,
+        **request.model_dump(exclude_unset=True, exclude_none=True),
+    )
+    return {column: getattr(product, column) for column in IMPORT_COLUMNS}, None
+
+
+def read_batch(
+    rows: Iterator[Tuple[int, Optional[dict]]],
+    seller_id: int,
+    category_tree: CategoryTree,
+    batch_size: int,
+) -> List[Tuple[int, Optional[dict], Optional[str]]]:
+    """다음 batch_size개 행을 읽고 검증하여 (행 번호, INSERT 값, 오류 메시지) 목록을 반환합니다."""
+    return [
+        (row_number, *validate_row(row, seller_id, category_tree))
+        for row_number, row in islice(rows, batch_size)
+    ]
+
+
+async def create_import_job(seller_id: int) -> str:
+    job_id = uuid.uuid4().hex
+    task_redis = get_task_redis_client()
+    await task_redis.hset(
+        generate_import_job_key(job_id),
+        mapping={
+            "seller_id": seller_id,
+            "status": "pending",
+            "total": 0,
+            "processed": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "index_failed": 0,
+            "errors": "[]",
+        },
+    )
+    await task_redis.expire(generate_import_job_key(job_id), import_config.job_ttl)
+    return job_id
+
+
+async def get_import_job(job_id: str) -> Optional[dict]:
+    job = await get_task_redis_client().hgetall(generate_import_job_key(job_id))
+    if not job:
+        return None
+
+    return {
+        "job_id": job_id,
+        "seller_id": int(job["seller_id"]),
+        "status": job["status"],
+        "total": int(job["total"]),
+        "processed": int(job["processed"]),
+        "succeeded": int(job["succeeded"]),
+        "failed": int(job["failed"]),
+        "index_failed": int(job.get("index_failed", 0)),
+        "errors": json.loads(job["errors"]),
+    }
+
+
+async def save_product_batch(
+    session: AsyncSession, batch: List[Tuple[int, dict]]
+) -> List[int]:
+    """검증된 행 묶음의 상품과 재고를 다중 행 INSERT로 저장하고 한 번에 커밋합니다."""
+    product_repo = ProductRepository(session=session, read_session=session)
+    stock_repo = StockRepository(session=session, read_session=session)
+
+    product_ids = await product_repo.bulk_create_products(
+        values=[values for _, values in batch]
+    )
+    await stock_repo.bulk_create_stocks(
+        quantities={
+            product_id: values["inventory_quantity"]
+            for product_id, (_, values) in zip(product_ids, batch)
+        },
+        chunk_size=import_config.stock_chunk_size,
+    )
+    await session.commit()
+    return product_ids
+
+
+async def enqueue_product_batch(session: AsyncSession, product_ids: List[int]) -> None:
+    """커밋된 상품 묶음의 ES 색인 이벤트를 한 번에 작업 스트림에 추가합니다."""
+    product_repo = ProductRepository(session=session, read_session=session)
+    product_infos = await product_repo.get_product_documents(product_ids)
+    await add_products_to_stream(product_infos=product_infos)
+
+
+async def run_product_import(
+    job_id: str,
+    seller_id: int,
+    content: str,
+    file_format: str,
+    batch_size: int = import_config.batch_size,
+) -> None:
+    job_key = generate_import_job_key(job_id)
+    task_redis = get_task_redis_client()
+    errors: List[dict] = []
+    succeeded = failed = index_failed = processed = 0
+
+    def record_error(row_number: int, error: str) -> None:
+        nonlocal failed
+        failed += 1
+        if len(errors) < import_config.max_errors:
+            errors.append({"row": row_number, "error": error})
+
+    async def save_progress(status: str) -> None:
+        await task_redis.hset(
+            job_key,
+            mapping={
+                "status": status,
+                "processed": processed,
+                "succeeded": succeeded,
+                "failed": failed,
+                "index_failed": index_failed,
+                "errors": json.dumps(errors),
+            },
+        )
+
+    try:
+        rows = parse_rows(content, file_format)
+        await task_redis.hset(job_key, mapping={"status": "running"})
+
+        async with AsyncSession(get_engine()) as session:
+            category_tree = await category_tree_cache.get_tree(session)
+
+            while True:
+                # 파싱, 검증은 CPU 작업이므로 이벤트 루프를 막지 않도록 묶음 단위로 스레드에서 실행
+                rows_batch = await asyncio.to_thread(
+                    read_batch, rows, seller_id, category_tree, batch_size
+                )
+                if not rows_batch:
+                    break
+
+                batch = []
+                for row_number, values, error in rows_batch:
+                    if error:
+                        record_error(row_number, error)
+                    else:
+                        batch.append((row_number, values))
+
+                if batch:
+                    try:
+                        product_ids = await save_product_batch(session, batch)
+                    except Exception as e:
+                        # 묶음 단위로 저장하므로 실패한 묶음의 행은 모두 실패로 기록
+                        await session.rollback()
+                        for row_number, _ in batch:
+                            record_error(row_number, f"Failed to save product: {e}")
+                    else:
+                        succeeded += len(batch)
+                        try:
+                            await enqueue_product_batch(session, product_ids)
+                        except Exception as e:
+                            # 저장된 상품은 변경분 동기화에서 색인되므로 저장 실패와 구분하여 기록
+                            print(f"Error queueing imported products for indexing: {e}")
+                            index_failed += len(batch)
+
+                processed += len(rows_batch)
+                await save_progress("running")
+
+        # 행을 차례로 읽으므로 전체 행 수는 끝까지 읽은 뒤 기록
+        await task_redis.hset(job_key, mapping={"total": processed})
+        await save_progress("completed")
+    except Exception as e:
+        print(f"Error importing products: {e}")
+        await save_progress("failed")
+
+
+def start_product_import(
+    job_id: str, seller_id: int, content: str, file_format: str
+) -> None:
+    task = asyncio.create_task(
+        run_product_import(
+            job_id=job_id,
+            seller_id=seller_id,
+            content=content,
+            file_format=file_format,
+        )
+    )
+    running_import_tasks.add(task)
+    task.add_done_callback(running_import_tasks.discard)
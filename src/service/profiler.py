@@ -0,0 +1,131 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import List, Optional, Tuple
+
+Frame = Tuple[str, str, int]
+
+
+def describe_frame(frame) -> Frame:
+    code = frame.f_code
+    # 같은 이름의 파일(__init__.py 등)을 구분할 수 있도록 상위 디렉터리까지 표시
+    file = os.path.join(*code.co_filename.split(os.sep)[-2:])
+    return code.co_name, file, code.co_firstlineno
+
+
+def walk_stack(frame) -> List[Frame]:
+    """가장 바깥 호출부터 현재 실행 중인 함수 순서로 프레임을 나열합니다."""
+    stack = []
+    while frame is not None:
+        stack.append(describe_frame(frame))
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+class SamplingProfiler:
+    """별도 스레드에서 주기적으로 모든 스레드의 스택을 수집하는 샘플링 프로파일러
+
+    이벤트 루프 스레드의 스택에는 그 순간 실행 중인 asyncio 태스크 이름을 함께 기록합니다.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, interval: float):
+        self.loop = loop
+        self.interval = interval
+        self.loop_thread_id = threading.get_ident()
+        self.samples: Counter = Counter()
+        self.sample_count = 0
+        self.duration = 0.0
+
+    def current_task_name(self) -> Optional[str]:
+        # 다른 스레드에서 읽기만 하므로 루프 동작에 영향을 주지 않음
+        task = asyncio.tasks._current_tasks.get(self.loop)
+        return task.get_name() if task is not None else None
+
+    def take_sample(self, sampler_thread_id: int) -> None:
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == sampler_thread_id:
+                continue
+
+            root: List[Frame] = [
+                (f"thread:{thread_names.get(thread_id, thread_id)}", "", 0)
+            ]
+            if thread_id == self.loop_thread_id:
+                task_name = self.current_task_name()
+                if task_name:
+                    root.append((f"task:{task_name}", "", 0))
+            self.samples[tuple(root + walk_stack(frame))] += 1
+
+    def run(self, seconds: float) -> None:
+        sampler_thread_id = threading.get_ident()
+        start = time.monotonic()
+        next_sample = start
+        while time.monotonic() - start < seconds:
+            self.take_sample(sampler_thread_id)
+            self.sample_count += 1
+            next_sample += self.interval
+            time.sleep(max(next_sample - time.monotonic(), 0))
+        self.duration = time.monotonic() - start
+
+    def to_collapsed(self) -> str:
+        """flamegraph.pl / speedscope에서 읽을 수 있는 collapsed stack 형식"""
+
+        def format_frame(frame: Frame) -> str:
+            name, file, line = frame
+            return f"{name} ({file}:{line})" if file else name
+
+        return "".join(
+            ";".join(format_frame(frame) for frame in stack) + f" {count}\n"
+            for stack, count in self.samples.most_common()
+        )
+
+    def to_speedscope(self, name: str) -> dict:
+        frames: List[dict] = []
+        frame_indexes: dict = {}
+        samples, weights = [], []
+        for stack, count in self.samples.items():
+            indexes = []
+            for frame in stack:
+                if frame not in frame_indexes:
+                    frame_indexes[frame] = len(frames)
+                    frame_name, file, line = frame
+                    frames.append(
+                        {"name": frame_name, "file": file, "line": line}
+                        if file
+                        else {"name": frame_name}
+                    )
+                indexes.append(frame_indexes[frame])
+            samples.append(indexes)
+            weights.append(count * self.interval)
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": self.duration,
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+            "exporter": "sampling-profiler",
+        }
+
+
+# 한 프로세스에서 동시에 하나의 프로파일만 수집
+profiler_lock = asyncio.Lock()
+
+
+async def profile(seconds: float, interval: float) -> SamplingProfiler:
+    loop = asyncio.get_running_loop()
+    profiler = SamplingProfiler(loop=loop, interval=interval)
+    await loop.run_in_executor(None, profiler.run, seconds)
+    return profiler
@@ -0,0 +1,154 @@
+import math
+from functools import lru_cache
+from typing import Callable, Optional
+
+from fastapi import Depends, HTTPException, Request
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.config import rate_limit as rate_limit_config
+from src.redis_client import get_redis_client
+from src.service.session import SessionService
+
+# 토큰 버킷: 조회, 충전, 차감을 하나의 스크립트로 원자적으로 처리
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local rate = capacity / period
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+
+local allowed = 0
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    retry_after = (1 - tokens) / rate
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(period))
+return {allowed, tostring(retry_after)}
+"""
+
+
+@lru_cache(maxsize=None)
+def parse_rule(rule: str) -> Optional[tuple[int, int]]:
+    """'<요청 수>/<초>' 형식의 규칙을 (capacity, period)로 변환합니다.
+
+    규칙 형식은 설정을 불러올 때 검증하며, 변환 결과는 규칙별로 한 번만 계산합니다.
+    """
+    if not rule:
+        return None
+
+    capacity, period = rule.split("/")
+    return int(capacity), int(period)
+
+
+class RateLimiter:
+    def __init__(self, redis_client: Redis = Depends(get_redis_client)):
+        self.redis_client = redis_client
+        self.script = redis_client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    @staticmethod
+    def generate_rate_limit_key(scope: str, key: str) -> str:
+        return f"rate_limit:{scope}:{key}"
+
+    async def hit(self, scope: str, key: Optional[str], rule: str) -> None:
+        parsed_rule = parse_rule(rule)
+        if parsed_rule is None or key is None:
+            return
+
+        capacity, period = parsed_rule
+        try:
+            allowed, retry_after = await self.script(
+                keys=[self.generate_rate_limit_key(scope=scope, key=key)],
+                args=[capacity, period],
+            )
+        except RedisError as e:
+            # Redis 장애 시 요청을 차단하지 않음 (fail open)
+            print(f"Error checking rate limit: {e}")
+            return
+
+        if not allowed:
+            raise HTTPException(
+                status_code=429,
+                detail="Too Many Requests",
+                headers={"Retry-After": str(max(1, math.ceil(float(retry_after))))},
+            )
+
+
+def client_ip_key(request: Request) -> Optional[str]:
+    return request.client.host if request.client else None
+
+
+async def session_or_ip_key(
+    request: Request, session_service: SessionService = Depends()
+) -> Optional[str]:
+    """유효한 세션이면 사용자(또는 세션) 단위로, 아니면 클라이언트 IP 단위로 제한합니다.
+
+    쿠키 값만으로 키를 만들면 요청마다 임의의 session_id를 보내 제한을 우회할 수 있으므로
+    Redis에 존재하는 세션인 경우에만 세션 기준 키를 사용합니다.
+    """
+    session_id = request.cookies.get("session_id")
+    if session_id:
+        try:
+            session = await session_service.get_session(session_id=session_id)
+        except RedisError as e:
+            print(f"Error resolving session for rate limit: {e}")
+            session = None
+        if session:
+            if "user_id" in session:
+                return f"user:{session['user_id']}"
+            return f"session:{session_id}"
+    return f"ip:{client_ip_key(request)}"
+
+
+def rate_limit(
+    scope: str,
+    rule: str,
+    key_func: Callable[..., Optional[str]] = client_ip_key,
+):
+    """라우트별 요청 수 제한 의존성을 생성합니다.
+
+    rule은 RateLimitConfig의 필드 이름이며 요청 시점의 설정 값을 사용합니다.
+    key_func는 제한 키를 반환하는 의존성입니다.
+    """
+
+    async def dependency(
+        key: Optional[str] = Depends(key_func),
+        rate_limiter: RateLimiter = Depends(),
+    ):
+        await rate_limiter.hit(
+            scope=scope, key=key, rule=getattr(rate_limit_config, rule)
+        )
+
+    return dependency
+
+
+class ConcurrencyLimiter:
+    """프로세스 내 동시 처리 수를 제한합니다. 한도를 넘으면 대기하지 않고 바로 503을 반환합니다."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_flight = 0
+
+    async def __call__(self):
+        if self.in_flight >= self.limit:
+            raise HTTPException(
+                status_code=503,
+                detail="Service Overloaded",
+                headers={"Retry-After": "1"},
+            )
+
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
@@ -0,0 +1,102 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Optional
+
+from sqlalchemy import text
+
+from src.config import readiness as readiness_config
+from src.database import get_engine, get_read_engine
+from src.elastic_client import get_elasticsearch_client
+from src.redis_client import get_redis_client, get_task_redis_client
+
+
+async def probe_database(target_engine) -> None:
+    async with target_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def probe_redis(redis_client) -> None:
+    await redis_client.ping()
+
+
+async def probe_elasticsearch() -> None:
+    if not await get_elasticsearch_client().ping():
+        raise ConnectionError("Elasticsearch ping failed")
+
+
+async def probe_stream_consumer(stream_task: Optional[asyncio.Task]) -> None:
+    if stream_task is None or stream_task.done():
+        raise RuntimeError("Task stream consumer is not running")
+
+    groups = await get_task_redis_client().xinfo_groups("task_stream")
+    if not any(group["name"] == "task_group" for group in groups):
+        raise RuntimeError("Consumer group task_group does not exist")
+
+
+async def run_probe(probe: Callable[[], Awaitable[None]], timeout: float) -> dict:
+    """점검 함수를 제한 시간 안에 실행하고 상태(ok, timeout, error)와 소요 시간을 반환합니다."""
+    start = time.perf_counter()
+    try:
+        await asyncio.wait_for(probe(), timeout=timeout)
+        status = {"status": "ok"}
+    except asyncio.TimeoutError:
+        status = {"status": "timeout"}
+    except Exception as e:
+        status = {"status": "error", "error": str(e) or type(e).__name__}
+    status["latency_ms"] = round((time.perf_counter() - start) * 1000, 2)
+    return status
+
+
+class ReadinessChecker:
+    """의존성을 동시에 점검하고, 짧은 시간 동안 결과를 재사용하여 점검 요청이 의존성 부하로 이어지지 않게 합니다."""
+
+    def __init__(self, ttl: float, timeout: float):
+        self.ttl = ttl
+        self.timeout = timeout
+        self.result: Optional[dict] = None
+        self.checked_at = 0.0
+        self.lock = asyncio.Lock()
+
+    def build_probes(
+        self, stream_task: Optional[asyncio.Task]
+    ) -> Dict[str, Callable[[], Awaitable[None]]]:
+        engine, read_engine = get_engine(), get_read_engine()
+        probes = {
+            "database": lambda: probe_database(engine),
+            "redis_session": lambda: probe_redis(get_redis_client()),
+            "redis_task": lambda: probe_redis(get_task_redis_client()),
+            "elasticsearch": probe_elasticsearch,
+            "stream_consumer": lambda: probe_stream_consumer(stream_task),
+        }
+        if read_engine is not engine:
+            probes["database_replica"] = lambda: probe_database(read_engine)
+        return probes
+
+    async def check(self, stream_task: Optional[asyncio.Task] = None) -> dict:
+        if self.result is not None and time.monotonic() - self.checked_at < self.ttl:
+            return self.result
+
+        # 동시에 들어온 요청은 진행 중인 점검 결과를 함께 사용
+        async with self.lock:
+            if (
+                self.result is not None
+                and time.monotonic() - self.checked_at < self.ttl
+            ):
+                return self.result
+
+            probes = self.build_probes(stream_task)
+            statuses = await asyncio.gather(
+                *(run_probe(probe, self.timeout) for probe in probes.values())
+            )
+            components = dict(zip(probes.keys(), statuses))
+            self.result = {
+                "ready": all(status["status"] == "ok" for status in statuses),
+                "components": components,
+            }
+            self.checked_at = time.monotonic()
+            return self.result
+
+
+readiness_checker = ReadinessChecker(
+    ttl=readiness_config.cache_ttl, timeout=readiness_config.probe_timeout
+)
@@ -10,25 +10,78 @@ from src.redis_client import get_redis_client
 
 
 class SessionService:
+    session_ttl: int = 3600
+
     def __init__(self, redis_client: Redis = Depends(get_redis_client)):
         self.redis_client = redis_client
 
+    @staticmethod
+    def generate_user_sessions_key(user_id: int) -> str:
+        return f"user_sessions:{user_id}"
+
     async def create_session(self, session_data: dict) -> str:
         session_id = secrets.token_hex(16)
-        session_expires = timedelta(hours=1)
-        await self.redis_client.setex(
-            session_id, session_expires, value=json.dumps(session_data)
-        )
+        session_expires = timedelta(seconds=self.session_ttl)
+
+        if "user_id" not in session_data:
+            await self.redis_client.setex(
+                session_id, session_expires, value=json.dumps(session_data)
+            )
+            return session_id
+
+        # 프로필 변경 시 세션을 무효화할 수 있도록 사용자별 세션 목록 관리
+        # 세션은 조회할 때마다 연장되므로 목록에는 TTL을 두지 않고 로그인 시 만료된 세션만 정리
+        key = self.generate_user_sessions_key(user_id=session_data["user_id"])
+        await self.prune_user_sessions(key)
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            pipe.setex(session_id, session_expires, value=json.dumps(session_data))
+            pipe.sadd(key, session_id)
+            pipe.persist(key)
+            await pipe.execute()
+
         return session_id
 
-    async def get_session(self, session_id: str) -> Optional[dict]:
-        session_data = await self.redis_client.get(session_id)
-        if session_data:
-            return json.loads(session_data)
-        return None
+    async def prune_user_sessions(self, key: str):
+        """사용자별 세션 목록에서 이미 만료된 세션 ID를 제거합니다."""
+        session_ids = list(await self.redis_client.smembers(key))
+        if not session_ids:
+            return
+
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for session_id in session_ids:
+                pipe.exists(session_id)
+            exists = await pipe.execute()
+
+        expired_ids = [
+            session_id for session_id, alive in zip(session_ids, exists) if not alive
+        ]
+        if expired_ids:
+            await self.redis_client.srem(key, *expired_ids)
+
+    async def get_session(
+        self, session_id: str, ttl: Optional[int] = None
+    ) -> Optional[dict]:
+        if ttl is None:
+            session_data = await self.redis_client.get(session_id)
+        else:
+            # GETEX: 세션 조회와 TTL 갱신을 한 번의 호출로 처리
+            session_data = await self.redis_client.getex(session_id, ex=ttl)
+        if not session_data:
+            return None
+        return json.loads(session_data)
+
+    async def delete_session(self, session_id: str, user_id: Optional[int] = None):
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            pipe.delete(session_id)
+            if user_id is not None:
+                pipe.srem(self.generate_user_sessions_key(user_id=user_id), session_id)
+            await pipe.execute()
 
-    async def delete_session(self, session_id: str):
-        await self.redis_client.delete(session_id)
+    async def invalidate_user_sessions(self, user_id: int):
+        """사용자의 모든 세션을 삭제합니다. 비밀번호나 세션에 저장된 프로필 정보가 변경되었을 때 호출합니다."""
+        key = self.generate_user_sessions_key(user_id=user_id)
+        session_ids = await self.redis_client.smembers(key)
+        await self.redis_client.delete(key, *session_ids)
 
-    async def extend_session(self, session_id: str, ttl: int = 3600):
-        await self.redis_client.expire(session_id, ttl)
+    async def extend_session(self, session_id: str, ttl: Optional[int] = None):
+        await self.redis_client.expire(session_id, ttl or self.session_ttl)
@@ -1,44 +1,107 @@
+import asyncio
+from datetime import datetime, timedelta
+
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.database import engine
+from src.config import sync as sync_config
+from src.database import get_read_engine
 from src.elastic_client import get_elasticsearch_client
 from src.models.repository import ProductRepository
+from src.redis_client import get_task_redis_client
+
+SYNC_WATERMARK_KEY = "sync:products:watermark"
+SYNC_LOCK_KEY = "sync:products:lock"
+
+
+def build_bulk_index_operations(product_documents: list[dict]) -> list[dict]:
+    operations = []
+    for document in product_documents:
+        operations.append({"index": {"_index": "products", "_id": document["id"]}})
+        operations.append(document)
+    return operations
+
 
-es = get_elasticsearch_client()
+def build_bulk_update_operations(product_infos: list[dict]) -> list[dict]:
+    # 변경된 필드만 부분 업데이트
+    operations = []
+    for product_info in product_infos:
+        operations.append({"update": {"_index": "products", "_id": product_info["id"]}})
+        operations.append({"doc": product_info})
+    return operations
 
 
-async def sync_all_products():
-    async with AsyncSession(engine) as session:
-        product_repo = ProductRepository(session)
+async def sync_all_products(chunk_size: int = 1000):
+    es = get_elasticsearch_client()
+    async with AsyncSession(get_read_engine()) as session:
+        product_repo = ProductRepository(session=session, read_session=session)
         try:
-            products = await product_repo.fetch_all_products()  # 기존 상품 전체 가져오기
-
-            for product in products:
-                product_info = product.model_dump()
-
-                ##### 필요한 추가 정보 입력 #####
-                # 1. 판매자 정보 : 브랜드명, 전화번호
-                product_info["brand_name"] = product.seller.brand_name
-                product_info["contact_number"] = product.seller.contact_number
-                # 2. 카테고리 정보 : 종류별(대/중/소) 카테고리 ID, 카테고리명
-                # 소분류 (id는 상품 정보에 category_id 필드로 이미 포함되어 있음)
-                product_info["category_3"] = product.category.name
-                # 중분류
-                product_info["category_id_2"] = product.category.secondary_category.id
-                product_info["category_2"] = product.category.secondary_category.name
-                # 대분류
-                product_info[
-                    "category_id_1"
-                ] = product.category.secondary_category.primary_category.id
-                product_info[
-                    "category_1"
-                ] = product.category.secondary_category.primary_category.name
-
-                await es.index(
-                    index="products",
-                    id=product_info["id"],
-                    body=product_info,
-                    refresh="wait_for",
+            # 상품 문서를 청크 단위로 스트리밍하여 bulk 색인
+            async for product_documents in product_repo.stream_product_documents(
+                chunk_size=chunk_size
+            ):
+                response = await es.bulk(
+                    operations=build_bulk_index_operations(product_documents)
                 )
+                if response["errors"]:
+                    print("Error syncing some products to Elasticsearch")
+
+            await es.indices.refresh(index="products")
         except Exception as e:
             print(f"Error syncing all products: {e}")
+
+
+async def sync_changed_products(
+    chunk_size: int = sync_config.chunk_size, overlap: int = sync_config.overlap
+) -> int:
+    """마지막 동기화 이후 변경된 상품만 bulk 색인하고 워터마크를 갱신합니다."""
+    es = get_elasticsearch_client()
+    task_redis = get_task_redis_client()
+    watermark = await task_redis.get(SYNC_WATERMARK_KEY)
+    updated_at = (
+        datetime.fromisoformat(watermark) - timedelta(seconds=overlap)
+        if watermark
+        else datetime.min
+    )
+    after_id = 0
+    synced_count = 0
+
+    async with AsyncSession(get_read_engine()) as session:
+        product_repo = ProductRepository(session=session, read_session=session)
+        while True:
+            product_documents = await product_repo.get_product_documents_updated_since(
+                updated_at=updated_at, after_id=after_id, limit=chunk_size
+            )
+            if not product_documents:
+                break
+
+            response = await es.bulk(
+                operations=build_bulk_index_operations(product_documents)
+            )
+            if response["errors"]:
+                # 워터마크를 갱신하지 않고 다음 실행에서 다시 시도
+                print("Error syncing changed products to Elasticsearch")
+                break
+
+            last_document = product_documents[-1]
+            updated_at = datetime.fromisoformat(last_document["updated_at"])
+            after_id = last_document["id"]
+            await task_redis.set(SYNC_WATERMARK_KEY, last_document["updated_at"])
+            synced_count += len(product_documents)
+
+            if len(product_documents) < chunk_size:
+                break
+
+    return synced_count
+
+
+async def run_product_sync_periodically(interval: int = sync_config.interval):
+    while True:
+        try:
+            # 여러 워커 중 하나만 실행되도록 실행 주기만큼 잠금
+            if await get_task_redis_client().set(
+                SYNC_LOCK_KEY, "1", nx=True, ex=interval
+            ):
+                await sync_changed_products()
+        except Exception as e:
+            print(f"Error syncing changed products: {e}")
+        await asyncio.sleep(interval)
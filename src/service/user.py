@@ -1,16 +1,47 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 import bcrypt
 
+from src.config import password as password_config
+
+# bcrypt 연산이 이벤트 루프를 막지 않도록 크기가 제한된 스레드 풀에서 실행
+password_executor = ThreadPoolExecutor(
+    max_workers=password_config.hash_workers, thread_name_prefix="password-hash"
+)
+
 
 class UserService:
     encoding: str = "UTF-8"
+    rounds: int = password_config.bcrypt_rounds
 
-    def hash_password(self, plain_password: str) -> str:
+    def _hash_password(self, plain_password: str) -> str:
         hashed_password: bytes = bcrypt.hashpw(
-            plain_password.encode(self.encoding), salt=bcrypt.gensalt()
+            plain_password.encode(self.encoding), salt=bcrypt.gensalt(self.rounds)
         )
         return hashed_password.decode(self.encoding)
 
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+    def _verify_password(self, plain_password: str, hashed_password: str) -> bool:
         return bcrypt.checkpw(
             plain_password.encode(self.encoding), hashed_password.encode(self.encoding)
         )
+
+    async def hash_password(self, plain_password: str) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            password_executor, self._hash_password, plain_password
+        )
+
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            password_executor, self._verify_password, plain_password, hashed_password
+        )
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        # bcrypt 해시 형식: $2b$<cost>$<salt+hash>
+        parts = hashed_password.split("$")
+        if len(parts) != 4 or not parts[2].isdigit():
+            return False
+
+        return int(parts[2]) != self.rounds
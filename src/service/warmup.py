@@ -0,0 +1,116 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict
+
+from sqlalchemy import pool, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.config import rate_limit as rate_limit_config
+from src.config import warmup as warmup_config
+from src.database import get_engine, get_read_engine
+from src.elastic_client import get_elasticsearch_client
+from src.redis_client import get_redis_client, get_task_redis_client
+from src.service.category import category_tree_cache
+from src.service.rate_limit import TOKEN_BUCKET_SCRIPT
+from src.service.readiness import run_probe
+
+
+async def open_database_connections(target_engine: AsyncEngine, count: int) -> None:
+    # 커넥션을 모두 잡은 상태에서 반납해야 풀에 count개가 남음
+    engine_pool = target_engine.sync_engine.pool
+    if isinstance(engine_pool, pool.QueuePool):
+        count = min(count, engine_pool.size())
+    else:
+        count = 1
+
+    connections = []
+    try:
+        for _ in range(count):
+            connection = await target_engine.connect()
+            connections.append(connection)
+            await connection.execute(text("SELECT 1"))
+    finally:
+        for connection in connections:
+            await connection.close()
+
+
+async def open_redis_connections(redis_client, count: int) -> None:
+    # 동시에 실행한 명령마다 풀에서 별도 커넥션을 연결
+    await asyncio.gather(*(redis_client.ping() for _ in range(count)))
+
+
+async def open_elasticsearch_connections(count: int) -> None:
+    es_client = get_elasticsearch_client()
+    if not all(await asyncio.gather(*(es_client.ping() for _ in range(count)))):
+        raise ConnectionError("Elasticsearch ping failed")
+
+
+async def load_category_tree() -> None:
+    async with AsyncSession(get_read_engine()) as session:
+        await category_tree_cache.load(session)
+
+
+async def load_rate_limit_script() -> None:
+    # 첫 요청이 NOSCRIPT 응답 후 스크립트를 다시 보내지 않도록 서버에 미리 등록
+    await get_redis_client().script_load(TOKEN_BUCKET_SCRIPT)
+
+
+def build_steps(connections: int) -> Dict[str, Callable[[], Awaitable[None]]]:
+    steps = {"category_tree": load_category_tree}
+    rate_limit_rules = (
+        rate_limit_config.login_ip,
+        rate_limit_config.login_email,
+        rate_limit_config.search,
+        rate_limit_config.search_ip,
+    )
+    if any(rate_limit_rules):
+        steps["rate_limit_script"] = load_rate_limit_script
+    if connections <= 0:
+        return steps
+
+    engine, read_engine = get_engine(), get_read_engine()
+    steps.update(
+        {
+            "database": lambda: open_database_connections(engine, connections),
+            "redis_session": lambda: open_redis_connections(
+                get_redis_client(), connections
+            ),
+            "redis_task": lambda: open_redis_connections(
+                get_task_redis_client(), connections
+            ),
+            "elasticsearch": lambda: open_elasticsearch_connections(connections),
+        }
+    )
+    if read_engine is not engine:
+        steps["database_replica"] = lambda: open_database_connections(
+            read_engine, connections
+        )
+    return steps
+
+
+async def warm_up(
+    connections: int = warmup_config.connections,
+    timeout: float = warmup_config.timeout,
+) -> Dict[str, dict]:
+    """커넥션 풀을 미리 열고 캐시를 적재하여 첫 요청이 연결 수립 비용을 부담하지 않게 합니다.
+
+    단계별로 동시에 실행하며, 실패하거나 제한 시간을 넘긴 단계는 기록만 하고 기동을 계속합니다.
+    (의존성 상태는 /ready에서 확인)
+    """
+    start = time.perf_counter()
+    steps = build_steps(connections)
+    statuses = await asyncio.gather(
+        *(run_probe(step, timeout) for step in steps.values())
+    )
+    results = dict(zip(steps.keys(), statuses))
+
+    summary = ", ".join(
+        f"{name}={result['status']}({result['latency_ms']}ms)"
+        for name, result in results.items()
+    )
+    print(f"Warm-up finished in {time.perf_counter() - start:.3f}s: {summary}")
+    for name, result in results.items():
+        if result["status"] == "error":
+            print(f"Error warming up {name}: {result['error']}")
+    return results
@@ -0,0 +1,87 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from src.config import profiler as profiler_config
+
+
+@pytest.mark.asyncio
+async def test_profile_disabled_without_token(client: AsyncClient, mocker):
+    # given
+    mocker.patch.object(profiler_config, "token", "")
+
+    # when
+    response = await client.post(
+        "/debug/profile?seconds=0.1", headers={"X-Internal-Token": ""}
+    )
+
+    # then
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_profile_with_invalid_token(client: AsyncClient, mocker):
+    # given
+    mocker.patch.object(profiler_config, "token", "secret")
+
+    # when
+    response = await client.post(
+        "/debug/profile?seconds=0.1", headers={"X-Internal-Token": "wrong"}
+    )
+
+    # then
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.asyncio
+async def test_profile_collapsed_successfully(client: AsyncClient, mocker):
+    # given
+    mocker.patch.object(profiler_config, "token", "secret")
+
+    async def busy_work():
+        for _ in range(20):
+            time.sleep(0.01)
+            await asyncio.sleep(0)
+
+    # when
+    response, _ = await asyncio.gather(
+        client.post(
+            "/debug/profile?seconds=0.3&interval_ms=5",
+            headers={"X-Internal-Token": "secret"},
+        ),
+        asyncio.create_task(busy_work(), name="busy-task"),
+    )
+
+    # then
+    assert response.status_code == status.HTTP_200_OK
+    lines = response.text.splitlines()
+    assert lines
+    stack, count = lines[0].rsplit(" ", 1)
+    assert stack.startswith("thread:")
+    assert int(count) > 0
+    # 이벤트 루프 스레드의 스택에는 실행 중인 태스크 이름이 포함된다.
+    assert any(";task:busy-task;" in line for line in lines)
+
+
+@pytest.mark.asyncio
+async def test_profile_speedscope_successfully(client: AsyncClient, mocker):
+    # given
+    mocker.patch.object(profiler_config, "token", "secret")
+
+    # when
+    response = await client.post(
+        "/debug/profile?seconds=0.1&format=speedscope",
+        headers={"X-Internal-Token": "secret"},
+    )
+
+    # then
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    profile = data["profiles"][0]
+    assert profile["type"] == "sampled"
+    assert len(profile["samples"]) == len(profile["weights"]) > 0
+    frame_count = len(data["shared"]["frames"])
+    assert all(0 <= index < frame_count for s in profile["samples"] for index in s)
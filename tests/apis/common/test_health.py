@@ -1,7 +1,11 @@
+import asyncio
+
 import pytest
 from fastapi import status
 from httpx import AsyncClient
 
+from src.service.readiness import readiness_checker
+
 
 @pytest.mark.asyncio
 async def test_health_successfully(client: AsyncClient):
@@ -10,3 +14,73 @@ async def test_health_successfully(client: AsyncClient):
 
     # then
     assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.asyncio
+async def test_database_pool_status_successfully(client: AsyncClient):
+    # when
+    response = await client.get("/health/database")
+
+    # then
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"primary": {"pool_class": "StaticPool"}}
+
+
+@pytest.mark.asyncio
+async def test_readiness_successfully(client: AsyncClient, mocker):
+    # given
+    readiness_checker.result = None
+    probe_redis = mocker.patch("src.service.readiness.probe_redis")
+    mocker.patch("src.service.readiness.probe_elasticsearch")
+    mocker.patch("src.service.readiness.probe_stream_consumer")
+
+    # when
+    response = await client.get("/ready")
+
+    # then
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["ready"] is True
+    assert set(data["components"]) == {
+        "database",
+        "redis_session",
+        "redis_task",
+        "elasticsearch",
+        "stream_consumer",
+    }
+    assert all(c["status"] == "ok" for c in data["components"].values())
+    assert probe_redis.call_count == 2
+
+    # 캐시 유효 시간 내에는 의존성을 다시 점검하지 않는다.
+    await client.get("/ready")
+    assert probe_redis.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_readiness_with_slow_dependency(client: AsyncClient, mocker):
+    # given
+    async def slow_probe():
+        await asyncio.sleep(10)
+
+    readiness_checker.result = None
+    mocker.patch.object(readiness_checker, "timeout", 0.05)
+    mocker.patch("src.service.readiness.probe_redis")
+    mocker.patch("src.service.readiness.probe_elasticsearch", side_effect=slow_probe)
+    mocker.patch(
+        "src.service.readiness.probe_stream_consumer",
+        side_effect=RuntimeError("Task stream consumer is not running"),
+    )
+
+    # when
+    response = await client.get("/ready")
+
+    # then
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    components = response.json()["components"]
+    assert components["database"]["status"] == "ok"
+    assert components["elasticsearch"]["status"] == "timeout"
+    assert components["stream_consumer"] == {
+        "status": "error",
+        "error": "Task stream consumer is not running",
+        "latency_ms": components["stream_consumer"]["latency_ms"],
+    }
@@ -0,0 +1,95 @@
+import asyncio
+import json
+import time
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from src.loop_monitor import EventLoopMonitor
+from src.metrics import http_requests_total
+from src.redis_client import get_task_redis_client
+
+
+@pytest.mark.asyncio
+async def test_metrics_successfully(client: AsyncClient, mocker):
+    # given
+    http_requests_total.values.clear()
+    other_worker_snapshot = {
+        "http_requests_total": {
+            "type": "counter",
+            "help": "HTTP requests by route and status",
+            "labelnames": ["method", "route", "status"],
+            "samples": [[["GET", "/health/database", "200"], 2]],
+        }
+    }
+    task_redis = get_task_redis_client()
+    mocker.patch.object(task_redis, "hset", new=mocker.AsyncMock(return_value=1))
+    mocker.patch.object(
+        task_redis,
+        "hgetall",
+        new=mocker.AsyncMock(
+            return_value={
+                "99999": json.dumps(
+                    {"published_at": time.time(), "metrics": other_worker_snapshot}
+                )
+            }
+        ),
+    )
+    mocker.patch(
+        "src.metrics.collect_stream_gauges",
+        return_value=[("task_stream_lag", "Tasks not yet delivered", 3)],
+    )
+    await client.get("/health/database")
+
+    # when
+    response = await client.get("/metrics")
+
+    # then
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain")
+    lines = response.text.splitlines()
+    # 다른 워커의 카운터와 합산된다.
+    assert (
+        'http_requests_total{method="GET",route="/health/database",status="200"} 3.0'
+        in lines
+    )
+    assert any(
+        line.startswith('http_request_duration_seconds_count{method="GET"')
+        for line in lines
+    )
+    assert "task_stream_lag 3" in lines
+    assert any(
+        line.startswith('redis_pool_connections{client="task"') for line in lines
+    )
+
+
+def block_event_loop(seconds: float):
+    time.sleep(seconds)
+
+
+@pytest.mark.asyncio
+async def test_event_loop_monitor_captures_blocking_call(capsys):
+    # given
+    monitor = EventLoopMonitor(interval=0.01, block_threshold=0.05)
+    task = asyncio.create_task(monitor.run())
+    await asyncio.sleep(0.05)
+
+    # when
+    block_event_loop(0.3)
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # then
+    assert monitor.blocked_count >= 1
+    offender = monitor.worst_offenders()[0]
+    assert offender["max_seconds"] >= 0.2
+    # 루프를 점유한 함수의 스택이 기록된다.
+    assert "block_event_loop" in "".join(offender["stack"])
+    assert monitor.percentiles()["max"] == offender["max_seconds"]
+    # 종료 시 가장 오래 점유한 스택의 요약을 로그로 남긴다.
+    summary = capsys.readouterr().out.split("worst offenders:\n")[1]
+    assert summary.startswith("1. max=")
+    assert "block_event_loop" in summary
@@ -0,0 +1,67 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.models.repository import ProductRepository, StockRepository, UserRepository
+
+
+def build_sessions():
+    primary, replica = MagicMock(), MagicMock()
+    for session in (primary, replica):
+        session.exec = AsyncMock(return_value=MagicMock(all=MagicMock(return_value=[])))
+    return primary, replica
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "repository_class, method, kwargs",
+    [
+        # 재고 수는 주문, 장바구니 처리 직후 값이 필요하므로 기본 DB에서 조회
+        (StockRepository, "count_stocks_by_product_id", {"product_id": 1}),
+        (StockRepository, "count_stocks_by_product_ids", {"product_ids": [1, 2]}),
+        # 로그인, 인증 확인은 방금 변경된 사용자 정보를 확인해야 하므로 기본 DB에서 조회
+        (UserRepository, "get_user_by_email", {"email": "test@example.com"}),
+        (UserRepository, "get_user_by_id", {"user_id": 1}),
+        # 조회 후 수정/삭제하는 상품은 같은 세션(기본 DB)에서 조회
+        (ProductRepository, "get_product_by_id", {"product_id": 1}),
+    ],
+)
+async def test_reads_routed_to_primary(repository_class, method, kwargs):
+    # given
+    primary, replica = build_sessions()
+    repository = repository_class(session=primary, read_session=replica)
+
+    # when
+    await getattr(repository, method)(**kwargs)
+
+    # then
+    primary.exec.assert_awaited_once()
+    replica.exec.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "repository_class, method, kwargs",
+    [
+        (UserRepository, "get_user_by_id", {"user_id": 1, "read_only": True}),
+        (
+            UserRepository,
+            "get_user_by_email",
+            {"email": "test@example.com", "read_only": True},
+        ),
+        (ProductRepository, "get_product_by_id", {"product_id": 1, "read_only": True}),
+        (ProductRepository, "get_product_list", {}),
+        (ProductRepository, "get_product_stock", {"product_id": 1}),
+    ],
+)
+async def test_reads_routed_to_replica(repository_class, method, kwargs):
+    # given
+    primary, replica = build_sessions()
+    repository = repository_class(session=primary, read_session=replica)
+
+    # when
+    await getattr(repository, method)(**kwargs)
+
+    # then
+    replica.exec.assert_awaited_once()
+    primary.exec.assert_not_called()
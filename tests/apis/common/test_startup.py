@@ -0,0 +1,126 @@
+import asyncio
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from httpx import AsyncClient
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.database import build_database_url
+from src.models.product import PrimaryCategory
+from src.service.category import category_tree_cache
+from src.service.warmup import warm_up
+
+ROOT_DIR = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+# 워커 기동 시 애플리케이션 import에 허용하는 시간(초)
+IMPORT_TIME_BUDGET_SECONDS = 3.0
+
+IMPORT_SCRIPT = """
+import json
+import time
+
+start = time.perf_counter()
+import src.main
+elapsed = time.perf_counter() - start
+
+from src import database, elastic_client, redis_client
+
+print(json.dumps({
+    "elapsed": elapsed,
+    "clients": {
+        "engine": database._engine is not None,
+        "read_engine": database._read_engine is not None,
+        "redis": redis_client._redis_client is not None,
+        "task_redis": redis_client._task_redis_client is not None,
+        "elasticsearch": elastic_client._es_client is not None,
+    },
+}))
+"""
+
+
+def test_import_main_within_budget():
+    # when
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # then
+    data = json.loads(result.stdout.splitlines()[-1])
+    # import 시점에는 클라이언트, 커넥션 풀을 생성하지 않는다.
+    assert not any(data["clients"].values()), data["clients"]
+    assert data["elapsed"] < IMPORT_TIME_BUDGET_SECONDS
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("sqlite:///:memory:", "sqlite+aiosqlite:///:memory:"),
+        ("postgresql://user:pw@db/app", "postgresql+asyncpg://user:pw@db/app"),
+        ("postgresql+asyncpg://user:pw@db/app", "postgresql+asyncpg://user:pw@db/app"),
+    ],
+)
+def test_build_database_url_successfully(url, expected):
+    assert build_database_url(url) == expected
+
+
+@pytest.mark.parametrize(
+    "url", ["mysql://user:pw@db/app", "mysql+aiomysql://user:pw@db/app"]
+)
+def test_build_database_url_rejects_mysql(url):
+    with pytest.raises(ValueError, match="Unsupported database backend: mysql"):
+        build_database_url(url)
+
+
+@pytest.mark.asyncio
+async def test_warm_up_successfully(client: AsyncClient, session: AsyncSession, mocker):
+    # given
+    session.add(PrimaryCategory(id=1, name="스킨케어"))
+    await session.commit()
+    category_tree_cache.invalidate()
+    open_redis_connections = mocker.patch("src.service.warmup.open_redis_connections")
+    mocker.patch("src.service.warmup.open_elasticsearch_connections")
+
+    # when
+    results = await warm_up(connections=2, timeout=1)
+
+    # then
+    assert set(results) == {
+        "category_tree",
+        "database",
+        "redis_session",
+        "redis_task",
+        "elasticsearch",
+    }
+    assert all(result["status"] == "ok" for result in results.values())
+    assert open_redis_connections.call_count == 2
+    assert category_tree_cache.tree.get("primary", 1).name == "스킨케어"
+
+
+@pytest.mark.asyncio
+async def test_warm_up_with_unavailable_dependency(client: AsyncClient, mocker):
+    # given
+    async def slow_connect(*args):
+        await asyncio.sleep(10)
+
+    mocker.patch("src.service.warmup.open_redis_connections", side_effect=slow_connect)
+    mocker.patch(
+        "src.service.warmup.open_elasticsearch_connections",
+        side_effect=ConnectionError("Elasticsearch ping failed"),
+    )
+
+    # when
+    results = await warm_up(connections=2, timeout=0.05)
+
+    # then
+    assert results["database"]["status"] == "ok"
+    assert results["redis_session"]["status"] == "timeout"
+    assert results["elasticsearch"]["status"] == "error"
+    assert results["elasticsearch"]["error"] == "Elasticsearch ping failed"
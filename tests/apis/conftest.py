@@ -5,7 +5,7 @@ from httpx import AsyncClient
 from redis.asyncio import Redis
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.database import close_db, create_db_and_tables, engine
+from src.database import close_db, create_db_and_tables, get_engine
 from src.main import app
 from src.redis_client import get_redis_client
 
@@ -20,7 +20,7 @@ async def client() -> AsyncClient:
 
 @pytest_asyncio.fixture(scope="function")
 async def session() -> AsyncSession:
-    async with AsyncSession(engine) as session:
+    async with AsyncSession(get_engine()) as session:
         yield session
 
 
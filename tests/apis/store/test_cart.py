@@ -0,0 +1,37 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from src.models.user import UserType
+from src.service.cart import CartService
+from src.service.session import SessionService
+
+
+# 'GET /cart' API가 세션 ID 없이 호출되면 400을 응답한다.
+@pytest.mark.asyncio
+async def test_get_cart_without_session_id(client: AsyncClient):
+    response = await client.get("/cart")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {"detail": "Missing Session ID"}
+
+
+# 'GET /cart' API는 세션 조회 시 만료 시간을 함께 연장한다.
+@pytest.mark.asyncio
+async def test_get_cart_extends_session(client: AsyncClient, mocker):
+    mock_session_id = "valid_session_id"
+
+    get_session = mocker.patch.object(
+        SessionService,
+        "get_session",
+        return_value={"user_id": 1, "user_type": UserType.BUYER},
+    )
+    mocker.patch.object(CartService, "get_cart", return_value=[])
+
+    response = await client.get("/cart", cookies={"session_id": mock_session_id})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == []
+    get_session.assert_called_once_with(
+        session_id=mock_session_id, ttl=SessionService.session_ttl
+    )
@@ -0,0 +1,90 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.config import category as category_config
+from src.models.product import PrimaryCategory, SecondaryCategory, TertiaryCategory
+from src.service.category import category_tree_cache
+
+
+@pytest.fixture(autouse=True)
+def reset_category_tree_cache():
+    category_tree_cache.tree = None
+    yield
+    category_tree_cache.tree = None
+
+
+async def create_categories(session: AsyncSession):
+    session.add(PrimaryCategory(id=1, name="과일"))
+    session.add(SecondaryCategory(id=10, name="국산과일", primary_category_id=1))
+    session.add(TertiaryCategory(id=100, name="사과", secondary_category_id=10))
+    session.add(TertiaryCategory(id=101, name="배", secondary_category_id=10))
+    await session.commit()
+
+
+# 'GET /categories' API가 카테고리 트리를 반환한다.
+@pytest.mark.asyncio
+async def test_get_category_list_successfully(
+    client: AsyncClient, session: AsyncSession
+):
+    await create_categories(session)
+
+    response = await client.get("/categories")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"]
+    assert response.json() == [
+        {
+            "id": 1,
+            "name": "과일",
+            "children": [
+                {
+                    "id": 10,
+                    "name": "국산과일",
+                    "children": [
+                        {"id": 100, "name": "사과", "children": []},
+                        {"id": 101, "name": "배", "children": []},
+                    ],
+                }
+            ],
+        }
+    ]
+
+    tree = category_tree_cache.tree
+    assert tree.get_tertiary_ids("primary", 1) == {100, 101}
+    assert tree.build_category_fields(101)["category_1"] == "과일"
+
+
+# 'GET /categories' API가 ETag가 일치하면 304를 응답한다.
+@pytest.mark.asyncio
+async def test_get_category_list_not_modified(
+    client: AsyncClient, session: AsyncSession
+):
+    await create_categories(session)
+    etag = (await client.get("/categories")).headers["ETag"]
+
+    response = await client.get("/categories", headers={"If-None-Match": etag})
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+
+
+# 캐시된 트리에 없는 카테고리는 트리를 한 번 다시 불러와 확인하되, 재조회 간격 안에서는 다시 불러오지 않는다.
+@pytest.mark.asyncio
+async def test_reload_category_tree_on_miss(
+    client: AsyncClient, session: AsyncSession, mocker
+):
+    await create_categories(session)
+    await client.get("/categories")
+    session.add(TertiaryCategory(id=102, name="귤", secondary_category_id=10))
+    await session.commit()
+
+    mocker.patch.object(category_config, "miss_reload_interval", 3600)
+    tree = await category_tree_cache.reload_on_miss(session, "tertiary", 102)
+    assert tree.get("tertiary", 102) is None
+
+    mocker.patch.object(category_config, "miss_reload_interval", 0)
+    tree = await category_tree_cache.reload_on_miss(session, "tertiary", 102)
+    assert tree.get("tertiary", 102).name == "귤"
+    assert category_tree_cache.tree is tree
@@ -0,0 +1,142 @@
+import pytest
+from httpx import AsyncClient
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.models.product import (
+    PrimaryCategory,
+    Product,
+    SecondaryCategory,
+    TertiaryCategory,
+)
+from src.models.repository import ElasticsearchRepository, ProductRepository
+from src.models.user import Seller, User, UserType
+from src.service.consistency import DOCUMENT_FIELDS, check_product_consistency
+
+
+async def add_products(session: AsyncSession, product_ids: list) -> list:
+    session.add(User(id=1, email="a@a.com", password="pw", user_type=UserType.SELLER))
+    session.add(
+        Seller(
+            id=1,
+            user_id=1,
+            registration_number="111-11-11111",
+            brand_name="Brand1",
+            contact_number="000-000-0000",
+        )
+    )
+    session.add(PrimaryCategory(id=1, name="스킨케어"))
+    session.add(SecondaryCategory(id=1, name="스킨", primary_category_id=1))
+    session.add(TertiaryCategory(id=1, name="토너", secondary_category_id=1))
+    for product_id in product_ids:
+        session.add(
+            Product(
+                id=product_id,
+                seller_id=1,
+                product_name=f"상품{product_id}",
+                category_id=1,
+                price=1000,
+            )
+        )
+    await session.commit()
+
+    product_repo = ProductRepository(session=session, read_session=session)
+    return await product_repo.get_product_documents_after(after_id=0, limit=100)
+
+
+def mock_es_documents(mocker, es_documents: list):
+    # ES search_after 조회를 ID 순 목록으로 대체
+    async def get_products_after(self, after_id, size, fields):
+        return [
+            {field: document.get(field) for field in fields}
+            for document in es_documents
+            if document["id"] > after_id
+        ][:size]
+
+    mocker.patch("src.service.consistency.get_elasticsearch_client")
+    mocker.patch.object(
+        ElasticsearchRepository,
+        "get_products_after",
+        autospec=True,
+        side_effect=get_products_after,
+    )
+
+
+# SQL과 ES의 상품을 청크 단위로 병합 비교하여 누락, 잔여, 불일치 상품을 찾는다.
+@pytest.mark.asyncio
+async def test_check_product_consistency_reports_differences(
+    client: AsyncClient, session: AsyncSession, mocker
+):
+    # given
+    sql_documents = await add_products(session, [1, 2, 3, 5])
+    documents = {document["id"]: document for document in sql_documents}
+    es_documents = [
+        documents[1],
+        {**documents[2], "price": 2000},
+        {**documents[3], "id": 4},
+        documents[5],
+    ]
+    mock_es_documents(mocker, es_documents)
+    add_product_to_stream = mocker.patch(
+        "src.service.consistency.add_product_to_stream"
+    )
+
+    # when
+    report = await check_product_consistency(chunk_size=2)
+
+    # then
+    assert report["sql_count"] == 4
+    assert report["es_count"] == 4
+    assert report["missing_in_es"] == [3]
+    assert report["extra_in_es"] == [4]
+    assert report["mismatched"] == [2]
+    assert report["missing_in_es_count"] == 1
+    add_product_to_stream.assert_not_called()
+
+
+# repair=True이면 누락, 불일치 상품은 재색인, 잔여 상품은 삭제 작업을 작업 스트림에 추가한다.
+@pytest.mark.asyncio
+async def test_check_product_consistency_enqueues_repairs(
+    client: AsyncClient, session: AsyncSession, mocker
+):
+    # given
+    sql_documents = await add_products(session, [1, 2, 3])
+    documents = {document["id"]: document for document in sql_documents}
+    es_documents = [
+        {field: documents[1].get(field) for field in DOCUMENT_FIELDS},
+        {**documents[2], "product_name": "변경 전 상품명"},
+        {**documents[3], "id": 4},
+    ]
+    mock_es_documents(mocker, es_documents)
+    add_product_to_stream = mocker.patch(
+        "src.service.consistency.add_product_to_stream"
+    )
+
+    # when
+    report = await check_product_consistency(chunk_size=2, repair=True)
+
+    # then
+    assert report["mismatched"] == [2]
+    assert [call.kwargs for call in add_product_to_stream.call_args_list] == [
+        {"product_info": documents[2], "action_type": "create"},
+        {"product_info": documents[3], "action_type": "create"},
+        {"product_info": {"id": 4, "use_status": False}, "action_type": "delete"},
+    ]
+
+
+# 검사 결과에 기록하는 상품 ID 수는 report_limit으로 제한하고 전체 개수는 따로 센다.
+@pytest.mark.asyncio
+async def test_check_product_consistency_limits_report(
+    client: AsyncClient, session: AsyncSession, mocker
+):
+    # given
+    await add_products(session, [1, 2, 3])
+    mock_es_documents(mocker, [])
+    mocker.patch("src.service.consistency.add_product_to_stream")
+
+    # when
+    report = await check_product_consistency(chunk_size=2, report_limit=2)
+
+    # then
+    assert report["missing_in_es"] == [1, 2]
+    assert report["missing_in_es_count"] == 3
+    assert report["es_count"] == 0
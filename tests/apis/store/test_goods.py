@@ -2,9 +2,12 @@ import pytest
 from fastapi import status
 from httpx import AsyncClient
 
+from src.apis.store import es_concurrency_limit
+from src.config import rate_limit as rate_limit_config
 from src.models.product import Product, TertiaryCategory
 from src.models.repository import ElasticsearchRepository, ProductRepository
 from src.models.user import Seller
+from src.service.session import SessionService
 
 
 # 'GET /goods' API가 성공적으로 동작한다.
@@ -227,3 +230,76 @@ async def test_search_goods_with_invalid_query(client: AsyncClient):
     response = await client.get(f"/search?keyword={invalid_keyword}")
 
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+# 'GET /search' API는 동시 처리 한도를 넘으면 대기하지 않고 503을 응답한다.
+@pytest.mark.asyncio
+async def test_search_goods_sheds_load_when_overloaded(client: AsyncClient, mocker):
+    mocker.patch.object(es_concurrency_limit, "in_flight", es_concurrency_limit.limit)
+    search_products = mocker.patch.object(ElasticsearchRepository, "search_products")
+
+    response = await client.get("/search?keyword=테스트")
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "1"
+    search_products.assert_not_called()
+
+
+def fake_token_bucket(mocker):
+    # 키별 요청 수를 세어 규칙의 요청 수를 넘으면 거부하는 토큰 버킷 스크립트 대체
+    counts = {}
+
+    async def run_script(keys, args):
+        counts[keys[0]] = counts.get(keys[0], 0) + 1
+        return [1, "0"] if counts[keys[0]] <= int(args[0]) else [0, "1"]
+
+    mocker.patch("redis.commands.core.AsyncScript.__call__", side_effect=run_script)
+    return counts
+
+
+# 'GET /search' API는 요청마다 임의의 session_id를 보내도 같은 IP의 요청 수로 제한한다.
+@pytest.mark.asyncio
+async def test_search_goods_rate_limited_with_rotating_session_ids(
+    client: AsyncClient, mocker
+):
+    mocker.patch.object(rate_limit_config, "search", "2/60")
+    mocker.patch.object(rate_limit_config, "search_ip", "")
+    counts = fake_token_bucket(mocker)
+    mocker.patch.object(SessionService, "get_session", return_value=None)
+    mocker.patch("src.elastic_client._es_client", mocker.MagicMock())
+    mocker.patch.object(ElasticsearchRepository, "search_products", return_value=[])
+
+    status_codes = []
+    for session_id in ("random-1", "random-2", "random-3"):
+        response = await client.get(
+            "/search?keyword=테스트", cookies={"session_id": session_id}
+        )
+        status_codes.append(response.status_code)
+
+    assert status_codes == [200, 200, status.HTTP_429_TOO_MANY_REQUESTS]
+    assert list(counts) == ["rate_limit:search:ip:127.0.0.1"]
+
+
+# 'GET /search' API는 유효한 세션이면 사용자 단위로, 그와 별개로 IP 단위로도 요청 수를 제한한다.
+@pytest.mark.asyncio
+async def test_search_goods_rate_limited_per_user_and_ip(client: AsyncClient, mocker):
+    mocker.patch.object(rate_limit_config, "search", "100/60")
+    mocker.patch.object(rate_limit_config, "search_ip", "2/60")
+    counts = fake_token_bucket(mocker)
+    mocker.patch.object(
+        SessionService,
+        "get_session",
+        side_effect=[{"user_id": 1}, {"user_id": 1}, {"user_id": 2}],
+    )
+    mocker.patch("src.elastic_client._es_client", mocker.MagicMock())
+    mocker.patch.object(ElasticsearchRepository, "search_products", return_value=[])
+
+    status_codes = []
+    for session_id in ("session-1", "session-2", "session-3"):
+        response = await client.get(
+            "/search?keyword=테스트", cookies={"session_id": session_id}
+        )
+        status_codes.append(response.status_code)
+
+    assert status_codes == [200, 200, status.HTTP_429_TOO_MANY_REQUESTS]
+    assert counts["rate_limit:search:user:1"] == 2
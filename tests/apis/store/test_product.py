@@ -1,10 +1,43 @@
+import asyncio
+import json
+
 import pytest
 from fastapi import status
 from httpx import AsyncClient
-
-from src.models.product import Product, TertiaryCategory
-from src.models.repository import ProductRepository, UserRepository
+from redis.asyncio.client import Pipeline
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.config import product_import as import_config
+from src.config import timing as timing_config
+from src.instrumentation import (
+    NPlusOneQueryError,
+    RequestTimings,
+    capture_queries,
+    current_timings,
+)
+from src.models.product import (
+    PrimaryCategory,
+    Product,
+    SecondaryCategory,
+    StatusType,
+    Stock,
+    TertiaryCategory,
+)
+from src.models.repository import ProductRepository, StockRepository, UserRepository
 from src.models.user import Seller, User, UserType
+from src.redis_client import TimedRedis
+from src.service.category import CategoryTree, category_tree_cache
+from src.service.export import stream_seller_products
+from src.service.product_import import (
+    create_import_job,
+    get_import_job,
+    run_product_import,
+    running_import_tasks,
+    validate_row,
+)
 from src.service.session import SessionService
 
 
@@ -34,16 +67,24 @@ async def test_create_product_successfully(client: AsyncClient, mocker):
     mocker.patch.object(
         SessionService,
         "get_session",
-        return_value={"user_id": 1, "user_type": UserType.SELLER},
+        return_value={"user_id": 1, "user_type": UserType.SELLER, "seller_id": 1},
     )
-    mocker.patch("src.service.auth.verify_seller", return_value=1)
-    mocker.patch.object(UserRepository, "get_user_by_id", return_value=mock_user)
     mocker.patch.object(
         ProductRepository, "create_product", return_value=created_product
     )
-    mocker.patch(
-        "src.apis.store.product.create_product_handler.add_product_to_stream",
-        return_value=None,
+    mocker.patch.object(
+        ProductRepository,
+        "get_product_document",
+        return_value={
+            **created_product.model_dump(),
+            "brand_name": mock_seller.brand_name,
+            "contact_number": mock_seller.contact_number,
+        },
+    )
+    mocker.patch.object(StockRepository, "create_stocks")
+    mocker.patch.object(CategoryTree, "get", return_value=True)
+    add_product_to_stream = mocker.patch(
+        "src.apis.store.product.add_product_to_stream", return_value=None
     )
 
     response = await client.post(
@@ -51,6 +92,7 @@ async def test_create_product_successfully(client: AsyncClient, mocker):
     )
 
     assert response.status_code == status.HTTP_201_CREATED
+    add_product_to_stream.assert_called_once()
 
     data = response.json()
     assert data == {
@@ -65,7 +107,11 @@ async def test_create_product_successfully(client: AsyncClient, mocker):
 @pytest.mark.asyncio
 async def test_create_product_with_invalid_data(client: AsyncClient, mocker):
     mock_session_id = "valid_session_id"
-    mocker.patch("src.service.auth.verify_seller", return_value=1)
+    mocker.patch.object(
+        SessionService,
+        "get_session",
+        return_value={"user_id": 1, "user_type": UserType.SELLER, "seller_id": 1},
+    )
 
     # 잘못된 요청 데이터 (예: price가 없는 경우)
     invalid_product_data = {
@@ -113,11 +159,11 @@ async def test_get_product_by_id_successfully(client: AsyncClient, mocker):
     mocker.patch.object(
         SessionService,
         "get_session",
-        return_value={"user_id": 1, "user_type": UserType.SELLER},
+        return_value={"user_id": 1, "user_type": UserType.SELLER, "seller_id": 1},
     )
-    mocker.patch("src.service.auth.verify_seller", return_value=1)
-    mocker.patch.object(UserRepository, "get_user_by_id", return_value=mock_user)
     mocker.patch.object(ProductRepository, "get_product_by_id", return_value=product)
+    # 재고 수량은 상품 컬럼이 아니라 가용 Stock 행 수로 응답한다.
+    mocker.patch.object(StockRepository, "count_stocks_by_product_id", return_value=10)
 
     response = await client.get(
         f"/products/{product.id}", cookies={"session_id": mock_session_id}
@@ -147,7 +193,11 @@ async def test_get_product_by_id_successfully(client: AsyncClient, mocker):
 @pytest.mark.asyncio
 async def test_get_product_by_id_not_found(client: AsyncClient, mocker):
     mock_session_id = "valid_session_id"
-    mocker.patch("src.service.auth.verify_seller", return_value=1)
+    mocker.patch.object(
+        SessionService,
+        "get_session",
+        return_value={"user_id": 1, "user_type": UserType.SELLER, "seller_id": 1},
+    )
 
     non_existent_product_id = 0  # 존재하지 않는 ID
 
@@ -162,82 +212,79 @@ async def test_get_product_by_id_not_found(client: AsyncClient, mocker):
 
 # 'PATCH /products/{product_id}' API가 성공적으로 동작한다.
 @pytest.mark.asyncio
-async def test_update_product_successfully(client: AsyncClient, mocker):
+async def test_update_product_successfully(
+    client: AsyncClient, session: AsyncSession, mocker
+):
     mock_session_id = "valid_session_id"
-    mock_user = User(
-        id=1, email="test@example.com", password="hashed_pw", user_type=UserType.SELLER
+    session.add(User(id=1, email="a@a.com", password="pw", user_type=UserType.SELLER))
+    session.add(
+        Seller(
+            id=1,
+            user_id=1,
+            registration_number="111-11-11111",
+            brand_name="TestBrand",
+            contact_number="000-000-0000",
+        )
     )
-    mock_seller = Seller(
-        id=1,
-        user_id=1,
-        registration_number="111-11-11111",
-        brand_name="TestBrand",
-        contact_number="000-000-0000",
-        user=mock_user,
-    )
-    mock_category = TertiaryCategory(id=1, name="카테고리")
-
-    product = Product(
-        id=1,
-        seller_id=mock_seller.id,
-        product_name="기존 상품",
-        category_id=mock_category.id,
-        price=100,
-        inventory_quantity=10,
-        seller=mock_seller,
-        category=mock_category,
-    )
-
-    update_data = {"product_name": "업데이트된 상품", "price": 50}
-    update_product = Product(
-        id=product.id,
-        seller_id=product.seller_id,
-        product_name=update_data["product_name"],
-        category_id=product.category_id,
-        price=update_data["price"],
-        inventory_quantity=product.inventory_quantity,
-        seller=product.seller,
-        category=product.category,
+    session.add(
+        Product(
+            id=1,
+            seller_id=1,
+            product_name="기존 상품",
+            category_id=1,
+            price=100,
+            inventory_quantity=10,
+        )
     )
+    await session.commit()
 
     mocker.patch.object(
         SessionService,
         "get_session",
-        return_value={"user_id": 1, "user_type": UserType.SELLER},
+        return_value={"user_id": 1, "user_type": UserType.SELLER, "seller_id": 1},
     )
-    mocker.patch("src.service.auth.verify_seller", return_value=1)
-    mocker.patch.object(UserRepository, "get_user_by_id", return_value=mock_user)
-    mocker.patch.object(ProductRepository, "get_product_by_id", return_value=product)
-    mocker.patch.object(
-        ProductRepository, "update_product", return_value=update_product
+    get_product_by_id = mocker.patch.object(ProductRepository, "get_product_by_id")
+    add_product_to_stream = mocker.patch(
+        "src.apis.store.product.add_product_to_stream", return_value=None
     )
 
+    update_data = {"product_name": "업데이트된 상품", "price": 50}
     response = await client.patch(
-        f"/products/{product.id}",
-        json=update_data,
-        cookies={"session_id": mock_session_id},
+        "/products/1", json=update_data, cookies={"session_id": mock_session_id}
     )
 
     assert response.status_code == status.HTTP_200_OK
-
-    data = response.json()
-    assert data == {
-        "id": update_product.id,
-        "product_name": update_product.product_name,
-        "price": update_product.price,
-        "discounted_price": update_product.discounted_price,
+    assert response.json() == {
+        "id": 1,
+        "product_name": "업데이트된 상품",
+        "price": 50,
+        "discounted_price": 0,
     }
+    # 수정 전 상품을 조회하지 않고 UPDATE ... RETURNING 결과로 응답한다.
+    get_product_by_id.assert_not_called()
+    product_info = add_product_to_stream.call_args.kwargs["product_info"]
+    assert product_info["id"] == 1
+    assert product_info["price"] == 50
+
+    product = await session.get(Product, 1)
+    await session.refresh(product)
+    assert (product.product_name, product.price) == ("업데이트된 상품", 50)
 
 
 # 'PATCH /products/{product_id}' API가 존재하지 않는 ID에 대해서는 404를 응답한다.
 @pytest.mark.asyncio
 async def test_update_product_not_found(client: AsyncClient, mocker):
     mock_session_id = "valid_session_id"
-    mocker.patch("src.service.auth.verify_seller", return_value=1)
+    mocker.patch.object(
+        SessionService,
+        "get_session",
+        return_value={"user_id": 1, "user_type": UserType.SELLER, "seller_id": 1},
+    )
 
     non_existent_product_id = 0  # 존재하지 않는 ID
 
-    mocker.patch.object(ProductRepository, "get_product_by_id", return_value=None)
+    mocker.patch.object(ProductRepository, "update_product_fields", return_value=None)
+    mocker.patch.object(ProductRepository, "get_product_seller_id", return_value=None)
 
     update_data = {"price": 50}
 
@@ -250,6 +297,44 @@ async def test_update_product_not_found(client: AsyncClient, mocker):
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+# 'PATCH /products/{product_id}' API가 수정된 행이 없으면 본인 상품이어도 404를 응답한다.
+@pytest.mark.asyncio
+async def test_update_product_not_updated(client: AsyncClient, mocker):
+    mocker.patch.object(
+        SessionService,
+        "get_session",
+        return_value={"user_id": 1, "user_type": UserType.SELLER, "seller_id": 1},
+    )
+    mocker.patch.object(ProductRepository, "update_product_fields", return_value=None)
+    mocker.patch.object(ProductRepository, "get_product_seller_id", return_value=1)
+    add_product_to_stream = mocker.patch("src.apis.store.product.add_product_to_stream")
+
+    response = await client.patch(
+        "/products/1", json={"price": 50}, cookies={"session_id": "valid_session_id"}
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    add_product_to_stream.assert_not_called()
+
+
+# 'PATCH /products/{product_id}' API가 다른 판매자의 상품에 대해서는 403을 응답한다.
+@pytest.mark.asyncio
+async def test_update_product_of_other_seller(client: AsyncClient, mocker):
+    mocker.patch.object(
+        SessionService,
+        "get_session",
+        return_value={"user_id": 1, "user_type": UserType.SELLER, "seller_id": 1},
+    )
+    mocker.patch.object(ProductRepository, "update_product_fields", return_value=None)
+    mocker.patch.object(ProductRepository, "get_product_seller_id", return_value=2)
+
+    response = await client.patch(
+        "/products/1", json={"price": 50}, cookies={"session_id": "valid_session_id"}
+    )
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
 # 'DELETE /products/{product_id}' API가 성공적으로 동작한다.
 @pytest.mark.asyncio
 async def test_delete_product_successfully(client: AsyncClient, mocker):
@@ -281,25 +366,30 @@ async def test_delete_product_successfully(client: AsyncClient, mocker):
     mocker.patch.object(
         SessionService,
         "get_session",
-        return_value={"user_id": 1, "user_type": UserType.SELLER},
+        return_value={"user_id": 1, "user_type": UserType.SELLER, "seller_id": 1},
     )
-    mocker.patch("src.service.auth.verify_seller", return_value=1)
-    mocker.patch.object(UserRepository, "get_user_by_id", return_value=mock_user)
     mocker.patch.object(ProductRepository, "get_product_by_id", return_value=product)
     mocker.patch.object(ProductRepository, "delete_product")
+    get_user_by_id = mocker.patch.object(UserRepository, "get_user_by_id")
 
     response = await client.delete(
         f"/products/{product.id}", cookies={"session_id": mock_session_id}
     )
 
     assert response.status_code == status.HTTP_204_NO_CONTENT
+    # 세션에 저장된 seller_id를 사용하므로 사용자 조회 쿼리가 발생하지 않는다.
+    get_user_by_id.assert_not_called()
 
 
 # 'DELETE /products/{product_id}' API가 존재하지 않는 ID에 대해서는 404를 응답한다.
 @pytest.mark.asyncio
 async def test_delete_product_not_found(client: AsyncClient, mocker):
     mock_session_id = "valid_session_id"
-    mocker.patch("src.service.auth.verify_seller", return_value=1)
+    mocker.patch.object(
+        SessionService,
+        "get_session",
+        return_value={"user_id": 1, "user_type": UserType.SELLER, "seller_id": 1},
+    )
 
     non_existent_product_id = 0  # 존재하지 않는 ID
 
@@ -310,3 +400,562 @@ async def test_delete_product_not_found(client: AsyncClient, mocker):
     )
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+# 'GET /products' API가 판매자의 상품을 키셋 페이지네이션으로 재고와 함께 반환한다.
+@pytest.mark.asyncio
+async def test_get_product_list_successfully(
+    client: AsyncClient, session: AsyncSession, mocker
+):
+    session.add(User(id=1, email="a@a.com", password="pw", user_type=UserType.SELLER))
+    session.add(User(id=2, email="b@b.com", password="pw", user_type=UserType.SELLER))
+    for seller_id in (1, 2):
+        session.add(
+            Seller(
+                id=seller_id,
+                user_id=seller_id,
+                registration_number=f"111-11-1111{seller_id}",
+                brand_name=f"Brand{seller_id}",
+                contact_number="000-000-0000",
+            )
+        )
+    for product_id in range(1, 5):
+        session.add(
+            Product(
+                id=product_id,
+                seller_id=1 if product_id != 3 else 2,
+                product_name=f"상품{product_id}",
+                category_id=1,
+                price=100 * product_id,
+            )
+        )
+    session.add_all(
+        [Stock(product_id=4, status=StatusType.AVAILABLE) for _ in range(3)]
+        + [Stock(product_id=4, status=StatusType.SOLD)]
+    )
+    await session.commit()
+
+    mocker.patch.object(
+        SessionService,
+        "get_session",
+        return_value={"user_id": 1, "user_type": UserType.SELLER, "seller_id": 1},
+    )
+
+    with capture_queries() as query_stats:
+        response = await client.get(
+            "/products?size=2", cookies={"session_id": "valid_session_id"}
+        )
+
+    # 상품 목록 1회, 페이지 내 재고 집계 1회
+    assert query_stats.count == 2
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [item["id"] for item in data["items"]] == [4, 2]
+    assert data["items"][0]["inventory_quantity"] == 3
+    assert data["items"][1]["inventory_quantity"] == 0
+    assert data["next_cursor"] == 2
+
+    response = await client.get(
+        f"/products?size=2&cursor={data['next_cursor']}",
+        cookies={"session_id": "valid_session_id"},
+    )
+
+    assert response.json() == {
+        "items": [
+            {
+                "id": 1,
+                "product_name": "상품1",
+                "category_id": 1,
+                "price": 100,
+                "discounted_price": 0,
+                "inventory_quantity": 0,
+            }
+        ],
+        "next_cursor": None,
+    }
+
+
+# 'GET /products/export' API가 판매자의 전체 상품을 재고와 함께 스트리밍으로 내보낸다.
+@pytest.mark.asyncio
+async def test_export_product_list_successfully(
+    client: AsyncClient, session: AsyncSession, mocker
+):
+    session.add(User(id=1, email="a@a.com", password="pw", user_type=UserType.SELLER))
+    session.add(
+        Seller(
+            id=1,
+            user_id=1,
+            registration_number="111-11-11111",
+            brand_name="Brand1",
+            contact_number="000-000-0000",
+        )
+    )
+    for product_id in range(1, 4):
+        session.add(
+            Product(
+                id=product_id,
+                seller_id=1,
+                product_name=f"상품{product_id}",
+                category_id=1,
+                price=100 * product_id,
+            )
+        )
+    # 삭제(use_status=False)된 상품은 내보내지 않는다.
+    session.add(
+        Product(
+            id=4,
+            seller_id=1,
+            product_name="삭제된 상품",
+            category_id=1,
+            price=400,
+            use_status=False,
+        )
+    )
+    session.add_all(
+        [Stock(product_id=2, status=StatusType.AVAILABLE) for _ in range(2)]
+    )
+    await session.commit()
+
+    mocker.patch.object(
+        SessionService,
+        "get_session",
+        return_value={"user_id": 1, "user_type": UserType.SELLER, "seller_id": 1},
+    )
+
+    response = await client.get(
+        "/products/export", cookies={"session_id": "valid_session_id"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in rows] == [1, 2, 3]
+    assert [row["available_quantity"] for row in rows] == [0, 2, 0]
+    assert "seller_id" not in rows[0]
+
+    response = await client.get(
+        "/products/export?format=csv", cookies={"session_id": "valid_session_id"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/csv")
+    lines = response.text.splitlines()
+    assert lines[0].startswith("id,")
+    assert len(lines) == 4
+
+    # 청크 크기보다 상품이 많아도 헤더는 한 번만 출력되고 모든 상품이 포함된다.
+    chunks = [
+        chunk
+        async for chunk in stream_seller_products(
+            seller_id=1, file_format="csv", chunk_size=2
+        )
+    ]
+    assert len(chunks) == 2
+    assert "".join(chunks).splitlines() == lines
+
+
+# 'POST /products/import' API가 상품을 일괄 등록하고 행별 오류를 작업 상태로 제공한다.
+@pytest.mark.asyncio
+async def test_import_product_list_successfully(
+    client: AsyncClient, session: AsyncSession, mocker
+):
+    session.add(User(id=1, email="a@a.com", password="pw", user_type=UserType.SELLER))
+    session.add(
+        Seller(
+            id=1,
+            user_id=1,
+            registration_number="111-11-11111",
+            brand_name="Brand1",
+            contact_number="000-000-0000",
+        )
+    )
+    session.add(PrimaryCategory(id=1, name="스킨케어"))
+    session.add(SecondaryCategory(id=1, name="스킨", primary_category_id=1))
+    session.add(TertiaryCategory(id=1, name="토너", secondary_category_id=1))
+    await session.commit()
+    category_tree_cache.invalidate()
+
+    jobs = {}
+
+    async def hset(key, mapping):
+        jobs.setdefault(key, {}).update({k: str(v) for k, v in mapping.items()})
+
+    async def hgetall(key):
+        return jobs.get(key, {})
+
+    task_redis = mocker.patch(
+        "src.service.product_import.get_task_redis_client"
+    ).return_value
+    task_redis.hset.side_effect = hset
+    task_redis.hgetall.side_effect = hgetall
+    task_redis.expire = mocker.AsyncMock()
+    add_products_to_stream = mocker.patch(
+        "src.service.product_import.add_products_to_stream", return_value=None
+    )
+    mocker.patch.object(
+        SessionService,
+        "get_session",
+        return_value={"user_id": 1, "user_type": UserType.SELLER, "seller_id": 1},
+    )
+
+    content = (
+        "product_name,category_id,price,discounted_price,inventory_quantity\n"
+        "상품1,1,1000,,2\n"
+        "상품2,1,abc,,1\n"
+        "상품3,2,3000,,1\n"
+        "상품4,1,4000,3500,\n"
+    )
+    response = await client.post(
+        "/products/import?format=csv",
+        files={"file": ("products.csv", content.encode(), "text/csv")},
+        cookies={"session_id": "valid_session_id"},
+    )
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    job_id = response.json()["job_id"]
+
+    await asyncio.gather(*running_import_tasks)
+
+    response = await client.get(
+        f"/products/import/{job_id}", cookies={"session_id": "valid_session_id"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["status"] == "completed"
+    assert (data["total"], data["processed"]) == (4, 4)
+    assert (data["succeeded"], data["failed"]) == (2, 2)
+    assert [error["row"] for error in data["errors"]] == [3, 4]
+    assert data["errors"][1]["error"] == "Invalid category."
+
+    products = (await session.exec(select(Product).order_by(Product.id))).all()
+    assert [(p.product_name, p.discounted_price) for p in products] == [
+        ("상품1", 0),
+        ("상품4", 3500),
+    ]
+    stock_count = (await session.exec(select(func.count(Stock.id)))).one()
+    assert stock_count == 2
+
+    add_products_to_stream.assert_called_once()
+    product_infos = add_products_to_stream.call_args.kwargs["product_infos"]
+    assert [info["brand_name"] for info in product_infos] == ["Brand1", "Brand1"]
+
+    # 다른 판매자의 작업은 조회할 수 없다.
+    mocker.patch.object(
+        SessionService,
+        "get_session",
+        return_value={"user_id": 2, "user_type": UserType.SELLER, "seller_id": 2},
+    )
+    response = await client.get(
+        f"/products/import/{job_id}", cookies={"session_id": "valid_session_id"}
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+# 상품, 재고 저장 실패는 묶음 전체를 롤백하고, 커밋 후 색인 작업 등록 실패는 따로 기록한다.
+@pytest.mark.asyncio
+async def test_run_product_import_with_save_and_enqueue_failures(
+    client: AsyncClient, session: AsyncSession, mocker
+):
+    session.add(User(id=1, email="a@a.com", password="pw", user_type=UserType.SELLER))
+    session.add(
+        Seller(
+            id=1,
+            user_id=1,
+            registration_number="111-11-11111",
+            brand_name="Brand1",
+            contact_number="000-000-0000",
+        )
+    )
+    session.add(PrimaryCategory(id=1, name="스킨케어"))
+    session.add(SecondaryCategory(id=1, name="스킨", primary_category_id=1))
+    session.add(TertiaryCategory(id=1, name="토너", secondary_category_id=1))
+    await session.commit()
+    category_tree_cache.invalidate()
+
+    jobs = {}
+
+    async def hset(key, mapping):
+        jobs.setdefault(key, {}).update({k: str(v) for k, v in mapping.items()})
+
+    async def hgetall(key):
+        return jobs.get(key, {})
+
+    task_redis = mocker.patch(
+        "src.service.product_import.get_task_redis_client"
+    ).return_value
+    task_redis.hset.side_effect = hset
+    task_redis.hgetall.side_effect = hgetall
+    task_redis.expire = mocker.AsyncMock()
+    mocker.patch.object(
+        StockRepository,
+        "bulk_create_stocks",
+        autospec=True,
+        side_effect=[Exception("stock insert failed"), None],
+    )
+    add_products_to_stream = mocker.patch(
+        "src.service.product_import.add_products_to_stream",
+        side_effect=ConnectionError("task stream unavailable"),
+    )
+
+    job_id = await create_import_job(seller_id=1)
+    await run_product_import(
+        job_id=job_id,
+        seller_id=1,
+        content=(
+            "product_name,category_id,price,inventory_quantity\n"
+            "상품1,1,1000,2\n"
+            "상품2,1,2000,0\n"
+        ),
+        file_format="csv",
+        batch_size=1,
+    )
+
+    job = await get_import_job(job_id)
+    assert job["status"] == "completed"
+    assert (job["total"], job["processed"]) == (2, 2)
+    assert (job["succeeded"], job["failed"], job["index_failed"]) == (1, 1, 1)
+    assert job["errors"] == [
+        {"row": 2, "error": "Failed to save product: stock insert failed"}
+    ]
+    # 재고 저장에 실패한 묶음의 상품은 커밋되지 않는다.
+    products = (await session.exec(select(Product))).all()
+    assert [p.product_name for p in products] == ["상품2"]
+    add_products_to_stream.assert_called_once()
+
+
+# 재고 수량이 음수이거나 상한을 넘는 행은 재고를 만들기 전에 행 오류로 거부한다.
+@pytest.mark.asyncio
+@pytest.mark.parametrize("quantity, valid", [(-1, False), (5, True), (6, False)])
+async def test_validate_row_rejects_out_of_range_quantity(mocker, quantity, valid):
+    mocker.patch.object(import_config, "max_quantity", 5)
+    category_tree = CategoryTree(
+        [PrimaryCategory(id=1, name="스킨케어")],
+        [SecondaryCategory(id=1, name="스킨", primary_category_id=1)],
+        [TertiaryCategory(id=1, name="토너", secondary_category_id=1)],
+    )
+    row = {
+        "product_name": "상품1",
+        "category_id": 1,
+        "price": 1000,
+        "inventory_quantity": quantity,
+    }
+
+    values, error = validate_row(row, seller_id=1, category_tree=category_tree)
+
+    assert (values is not None) == valid
+    assert (error is None) == valid
+
+
+# 재고는 chunk_size행씩 나누어 INSERT한다.
+@pytest.mark.asyncio
+async def test_bulk_create_stocks_in_chunks(
+    client: AsyncClient, session: AsyncSession, mocker
+):
+    execute = mocker.spy(session, "execute")
+    stock_repo = StockRepository(session=session, read_session=session)
+
+    await stock_repo.bulk_create_stocks(quantities={1: 3, 2: 2}, chunk_size=2)
+    await session.commit()
+
+    assert [len(call.args[1]) for call in execute.call_args_list] == [2, 2, 1]
+    stock_count = (await session.exec(select(func.count(Stock.id)))).one()
+    assert stock_count == 5
+
+
+# 'POST /products/import' API는 크기 제한을 넘는 파일을 거부한다.
+@pytest.mark.asyncio
+async def test_import_product_list_with_too_large_file(client: AsyncClient, mocker):
+    mocker.patch.object(import_config, "max_file_size", 10)
+    create_import_job = mocker.patch("src.apis.store.product.create_import_job")
+    mocker.patch.object(
+        SessionService,
+        "get_session",
+        return_value={"user_id": 1, "user_type": UserType.SELLER, "seller_id": 1},
+    )
+
+    response = await client.post(
+        "/products/import?format=csv",
+        files={"file": ("products.csv", b"a" * 11, "text/csv")},
+        cookies={"session_id": "valid_session_id"},
+    )
+
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    create_import_job.assert_not_called()
+
+
+# 'PATCH /products/prices' API가 대상 상품의 할인가를 한 번에 변경한다.
+@pytest.mark.asyncio
+async def test_bulk_update_price_successfully(
+    client: AsyncClient, session: AsyncSession, mocker
+):
+    for seller_id in (1, 2):
+        session.add(
+            User(
+                id=seller_id,
+                email=f"{seller_id}@a.com",
+                password="pw",
+                user_type=UserType.SELLER,
+            )
+        )
+        session.add(
+            Seller(
+                id=seller_id,
+                user_id=seller_id,
+                registration_number=f"111-11-1111{seller_id}",
+                brand_name=f"Brand{seller_id}",
+                contact_number="000-000-0000",
+            )
+        )
+    session.add(PrimaryCategory(id=1, name="스킨케어"))
+    session.add(SecondaryCategory(id=1, name="스킨", primary_category_id=1))
+    session.add(TertiaryCategory(id=1, name="토너", secondary_category_id=1))
+    session.add(TertiaryCategory(id=2, name="미스트", secondary_category_id=1))
+    for product_id, seller_id, category_id in ((1, 1, 1), (2, 1, 2), (3, 2, 1)):
+        session.add(
+            Product(
+                id=product_id,
+                seller_id=seller_id,
+                product_name=f"상품{product_id}",
+                category_id=category_id,
+                price=1000 * product_id + 50,
+            )
+        )
+    await session.commit()
+    category_tree_cache.invalidate()
+
+    add_product_updates_to_stream = mocker.patch(
+        "src.apis.store.product.add_product_updates_to_stream", return_value=None
+    )
+    mocker.patch.object(
+        SessionService,
+        "get_session",
+        return_value={"user_id": 1, "user_type": UserType.SELLER, "seller_id": 1},
+    )
+
+    response = await client.patch(
+        "/products/prices",
+        json={
+            "category_type": "secondary",
+            "category_id": 1,
+            "discount_type": "percent",
+            "discount_value": 10,
+        },
+        cookies={"session_id": "valid_session_id"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["updated_count"] == 2
+    assert sorted((item["id"], item["discounted_price"]) for item in data["items"]) == [
+        (1, 945),
+        (2, 1845),
+    ]
+    product_infos = add_product_updates_to_stream.call_args.kwargs["product_infos"]
+    assert sorted(info["id"] for info in product_infos) == [1, 2]
+
+    response = await client.patch(
+        "/products/prices",
+        json={"product_ids": [2, 3], "discount_type": "amount", "discount_value": 5000},
+        cookies={"session_id": "valid_session_id"},
+    )
+
+    # 다른 판매자의 상품은 변경되지 않고, 할인가는 0 미만이 되지 않는다.
+    assert response.json() == {
+        "updated_count": 1,
+        "items": [{"id": 2, "price": 2050, "discounted_price": 0}],
+    }
+    product = await session.get(Product, 3)
+    await session.refresh(product)
+    assert product.discounted_price == 0
+
+    response = await client.patch(
+        "/products/prices",
+        json={
+            "product_ids": [1],
+            "category_type": "primary",
+            "category_id": 1,
+            "discount_type": "percent",
+            "discount_value": 10,
+        },
+        cookies={"session_id": "valid_session_id"},
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+# 한 요청에서 같은 형태의 쿼리가 반복 실행되면 N+1로 감지한다.
+@pytest.mark.asyncio
+async def test_detect_n_plus_one_queries(client: AsyncClient, session: AsyncSession):
+    with pytest.raises(NPlusOneQueryError):
+        with capture_queries():
+            for product_id in range(20):
+                await session.get(Product, product_id)
+
+    with capture_queries() as query_stats:
+        await session.exec(select(Product).where(Product.id.in_(range(20))))
+
+    assert query_stats.count == 1
+
+
+# 실패한 쿼리의 시작 시간이 커넥션에 남지 않고, 이후 쿼리도 정상적으로 집계한다.
+@pytest.mark.asyncio
+async def test_failed_query_does_not_leak_timing(
+    client: AsyncClient, session: AsyncSession
+):
+    for _ in range(3):
+        with pytest.raises(OperationalError):
+            await session.exec(text("SELECT * FROM missing_table"))
+        await session.rollback()
+
+    with capture_queries() as query_stats:
+        await session.exec(select(Product))
+
+    connection = await session.connection()
+    assert not connection.info.get("query_start")
+    assert query_stats.count == 1
+
+
+# 샘플링된 요청은 의존성별 소요 시간을 Server-Timing 헤더로 응답한다.
+@pytest.mark.asyncio
+async def test_server_timing_header(client: AsyncClient, mocker):
+    mocker.patch.object(timing_config, "sample_rate", 1.0)
+    mocker.patch.object(
+        SessionService,
+        "get_session",
+        return_value={"user_id": 1, "user_type": UserType.SELLER, "seller_id": 1},
+    )
+
+    response = await client.get("/products", cookies={"session_id": "valid_session_id"})
+
+    assert response.status_code == status.HTTP_200_OK
+    server_timing = response.headers["server-timing"]
+    assert "db;dur=" in server_timing
+    assert 'desc="1 calls"' in server_timing
+    assert "total;dur=" in server_timing
+
+    mocker.patch.object(timing_config, "sample_rate", 0.0)
+    response = await client.get("/products", cookies={"session_id": "valid_session_id"})
+
+    assert "server-timing" not in response.headers
+
+
+# 파이프라인 실행도 Redis 호출 한 번으로 소요 시간을 합산한다.
+@pytest.mark.asyncio
+async def test_timed_redis_records_pipeline_execute(mocker):
+    mocker.patch.object(Pipeline, "execute", return_value=[1, 1])
+    redis_client = TimedRedis()
+    timings = RequestTimings()
+    token = current_timings.set(timings)
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.delete("session_id")
+            pipe.srem("user_sessions:1", "session_id")
+            assert await pipe.execute() == [1, 1]
+    finally:
+        current_timings.reset(token)
+        await redis_client.aclose()
+
+    assert timings.totals["redis"][1] == 1
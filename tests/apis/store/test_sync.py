@@ -0,0 +1,133 @@
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.models.product import (
+    PrimaryCategory,
+    Product,
+    SecondaryCategory,
+    TertiaryCategory,
+)
+from src.models.user import Seller, User, UserType
+from src.service.sync import SYNC_WATERMARK_KEY, sync_changed_products
+
+BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+
+async def add_products(session: AsyncSession, updated_ats: dict) -> None:
+    session.add(User(id=1, email="a@a.com", password="pw", user_type=UserType.SELLER))
+    session.add(
+        Seller(
+            id=1,
+            user_id=1,
+            registration_number="111-11-11111",
+            brand_name="Brand1",
+            contact_number="000-000-0000",
+        )
+    )
+    session.add(PrimaryCategory(id=1, name="스킨케어"))
+    session.add(SecondaryCategory(id=1, name="스킨", primary_category_id=1))
+    session.add(TertiaryCategory(id=1, name="토너", secondary_category_id=1))
+    for product_id, updated_at in updated_ats.items():
+        session.add(
+            Product(
+                id=product_id,
+                seller_id=1,
+                product_name=f"상품{product_id}",
+                category_id=1,
+                price=1000,
+                updated_at=updated_at,
+            )
+        )
+    await session.commit()
+
+
+def mock_clients(mocker, watermark=None, errors=False):
+    es = mocker.MagicMock()
+    es.bulk = mocker.AsyncMock(return_value={"errors": errors})
+    task_redis = mocker.MagicMock()
+    task_redis.get = mocker.AsyncMock(return_value=watermark)
+    task_redis.set = mocker.AsyncMock()
+    mocker.patch("src.service.sync.get_elasticsearch_client", return_value=es)
+    mocker.patch("src.service.sync.get_task_redis_client", return_value=task_redis)
+    return es, task_redis
+
+
+def bulk_indexed_ids(es) -> list:
+    return [
+        [operation["index"]["_id"] for operation in call.kwargs["operations"][::2]]
+        for call in es.bulk.call_args_list
+    ]
+
+
+# 같은 updated_at을 가진 상품이 청크 경계에 걸쳐도 (updated_at, id) 키셋으로 빠짐없이 동기화한다.
+@pytest.mark.asyncio
+async def test_sync_changed_products_pages_across_equal_timestamps(
+    client: AsyncClient, session: AsyncSession, mocker
+):
+    # given
+    later = BASE_TIME + timedelta(seconds=1)
+    await add_products(
+        session, {1: BASE_TIME, 2: BASE_TIME, 3: BASE_TIME, 4: later, 5: later}
+    )
+    es, task_redis = mock_clients(mocker)
+
+    # when
+    synced_count = await sync_changed_products(chunk_size=2, overlap=0)
+
+    # then
+    assert synced_count == 5
+    assert bulk_indexed_ids(es) == [[1, 2], [3, 4], [5]]
+    # 청크마다 마지막 문서의 updated_at으로 워터마크를 갱신한다.
+    assert [call.args for call in task_redis.set.call_args_list] == [
+        (SYNC_WATERMARK_KEY, BASE_TIME.isoformat()),
+        (SYNC_WATERMARK_KEY, later.isoformat()),
+        (SYNC_WATERMARK_KEY, later.isoformat()),
+    ]
+
+
+# 워터마크보다 overlap 초 이전에 변경된 상품까지 다시 동기화한다.
+@pytest.mark.asyncio
+async def test_sync_changed_products_applies_overlap(
+    client: AsyncClient, session: AsyncSession, mocker
+):
+    # given
+    await add_products(
+        session,
+        {
+            1: BASE_TIME - timedelta(seconds=120),
+            2: BASE_TIME - timedelta(seconds=30),
+            3: BASE_TIME + timedelta(seconds=10),
+        },
+    )
+    es, task_redis = mock_clients(mocker, watermark=BASE_TIME.isoformat())
+
+    # when
+    synced_count = await sync_changed_products(chunk_size=10, overlap=60)
+
+    # then
+    assert synced_count == 2
+    assert bulk_indexed_ids(es) == [[2, 3]]
+    task_redis.set.assert_awaited_once_with(
+        SYNC_WATERMARK_KEY, (BASE_TIME + timedelta(seconds=10)).isoformat()
+    )
+
+
+# bulk 응답에 오류가 있으면 워터마크를 갱신하지 않고 다음 실행에서 다시 시도한다.
+@pytest.mark.asyncio
+async def test_sync_changed_products_keeps_watermark_on_bulk_errors(
+    client: AsyncClient, session: AsyncSession, mocker
+):
+    # given
+    await add_products(session, {1: BASE_TIME, 2: BASE_TIME, 3: BASE_TIME})
+    es, task_redis = mock_clients(mocker, errors=True)
+
+    # when
+    synced_count = await sync_changed_products(chunk_size=2, overlap=0)
+
+    # then
+    assert synced_count == 0
+    assert bulk_indexed_ids(es) == [[1, 2]]
+    task_redis.set.assert_not_called()
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from src.service.session import SessionService
+
+
+def build_redis(mocker, stored: dict = None):
+    redis_client = mocker.MagicMock()
+    for command in ("setex", "srem", "getex", "get", "smembers", "delete"):
+        setattr(redis_client, command, mocker.AsyncMock())
+    redis_client.getex.return_value = json.dumps(stored) if stored else None
+
+    pipe = mocker.MagicMock()
+    pipe.execute = mocker.AsyncMock()
+    redis_client.pipeline.return_value.__aenter__.return_value = pipe
+    return redis_client, pipe
+
+
+# 세션 조회는 GETEX 한 번으로 처리하고 사용자별 세션 목록은 건드리지 않는다.
+@pytest.mark.asyncio
+async def test_get_session_uses_single_getex(mocker):
+    redis_client, _ = build_redis(mocker, stored={"user_id": 1, "user_type": "buyer"})
+    session_service = SessionService(redis_client=redis_client)
+
+    session = await session_service.get_session("session_id", ttl=3600)
+
+    assert session == {"user_id": 1, "user_type": "buyer"}
+    redis_client.getex.assert_called_once_with("session_id", ex=3600)
+    redis_client.pipeline.assert_not_called()
+
+
+# 로그인 시 세션 목록에서 만료된 세션을 정리하고 새 세션을 만료 없이 목록에 추가한다.
+@pytest.mark.asyncio
+async def test_create_session_prunes_expired_sessions(mocker):
+    redis_client, pipe = build_redis(mocker)
+    redis_client.smembers.return_value = {"expired_session"}
+    pipe.execute.side_effect = [[0], [True, 1, 1]]
+    mocker.patch("src.service.session.secrets.token_hex", return_value="new_session")
+    session_service = SessionService(redis_client=redis_client)
+
+    session_id = await session_service.create_session({"user_id": 1})
+
+    assert session_id == "new_session"
+    pipe.exists.assert_called_once_with("expired_session")
+    redis_client.srem.assert_called_once_with("user_sessions:1", "expired_session")
+    pipe.sadd.assert_called_once_with("user_sessions:1", "new_session")
+    pipe.persist.assert_called_once_with("user_sessions:1")
+
+
+# 세션을 삭제하면 사용자별 세션 목록에서도 제거한다.
+@pytest.mark.asyncio
+async def test_delete_session_removes_from_user_sessions_index(mocker):
+    redis_client, pipe = build_redis(mocker)
+    session_service = SessionService(redis_client=redis_client)
+
+    await session_service.delete_session("session_id", user_id=1)
+
+    pipe.delete.assert_called_once_with("session_id")
+    pipe.srem.assert_called_once_with("user_sessions:1", "session_id")
+    pipe.execute.assert_called_once()
+
+
+# 사용자의 모든 세션과 세션 목록을 삭제한다.
+@pytest.mark.asyncio
+async def test_invalidate_user_sessions(mocker):
+    redis_client, _ = build_redis(mocker)
+    redis_client.smembers.return_value = {"session_a", "session_b"}
+    session_service = SessionService(redis_client=redis_client)
+
+    await session_service.invalidate_user_sessions(user_id=1)
+
+    redis_client.smembers.assert_called_once_with("user_sessions:1")
+    args = redis_client.delete.call_args.args
+    assert args[0] == "user_sessions:1"
+    assert set(args[1:]) == {"session_a", "session_b"}
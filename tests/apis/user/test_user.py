@@ -1,9 +1,14 @@
+import bcrypt
 import pytest
 from fastapi import status
 from httpx import AsyncClient
+from pydantic import ValidationError
 
+from src.config import RateLimitConfig
+from src.config import rate_limit as rate_limit_config
 from src.models.repository import UserRepository
 from src.models.user import Buyer, Seller, User, UserType
+from src.service.rate_limit import RateLimiter
 from src.service.session import SessionService
 from src.service.user import UserService
 
@@ -44,9 +49,7 @@ async def test_register_seller_successfully(client: AsyncClient, mocker):
     mocker.patch.object(
         UserRepository, "save_entity", side_effect=[created_user, created_seller]
     )
-    mocker.patch(
-        "src.apis.user.register_user_handler.add_email_to_stream", return_value=None
-    )
+    mocker.patch("src.apis.user.user.add_email_to_stream", return_value=None)
 
     response = await client.post("/register", json=mock_seller_data)
 
@@ -121,9 +124,7 @@ async def test_register_buyer_successfully(client: AsyncClient, mocker):
     mocker.patch.object(
         UserRepository, "save_entity", side_effect=[created_user, created_buyer]
     )
-    mocker.patch(
-        "src.apis.user.register_user_handler.add_email_to_stream", return_value=None
-    )
+    mocker.patch("src.apis.user.user.add_email_to_stream", return_value=None)
 
     response = await client.post("/register", json=mock_buyer_data)
 
@@ -183,6 +184,70 @@ async def test_login_user_successfully(client: AsyncClient, mocker):
     assert response.cookies["session_id"] == created_session_id
 
 
+# 'POST /login' API가 판매자 로그인 시 seller_id를 세션에 함께 저장한다.
+@pytest.mark.asyncio
+async def test_login_seller_stores_seller_id_in_session(client: AsyncClient, mocker):
+    mock_login_data = {"email": "test@example.com", "password": "hashed_password"}
+    user: User = User(
+        id=1,
+        email=mock_login_data["email"],
+        password=mock_login_data["password"],
+        user_type=UserType.SELLER,
+    )
+    Seller(
+        id=3,
+        user_id=user.id,
+        registration_number="000-00-00000",
+        brand_name="테스트 브랜드",
+        contact_number="0000-0000",
+        user=user,
+    )
+
+    mocker.patch.object(UserRepository, "get_user_by_email", return_value=user)
+    mocker.patch.object(UserService, "verify_password", return_value=True)
+    create_session = mocker.patch.object(
+        SessionService, "create_session", return_value="mock_session_id"
+    )
+
+    response = await client.post("/login", json=mock_login_data)
+
+    assert response.status_code == status.HTTP_200_OK
+    create_session.assert_called_once_with(
+        session_data={
+            "user_id": 1,
+            "user_type": UserType.SELLER,
+            "email": "test@example.com",
+            "seller_id": 3,
+            "name": "테스트 브랜드",
+        }
+    )
+
+
+# 'POST /login' API는 비용 인자가 변경된 비밀번호를 새 비용으로 재해싱한다.
+@pytest.mark.asyncio
+async def test_login_user_rehashes_password(client: AsyncClient, mocker):
+    mock_login_data = {"email": "test@example.com", "password": "plain_password"}
+    user: User = User(
+        id=1,
+        email=mock_login_data["email"],
+        password=bcrypt.hashpw(b"plain_password", bcrypt.gensalt(5)).decode(),
+        user_type=UserType.BUYER,
+    )
+
+    mocker.patch.object(UserService, "rounds", 4)
+    mocker.patch.object(UserRepository, "get_user_by_email", return_value=user)
+    update_password = mocker.patch.object(UserRepository, "update_password")
+    mocker.patch.object(SessionService, "create_session", return_value="session_id")
+
+    response = await client.post("/login", json=mock_login_data)
+
+    assert response.status_code == status.HTTP_200_OK
+    update_password.assert_called_once()
+    rehashed_password = update_password.call_args.kwargs["hashed_password"]
+    assert rehashed_password.startswith("$2b$04$")
+    assert bcrypt.checkpw(b"plain_password", rehashed_password.encode())
+
+
 # 'POST /login' API가 잘못된 비밀번호를 입력하는 경우 401을 반환한다.
 @pytest.mark.asyncio
 async def test_login_user_invalid_password(client: AsyncClient, mocker):
@@ -206,6 +271,53 @@ async def test_login_user_invalid_password(client: AsyncClient, mocker):
     assert response.json() == {"detail": "Not Authorized"}
 
 
+# 'POST /login' API가 같은 이메일로 요청 한도를 넘으면 429와 Retry-After를 반환한다.
+@pytest.mark.asyncio
+async def test_login_user_rate_limited(client: AsyncClient, mocker):
+    mock_login_data = {"email": "test@example.com", "password": "password"}
+
+    mocker.patch.object(rate_limit_config, "login_email", "5/60")
+    mocker.patch("redis.commands.core.AsyncScript.__call__", return_value=[0, "2.5"])
+    get_user_by_email = mocker.patch.object(UserRepository, "get_user_by_email")
+
+    response = await client.post("/login", json=mock_login_data)
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert response.headers["Retry-After"] == "3"
+    get_user_by_email.assert_not_called()
+
+
+# 'POST /login' API는 대소문자와 공백을 정규화한 이메일로 계정별 요청 수를 제한한다.
+@pytest.mark.asyncio
+async def test_login_user_rate_limit_key_is_normalized(client: AsyncClient, mocker):
+    hit = mocker.patch.object(RateLimiter, "hit")
+    mocker.patch.object(UserRepository, "get_user_by_email", return_value=None)
+
+    response = await client.post(
+        "/login", json={"email": "Test@Example.com", "password": "password"}
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    login_email_call = next(
+        call for call in hit.call_args_list if call.kwargs["scope"] == "login:email"
+    )
+    assert login_email_call.kwargs["key"] == "test@example.com"
+
+
+# 요청 수 제한 규칙 형식이 잘못되면 설정을 불러올 때 거부한다.
+@pytest.mark.parametrize("rule", ["10", "abc/60", "0/60", "10/0", "-1/60"])
+def test_rate_limit_config_rejects_malformed_rule(rule: str):
+    with pytest.raises(ValidationError):
+        RateLimitConfig(RATE_LIMIT_SEARCH=rule)
+
+
+def test_rate_limit_config_accepts_valid_rule():
+    rate_limit = RateLimitConfig(RATE_LIMIT_SEARCH=" 10/1 ", RATE_LIMIT_LOGIN_IP="")
+
+    assert rate_limit.search == "10/1"
+    assert rate_limit.login_ip == ""
+
+
 # 'POST /logout' API가 성공적으로 로그아웃한다.
 @pytest.mark.asyncio
 async def test_logout_user_successfully(client: AsyncClient, mocker):
@@ -215,12 +327,14 @@ async def test_logout_user_successfully(client: AsyncClient, mocker):
     mocker.patch.object(
         SessionService, "get_session", return_value=mock_login_user_data
     )
-    mocker.patch.object(SessionService, "delete_session")
+    delete_session = mocker.patch.object(SessionService, "delete_session")
 
     response = await client.post("/logout", cookies={"session_id": mock_session_id})
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == {"message": "Logout successful"}
+    # 사용자별 세션 목록에서도 제거되도록 user_id를 함께 전달한다.
+    delete_session.assert_called_once_with(session_id=mock_session_id, user_id=1)
 
 
 # 'POST /logout' API가 유효하지 않은 세션 ID의 경우 404를 반환한다.